@@ -1,28 +1,20 @@
 from __future__ import annotations
 import json
-from typing import Any, Dict, List, Tuple
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
 
 from HireMe.models import Submission
 from HireMe.agents.developer_prompts import (
     RESUME_SKILL_EXTRACT_PROMPT,
     SUBMISSION_EVAL_PROMPT,
 )
-from HireMe.utils import generate_response_with_groq
-
-def ai_analyze_resume(resume_text: str, profile: Dict[str, Any]) -> Tuple[int, List[Dict[str, Any]]]:
-    prompt = RESUME_SKILL_EXTRACT_PROMPT.replace("<resume_text>", resume_text).replace("<profile_json>", json.dumps(profile))
-    messages = [
-        {"role": "system", "content": prompt},
-        {"role": "user", "content": "Follow the system prompt and return the dev_score and skills in JSON format."},
-    ]
-
-    data = generate_response_with_groq(messages, response_format="json")[0]
-    print("data", data)
-    dev_score = int(data.get("dev_score", 0))
-    skills = data.get("skills", [])
+from HireMe.agents.skill_extractor import extract_skill_candidates, local_resume_analysis, shortlist
+from HireMe.utils import generate_response_with_groq, generate_response_with_groq_async
 
+def _clean_skills(skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # Minimal post-validate: clamp & coerce
-    dev_score = max(0, min(dev_score, 1000))
     cleaned_skills: List[Dict[str, Any]] = []
     for s in skills:
         try:
@@ -51,13 +43,79 @@ def ai_analyze_resume(resume_text: str, profile: Dict[str, Any]) -> Tuple[int, L
             })
         except Exception:
             continue
+    return cleaned_skills
+
+
+def _local_analysis(resume_text: str, reason: str) -> Dict[str, Any]:
+    logging.warning(f"[ai_analyze_resume] Using local skill extraction ({reason})")
+    data = local_resume_analysis(resume_text)
+    return {
+        "dev_score": max(0, min(int(data["dev_score"]), 1000)),
+        "skills": _clean_skills(data["skills"]),
+        "source": "local",
+    }
+
+
+def _resume_messages(resume_text: str, profile: Dict[str, Any]) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+    """(messages, None) when the LLM should be asked, or (None, local analysis) when not."""
+    if settings.RESUME_ANALYSIS_MODE == "local":
+        return None, _local_analysis(resume_text, "RESUME_ANALYSIS_MODE=local")
+
+    candidates = shortlist(extract_skill_candidates(resume_text))
+    prompt = (
+        RESUME_SKILL_EXTRACT_PROMPT.replace("<resume_text>", resume_text)
+        .replace("<profile_json>", json.dumps(profile))
+        .replace("<skill_candidates>", json.dumps(candidates))
+    )
+    if len(prompt) // 4 > settings.RESUME_LLM_MAX_PROMPT_TOKENS:
+        return None, _local_analysis(resume_text, "prompt over token budget")
+
+    messages = [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": "Follow the system prompt and return the dev_score and skills in JSON format."},
+    ]
+    return messages, None
+
+
+def _resume_result(data: Any, resume_text: str) -> Dict[str, Any]:
+    logging.debug(f"[ai_analyze_resume] LLM response: {data}")
+    if not isinstance(data, dict):
+        return _local_analysis(resume_text, "LLM unavailable")
+
+    dev_score = int(data.get("dev_score", 0))
+    dev_score = max(0, min(dev_score, 1000))
 
     return {
         "dev_score": dev_score,
-        "skills": cleaned_skills,
+        "skills": _clean_skills(data.get("skills", [])),
+        "source": "llm",
     }
 
-def ai_evaluate_submission(submission: Submission) -> Dict[str, Any]:
+
+def ai_analyze_resume(resume_text: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score a resume and pick skills/challenges with the LLM, seeded with a local keyword
+    shortlist. Falls back to the local extractor when RESUME_ANALYSIS_MODE is "local",
+    the prompt is over RESUME_LLM_MAX_PROMPT_TOKENS, or the LLM call fails.
+    `source` in the result tells which path produced it.
+    """
+    messages, local = _resume_messages(resume_text, profile)
+    if local is not None:
+        return local
+    data = generate_response_with_groq(messages, response_format="json", flow="resume")[0]
+    return _resume_result(data, resume_text)
+
+
+async def ai_analyze_resume_async(resume_text: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """ai_analyze_resume for async views."""
+    messages, local = _resume_messages(resume_text, profile)
+    if local is not None:
+        return local
+    data = (await generate_response_with_groq_async(messages, response_format="json", flow="resume"))[0]
+    return _resume_result(data, resume_text)
+
+
+def _submission_messages(submission: Submission) -> List[Dict[str, Any]]:
     challenge = submission.challenge
     payload = {
         "challenge": {
@@ -76,13 +134,16 @@ def ai_evaluate_submission(submission: Submission) -> Dict[str, Any]:
     }
 
     prompt = SUBMISSION_EVAL_PROMPT.replace("<submission_json>", json.dumps(payload))
-    print("prompt", prompt)
-    messages = [
+    logging.debug(f"[ai_evaluate_submission] Prompt: {prompt}")
+    return [
         {"role": "system", "content": prompt},
         {"role": "user", "content": "Follow the system prompt and return the score, accuracy_rate, bugs_found, bugs_missed, false_positives, ai_feedback, and evaluation_details in JSON format."},
     ]
-    data = generate_response_with_groq(messages, response_format="json")[0]
-    print("data", data)
+
+
+def _evaluation_result(data: Any, submission: Submission) -> Dict[str, Any]:
+    logging.debug(f"[ai_evaluate_submission] LLM response: {data}")
+    challenge = submission.challenge
 
     # Minimal validation with safe defaults
     out = {
@@ -94,4 +155,16 @@ def ai_evaluate_submission(submission: Submission) -> Dict[str, Any]:
         "ai_feedback": str(data.get("ai_feedback", ""))[:4000],
         "evaluation_details": data.get("evaluation_details", {}),
     }
-    return out
\ No newline at end of file
+    return out
+
+
+def ai_evaluate_submission(submission: Submission) -> Dict[str, Any]:
+    data = generate_response_with_groq(_submission_messages(submission), response_format="json", flow="submission")[0]
+    return _evaluation_result(data, submission)
+
+
+async def ai_evaluate_submission_async(submission: Submission) -> Dict[str, Any]:
+    """ai_evaluate_submission for async views; `submission.challenge` must already be loaded."""
+    messages = _submission_messages(submission)
+    data = (await generate_response_with_groq_async(messages, response_format="json", flow="submission"))[0]
+    return _evaluation_result(data, submission)
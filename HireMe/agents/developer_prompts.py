@@ -12,6 +12,7 @@ RESUME_SKILL_EXTRACT_PROMPT = """
 You will receive:
 1) resume_text: plain text extracted from a PDF resume
 2) profile_json: a short JSON with profile fields (name, email, bio, location, experience_level, availability, portfolio_links)
+3) skill_candidates: skills a keyword scan found in resume_text, with evidence counts. Use it as a shortlist to check against the resume, not as proof.
 
 Your tasks:
 A) Identify 2–6 KEY technical skills that are well evidenced in the resume (projects, impacts, years, repos, certifications).
@@ -57,6 +58,9 @@ resume_text:
 profile_json:
 <profile_json>
 
+skill_candidates:
+<skill_candidates>
+
 <OUTPUT>
 Output ONLY the following JSON object:
 {
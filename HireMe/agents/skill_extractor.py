@@ -0,0 +1,171 @@
+# HireMe/agents/skill_extractor.py
+"""
+Deterministic, dictionary-based skill spotting for resumes.
+
+The text is tokenized once and every token (and every 2..N-gram starting at a
+phrase head) is looked up in a hash table of aliases. That is a multi-pattern scan
+at word granularity, equivalent to Aho-Corasick over tokens, in a single pass.
+"""
+import math
+from collections import Counter
+from itertools import compress, repeat
+from typing import Any, Dict, List, Tuple
+
+# canonical name -> aliases (matched case-insensitively on token boundaries)
+SKILL_ALIASES: Dict[str, List[str]] = {
+    "Python": ["python", "python3"],
+    "Java": ["java"],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6"],
+    "TypeScript": ["typescript", "ts"],
+    "C": ["c language", "c programming", "ansi c", "embedded c", "c99"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp"],
+    "Go": ["golang", "go language", "go programming"],
+    "R": ["r language", "r programming", "rstudio", "tidyverse"],
+    "Rust": ["rust"],
+    "Ruby": ["ruby"],
+    "PHP": ["php"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swift"],
+    "Scala": ["scala"],
+    "SQL": ["sql", "t-sql", "pl/sql", "plsql"],
+    "PostgreSQL": ["postgresql", "postgres", "psql"],
+    "MySQL": ["mysql"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elasticsearch", "opensearch"],
+    "Kafka": ["kafka"],
+    "RabbitMQ": ["rabbitmq"],
+    "React": ["react", "react.js", "reactjs"],
+    "React Native": ["react native"],
+    "Angular": ["angular", "angularjs"],
+    "Vue": ["vue", "vue.js", "vuejs"],
+    "Next.js": ["next.js", "nextjs"],
+    "Node.js": ["node.js", "nodejs", "node"],
+    "Express": ["express", "express.js"],
+    "Django": ["django", "django rest framework", "drf"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi"],
+    "Spring Boot": ["spring boot", "spring"],
+    ".NET": [".net", "dotnet", "asp.net"],
+    "Ruby on Rails": ["rails", "ruby on rails"],
+    "GraphQL": ["graphql"],
+    "REST APIs": ["rest api", "rest apis", "restful"],
+    "Docker": ["docker", "dockerfile"],
+    "Kubernetes": ["kubernetes", "k8s", "helm"],
+    "Terraform": ["terraform"],
+    "Ansible": ["ansible"],
+    "AWS": ["aws", "amazon web services", "ec2", "s3", "lambda"],
+    "GCP": ["gcp", "google cloud", "google cloud platform", "bigquery"],
+    "Azure": ["azure"],
+    "Linux": ["linux", "unix", "bash"],
+    "Git": ["git", "github", "gitlab"],
+    "CI/CD": ["ci/cd", "jenkins", "github actions", "gitlab ci", "circleci"],
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "PyTorch": ["pytorch", "torch"],
+    "TensorFlow": ["tensorflow", "keras"],
+    "scikit-learn": ["scikit-learn", "sklearn"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "NLP": ["nlp", "natural language processing"],
+    "LLMs": ["llm", "llms", "langchain", "large language models"],
+    "Computer Vision": ["computer vision", "opencv"],
+    "Spark": ["spark", "pyspark"],
+    "Airflow": ["airflow"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3", "sass", "scss", "tailwind"],
+    "Microservices": ["microservices", "microservice"],
+    "System Design": ["system design", "distributed systems"],
+}
+
+# Names that are also ordinary words or grades ("Grade C", "R&D", "Go-to-market"): never
+# matched on their own, only through the aliases above, which carry some context.
+CONTEXT_ONLY = frozenset({"C", "R", "Go"})
+
+# Aliases that name more than one skill.
+SHARED_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "c/c++": ("C", "C++"),
+}
+
+# Punctuation that separates skills ("Python/Django, React (Hooks)") becomes whitespace.
+_SEPARATORS = str.maketrans({c: " " for c in ",;:()[]{}<>\"'!?|/&*\u2022\u00b7"})
+
+
+def _normalize(alias: str) -> List[str]:
+    return alias.translate(_SEPARATORS).lower().split()
+
+
+def _build_index() -> Tuple[Dict[str, str], Dict[Tuple[str, ...], Tuple[str, ...]], int]:
+    """Single-token aliases go in a hash table; multi-token ones are keyed by token tuple."""
+    words: Dict[str, str] = {}
+    phrases: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    for canonical, aliases in SKILL_ALIASES.items():
+        names = aliases if canonical in CONTEXT_ONLY else [canonical] + aliases
+        for alias in names:
+            tokens = _normalize(alias)
+            if len(tokens) == 1:
+                words.setdefault(tokens[0], canonical)
+            else:
+                phrases.setdefault(tuple(tokens), (canonical,))
+    for alias, canonicals in SHARED_ALIASES.items():
+        phrases.setdefault(tuple(_normalize(alias)), canonicals)
+    longest = max((len(p) for p in phrases), default=1)
+    return words, phrases, longest
+
+
+_WORD_INDEX, _PHRASE_INDEX, _MAX_PHRASE = _build_index()
+_PHRASE_HEADS = frozenset(p[0] for p in _PHRASE_INDEX)
+
+
+def extract_skill_candidates(text: str) -> List[Dict[str, Any]]:
+    """
+    Scan resume text and return dictionary skills with evidence counts.
+
+    Tokenizing (translate/split) and the unigram lookups are C-level passes over the
+    text; Python only loops over tokens that can start a multi-word alias. That keeps
+    this at thousands of resumes per second per core.
+
+    Returns:
+        list: [{"name": canonical_name, "evidence": occurrences}], most evidenced first.
+    """
+    lowered = list(map(str.rstrip, (text or "").translate(_SEPARATORS).lower().split(), repeat(".-")))
+    counts: Counter = Counter(map(_WORD_INDEX.get, lowered))
+
+    # Multi-word aliases, longest first; their words were counted as unigrams above,
+    # so take those back out.
+    consumed = set()
+    for i in compress(range(len(lowered)), map(_PHRASE_HEADS.__contains__, lowered)):
+        if i in consumed:
+            continue
+        for size in range(min(_MAX_PHRASE, len(lowered) - i), 1, -1):
+            canonicals = _PHRASE_INDEX.get(tuple(lowered[i:i + size]))
+            if canonicals:
+                counts.update(canonicals)
+                for j in range(i, i + size):
+                    consumed.add(j)
+                    counts[_WORD_INDEX.get(lowered[j])] -= 1
+                break
+
+    counts.pop(None, None)
+    return [{"name": name, "evidence": count} for name, count in counts.most_common() if count > 0]
+
+
+def shortlist(candidates: List[Dict[str, Any]], limit: int = 12) -> List[Dict[str, Any]]:
+    """Top candidates to seed the LLM prompt with."""
+    return candidates[:limit]
+
+
+def local_resume_analysis(text: str, max_skills: int = 6) -> Dict[str, Any]:
+    """
+    LLM-free fallback with the same shape as ai_analyze_resume's raw output: levels and
+    dev_score are derived from evidence counts and kept deliberately conservative.
+    """
+    candidates = extract_skill_candidates(text)
+    skills = []
+    for c in candidates[:max_skills]:
+        level = min(80, 30 + int(12 * math.log2(1 + c["evidence"])))
+        skills.append({"name": c["name"], "level": level, "validated": False})
+    total_evidence = sum(c["evidence"] for c in candidates)
+    dev_score = min(600, 50 * len(candidates) + 10 * total_evidence) if candidates else 0
+    return {"dev_score": dev_score, "skills": skills}
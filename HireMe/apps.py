@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class HiremeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'HireMe'
+
+    def ready(self):
+        from HireMe import signals  # noqa: F401
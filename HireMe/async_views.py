@@ -0,0 +1,126 @@
+"""
+Async versions of the LLM-heavy developer endpoints.
+
+DRF views are synchronous, so these are plain Django async views with the same
+input and response envelope as DeveloperViewSet.create_developer / submit_challenge.
+Under an ASGI server (TalentAI.asgi) the LLM call is awaited instead of holding a
+worker thread, so one process serves many slow evaluations at once. Single-statement
+ORM access uses the async queryset methods; serializer validation/saves and
+multi-statement transactions run in Django's DB thread via sync_to_async.
+Benchmark: `manage.py bench_async_concurrency`.
+"""
+import json
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import JsonResponse
+from django.utils.timezone import now
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+
+from HireMe.agents.developer_agent import ai_evaluate_submission_async
+from HireMe.ingestion import (
+    ResumeExtractionError, analyze_resume_async, build_ai_profile, extract_resume, persist_resume_analysis,
+)
+from HireMe.models import Challenge, Developer, Submission
+from HireMe.scoring import apply_submission_score
+from HireMe.serializers import DeveloperSerializer, SubmissionSerializer
+from HireMe.utils import create_json_response
+
+
+def _create_developer(data) -> Developer:
+    # Validation checks email uniqueness and save() writes nested skills: several statements.
+    dev_ser = DeveloperSerializer(data=data)
+    dev_ser.is_valid(raise_exception=True)
+    return dev_ser.save()
+
+
+def _persist_developer(developer: Developer, extracted, analysis):
+    with transaction.atomic():
+        persist_resume_analysis(developer, extracted, analysis)
+    return DeveloperSerializer(developer).data
+
+
+@csrf_exempt
+@require_POST
+async def create_developer(request):
+    """Multipart form like DeveloperViewSet.create_developer (profile fields + `resume`)."""
+    developer, created = None, False
+    try:
+        data = request.POST.copy()
+        resume_file = request.FILES.get("resume")
+        if not resume_file:
+            return create_json_response(False, "Resume is required", status_code=status.HTTP_400_BAD_REQUEST)
+        if not data.get("email"):
+            return create_json_response(False, "Email is required", status_code=status.HTTP_400_BAD_REQUEST)
+
+        # PDF parsing is CPU work; keep it off the event loop. It also reads the fingerprint
+        # cache, so it runs in the request's DB thread (one per request under ASGI), whose
+        # connection Django closes when the request finishes.
+        extracted = await sync_to_async(extract_resume)(resume_file)
+        developer = await Developer.objects.filter(email=data["email"]).afirst()
+        if developer is None:
+            developer = await sync_to_async(_create_developer)(data)
+            created = True
+
+        # No transaction is open while the LLM runs.
+        analysis = await analyze_resume_async(extracted, build_ai_profile(developer))
+        body = await sync_to_async(_persist_developer)(developer, extracted, analysis)
+        return create_json_response(True, "Developer created", body, status_code=status.HTTP_201_CREATED)
+
+    except ResumeExtractionError as e:
+        return create_json_response(False, str(e), status_code=status.HTTP_400_BAD_REQUEST)
+    except ValidationError as e:
+        return create_json_response(False, "Invalid developer data", e.detail, status_code=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        # The sync view rolls back a developer it created; here that write already committed.
+        if created:
+            await developer.adelete()
+        return create_json_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@csrf_exempt
+@require_POST
+async def submit_challenge(request):
+    """JSON body like DeveloperViewSet.submit_challenge."""
+    submission = None
+    try:
+        payload = json.loads(request.body or b"{}")
+        developer = await Developer.objects.filter(id=payload.get("developer")).afirst()
+        challenge = await Challenge.objects.filter(id=payload.get("challenge")).afirst()
+        if not developer or not challenge:
+            return JsonResponse({"error": "Invalid developer or challenge id."}, status=status.HTTP_404_NOT_FOUND)
+
+        submission = await Submission.objects.acreate(
+            developer=developer,
+            challenge=challenge,
+            bug_analysis=payload.get("bug_analysis", ""),
+            answer=payload.get("answer", ""),
+            status="evaluating",
+            created_at=now(),
+        )
+
+        scoring = await ai_evaluate_submission_async(submission)
+
+        submission.score = scoring.get("score")
+        submission.accuracy_rate = scoring.get("accuracy_rate")
+        submission.bugs_found = scoring.get("bugs_found")
+        submission.bugs_missed = scoring.get("bugs_missed")
+        submission.false_positives = scoring.get("false_positives")
+        submission.ai_feedback = scoring.get("ai_feedback", "")
+        submission.evaluation_details = scoring.get("evaluation_details", {})
+        submission.status = "completed"
+        await submission.asave()
+    except Exception as e:
+        # A submission that wasn't evaluated isn't kept (as in the sync view).
+        if submission is not None and submission.pk:
+            await submission.adelete()
+        return create_json_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    try:
+        await sync_to_async(apply_submission_score)(submission)
+        return create_json_response(True, "Submission evaluated", SubmissionSerializer(submission).data, status_code=status.HTTP_201_CREATED)
+    except Exception as e:
+        return create_json_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,273 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db.models.functions import Lower
+from django.utils.timezone import now
+
+from HireMe.models import Challenge, Developer, ResumeDocument, Skill
+from HireMe.response_cache import CATALOG, invalidate
+from HireMe.resume_store import compress_text, content_hash, copy_resume
+from HireMe.scoring import record_resume_scores
+from HireMe.search import schedule_reindex
+from HireMe.serializers import DeveloperSerializer
+
+SkillKey = Tuple[str, Optional[int]]
+
+
+def _challenge_fields(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "description": (payload.get("description") or "")[:4000],
+        "difficulty": payload.get("difficulty", "intermediate"),
+        "time_limit": int(payload.get("time_limit", 60)),
+        "challenge_type": payload.get("challenge_type", "coding"),
+        "challenge_question": (payload.get("challenge_question") or "")[:4000],
+        "max_score": int(payload.get("max_score", 100)),
+    }
+
+
+def upsert_challenges(payloads: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Get-or-create challenges by title in one INSERT ... ON CONFLICT (title) statement.
+    The conflict clause only rewrites the title with itself, so existing challenges
+    are left untouched (like Challenge.objects.get_or_create) but their ids still
+    come back from the insert.
+
+    Returns:
+        dict: {title: challenge_id}
+    """
+    by_title: Dict[str, Dict[str, Any]] = {}
+    for p in payloads:
+        title = (p.get("title") or "").strip()
+        by_title.setdefault(title, p)
+    if not by_title:
+        return {}
+
+    challenges = Challenge.objects.bulk_create(
+        [Challenge(title=t, **_challenge_fields(p)) for t, p in by_title.items()],
+        update_conflicts=True,
+        unique_fields=["title"],
+        update_fields=["title"],
+    )
+    ids = {c.title: c.pk for c in challenges if c.pk is not None}
+    if len(ids) < len(by_title):
+        # Backends that can't return ids from an upsert.
+        ids = dict(Challenge.objects.filter(title__in=by_title.keys()).values_list("title", "id"))
+    return ids
+
+
+def unattached_skills_by_name(lowered_names: Iterable[str]):
+    """Skills without a challenge whose lower-cased name is in `lowered_names` (uses skill_name_lower_idx)."""
+    return Skill.objects.alias(name_lower=Lower("name")).filter(
+        name_lower__in=list(lowered_names), challenge__isnull=True
+    )
+
+
+def _upsert_unattached_skills(wanted: Dict[SkillKey, Dict[str, Any]]) -> Dict[SkillKey, int]:
+    """
+    Skills without a challenge. NULLs never conflict in the (name, challenge) unique
+    key, so these are matched with a select, a bulk_update and a bulk_create. Names
+    match case-insensitively: "python" reuses an existing "Python" row, and names that
+    differ only in case share one new row.
+    """
+    names_by_lower: Dict[str, List[str]] = {}
+    for name, _ in wanted:
+        names_by_lower.setdefault(name.lower(), []).append(name)
+
+    # The oldest row wins among case variants; sorting here rather than in SQL keeps
+    # the planner on skill_name_lower_idx.
+    found: Dict[str, Skill] = {}
+    for skill in sorted(unattached_skills_by_name(names_by_lower), key=lambda s: s.id):
+        found.setdefault(skill.name.lower(), skill)
+
+    ids: Dict[SkillKey, int] = {}
+    to_update, missing = [], []
+    for lower, names in names_by_lower.items():
+        r = wanted[(names[-1], None)]
+        skill = found.get(lower)
+        if skill is None:
+            missing.append(Skill(name=names[0], level=int(r.get("level", 50)), validated=False))
+            continue
+        for name in names:
+            ids[(name, None)] = skill.id
+        level = int(r.get("level", skill.level))
+        validated = bool(r.get("validated", skill.validated))
+        if level != skill.level or validated != skill.validated:
+            skill.level, skill.validated = level, validated
+            to_update.append(skill)
+    if to_update:
+        Skill.objects.bulk_update(to_update, ["level", "validated"])
+
+    if missing:
+        Skill.objects.bulk_create(missing)
+        if any(s.pk is None for s in missing):
+            missing = sorted(unattached_skills_by_name(s.name.lower() for s in missing), key=lambda s: s.id)
+        for skill in missing:
+            for name in names_by_lower.get(skill.name.lower(), ()):
+                ids.setdefault((name, None), skill.pk)
+    return ids
+
+
+def upsert_skills(rows: Iterable[Dict[str, Any]]) -> Dict[SkillKey, int]:
+    """
+    Get-or-create skills keyed by (name, challenge_id), updating level/validated on
+    existing rows. rows: {"name", "level", "validated", "challenge_id"}.
+
+    Skills tied to a challenge are written with a single INSERT ... ON CONFLICT
+    (name, challenge_id) DO UPDATE; the rest go through _upsert_unattached_skills.
+
+    Returns:
+        dict: {(name, challenge_id): skill_id}
+    """
+    wanted: Dict[SkillKey, Dict[str, Any]] = {}
+    for r in rows:
+        wanted[((r.get("name") or "").strip(), r.get("challenge_id"))] = r
+    if not wanted:
+        return {}
+    # Skill rows are shared between developers, so a level change shows up in many payloads.
+    invalidate(CATALOG)
+
+    attached = {key: r for key, r in wanted.items() if key[1] is not None}
+    ids: Dict[SkillKey, int] = {}
+    if attached:
+        skills = Skill.objects.bulk_create(
+            [
+                Skill(
+                    name=name,
+                    challenge_id=cid,
+                    level=int(r.get("level", 50)),
+                    validated=bool(r.get("validated", False)),
+                )
+                for (name, cid), r in attached.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["name", "challenge"],
+            update_fields=["level", "validated"],
+        )
+        ids.update({(s.name, s.challenge_id): s.pk for s in skills if s.pk is not None})
+        if len(ids) < len(attached):
+            for skill in Skill.objects.filter(
+                name__in={name for name, _ in attached}, challenge_id__in={cid for _, cid in attached}
+            ):
+                ids.setdefault((skill.name, skill.challenge_id), skill.id)
+
+    unattached = {key: r for key, r in wanted.items() if key[1] is None}
+    if unattached:
+        ids.update(_upsert_unattached_skills(unattached))
+    return ids
+
+
+def link_developer_skills(pairs: Iterable[Tuple[int, int]]) -> None:
+    """Insert (developer_id, skill_id) M2M rows in one statement, skipping existing links."""
+    Through = Developer.skills.through
+    links = [Through(developer_id=d, skill_id=s) for d, s in set(pairs)]
+    if links:
+        Through.objects.bulk_create(links, ignore_conflicts=True)
+        # bulk_create skips m2m_changed, so queue the search index update here.
+        dev_ids = {link.developer_id for link in links}
+        for dev_id in dev_ids:
+            schedule_reindex(dev_id)
+        invalidate(*(("developer", dev_id) for dev_id in dev_ids))
+
+
+def persist_skill_payloads(skills_by_developer: Dict[int, List[Dict[str, Any]]]) -> int:
+    """
+    Persist analysed skills (with their challenges) for many developers using a
+    constant number of queries. Returns the number of developer-skill links written.
+    """
+    challenge_payloads = [
+        s["challenge"] for skills in skills_by_developer.values() for s in skills if s.get("challenge")
+    ]
+    challenge_ids = upsert_challenges(challenge_payloads)
+
+    rows = []
+    for skills in skills_by_developer.values():
+        for s in skills:
+            payload = s.get("challenge")
+            rows.append({
+                **s,
+                "challenge_id": challenge_ids.get((payload.get("title") or "").strip()) if payload else None,
+            })
+    skill_ids = upsert_skills(rows)
+
+    pairs = []
+    for dev_id, skills in skills_by_developer.items():
+        for s in skills:
+            payload = s.get("challenge")
+            cid = challenge_ids.get((payload.get("title") or "").strip()) if payload else None
+            skill_id = skill_ids.get(((s.get("name") or "").strip(), cid))
+            if skill_id:
+                pairs.append((dev_id, skill_id))
+    link_developer_skills(pairs)
+    return len(pairs)
+
+
+def bulk_persist_resume_results(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Persist many analysed resumes at once.
+
+    Args:
+        records (list): {"profile": dict, "extracted": dict, "analysis": dict} per resume,
+            shaped like the HireMe.ingestion stage outputs.
+
+    Returns:
+        dict: counts of created/updated developers and skill links; invalid profiles
+        are reported under "invalid". "emails" lists the developers actually written.
+    """
+    by_email: Dict[str, Dict[str, Any]] = {}
+    for r in records:
+        by_email[r["profile"]["email"]] = r
+
+    existing = {d.email: d for d in Developer.objects.filter(email__in=by_email.keys())}
+    new_devs, invalid = [], 0
+    for email, r in by_email.items():
+        if email in existing:
+            continue
+        ser = DeveloperSerializer(data=r["profile"])
+        if not ser.is_valid():
+            invalid += 1
+            continue
+        fields = {k: v for k, v in ser.validated_data.items() if k != "skills"}
+        new_devs.append(Developer(**fields))
+    if new_devs:
+        Developer.objects.bulk_create(new_devs, ignore_conflicts=True)
+
+    developers = {d.email: d for d in Developer.objects.filter(email__in=by_email.keys())}
+    for email, dev in developers.items():
+        analysis = by_email[email]["analysis"]
+        dev.dev_score = int(analysis.get("dev_score", 0) or 0)
+        dev.validation_status = "partially_validated" if analysis.get("skills") else "not_validated"
+    Developer.objects.bulk_update(list(developers.values()), ["dev_score", "validation_status"])
+    record_resume_scores({dev.id: dev.dev_score for dev in developers.values()})
+
+    docs = []
+    for email, dev in developers.items():
+        extracted = by_email[email]["extracted"]
+        text = extracted.get("resume_text") or ""
+        if text:
+            codec, blob = compress_text(text)
+            docs.append(ResumeDocument(
+                developer=dev, codec=codec, content=blob, content_hash=content_hash(text),
+                original_size=len(text.encode("utf-8")), updated_at=now(),
+            ))
+        elif (extracted.get("cached") or {}).get("resume_hash"):
+            copy_resume(dev, extracted["cached"]["resume_hash"])
+    if docs:
+        ResumeDocument.objects.bulk_create(
+            docs,
+            update_conflicts=True,
+            unique_fields=["developer"],
+            update_fields=["codec", "content", "content_hash", "original_size", "updated_at"],
+        )
+
+    for dev in developers.values():
+        schedule_reindex(dev.id)
+
+    links = persist_skill_payloads({
+        dev.id: by_email[email]["analysis"].get("skills", []) for email, dev in developers.items()
+    })
+    return {
+        "created": len(developers) - len(existing),
+        "updated": len(existing),
+        "invalid": invalid,
+        "skill_links": links,
+        "emails": list(developers),
+    }
@@ -0,0 +1,248 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from HireMe.agents.developer_agent import ai_analyze_resume, ai_analyze_resume_async
+from HireMe.bulk_persistence import persist_skill_payloads
+from HireMe.models import Developer, ResumeIngestionJob
+from HireMe.resume_cache import lookup_by_pdf, lookup_by_text, pdf_fingerprint, store_analysis, text_fingerprint
+from HireMe.resume_store import content_hash, copy_resume, store_resume
+from HireMe.scoring import record_resume_scores
+from HireMe.serializers import DeveloperSerializer
+from HireMe.utils import read_pdf_text
+from TalentAI.tracing import span, start_trace, traced
+
+STAGES = ("extraction", "analysis", "persistence")
+
+PROFILE_FIELDS = ("full_name", "email", "bio", "location", "experience_level", "availability", "portfolio_links")
+
+
+class ResumeExtractionError(Exception):
+    """The uploaded resume could not be read as a PDF."""
+
+
+# ============ Stages (shared by create_developer and the background pipeline) ============
+
+def build_ai_profile(source) -> Dict[str, Any]:
+    """Profile dict sent to ai_analyze_resume, from a Developer or a dict of form data."""
+    if isinstance(source, Developer):
+        profile = {f: getattr(source, f) for f in PROFILE_FIELDS}
+    else:
+        profile = {f: source.get(f, "") for f in PROFILE_FIELDS}
+    profile["portfolio_links"] = profile.get("portfolio_links") or []
+    return profile
+
+
+def extract_resume(attachment) -> Dict[str, Any]:
+    """
+    Fingerprint the upload and extract its text, unless a cached analysis matches.
+
+    Returns:
+        dict: pdf_hash, text_hash, resume_text and `cached` (dev_score/skills/resume_hash
+        of a matching ResumeAnalysis, or None). JSON-serializable so it can be kept on a job.
+
+    Raises:
+        ResumeExtractionError: the upload is not a readable PDF.
+    """
+    pdf_hash = pdf_fingerprint(attachment)
+    cached = lookup_by_pdf(pdf_hash)
+    resume_text = ""
+    text_hash = ""
+    if cached is None:
+        try:
+            resume_text = read_pdf_text(attachment)
+        except Exception as e:
+            raise ResumeExtractionError(f"Could not read the resume PDF: {e}") from e
+        text_hash = text_fingerprint(resume_text)
+        if resume_text:
+            cached = lookup_by_text(pdf_hash, text_hash)
+    return {
+        "pdf_hash": pdf_hash,
+        "text_hash": text_hash,
+        "resume_text": resume_text,
+        "cached": None if cached is None else {
+            "dev_score": cached.dev_score,
+            "skills": cached.skills,
+            "resume_hash": cached.resume_hash,
+        },
+    }
+
+
+def _analysis_without_llm(extracted: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    cached = extracted.get("cached")
+    if cached is not None:
+        return {"dev_score": cached["dev_score"], "skills": cached["skills"]}
+    if not extracted.get("resume_text"):
+        return {"dev_score": 0, "skills": []}
+    return None
+
+
+def analyze_resume(extracted: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Cached analysis when the fingerprint matched, otherwise the LLM (result is cached)."""
+    known = _analysis_without_llm(extracted)
+    if known is not None:
+        return known
+
+    resume_text = extracted["resume_text"]
+    result = ai_analyze_resume(resume_text, profile)
+    store_analysis(extracted["pdf_hash"], extracted["text_hash"], content_hash(resume_text), result)
+    return result
+
+
+async def analyze_resume_async(extracted: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """analyze_resume for async views: the LLM call is awaited, the cache write runs in the DB thread."""
+    known = _analysis_without_llm(extracted)
+    if known is not None:
+        return known
+
+    resume_text = extracted["resume_text"]
+    result = await ai_analyze_resume_async(resume_text, profile)
+    await sync_to_async(store_analysis)(extracted["pdf_hash"], extracted["text_hash"], content_hash(resume_text), result)
+    return result
+
+
+def apply_skills(developer: Developer, skills_data: List[Dict[str, Any]]) -> None:
+    """Upsert the analysed skills and their challenges and link them to the developer, in a constant number of queries."""
+    persist_skill_payloads({developer.id: skills_data})
+
+
+@traced("db.persist_resume_analysis")
+def persist_resume_analysis(developer: Developer, extracted: Dict[str, Any], analysis: Dict[str, Any]) -> Developer:
+    """Store the resume text, dev_score, validation status and skills for a developer."""
+    resume_text = extracted.get("resume_text") or ""
+    cached = extracted.get("cached")
+    if resume_text:
+        store_resume(developer, resume_text)
+    elif cached and cached.get("resume_hash"):
+        copy_resume(developer, cached["resume_hash"])
+
+    dev_score = analysis.get("dev_score", 0)
+    skills_data = analysis.get("skills", [])
+    logging.info(f"[ingestion] Developer {developer.id}: dev_score={dev_score}, {len(skills_data)} skills")
+    developer.dev_score = int(dev_score or 0)
+    developer.validation_status = "partially_validated" if skills_data else "not_validated"
+    developer.save(update_fields=["dev_score", "validation_status"])
+    record_resume_scores({developer.id: developer.dev_score})
+
+    apply_skills(developer, skills_data)
+    return developer
+
+
+# ============ Background pipeline ============
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.RESUME_INGESTION_WORKERS,
+                thread_name_prefix="resume-ingestion",
+            )
+    return _executor
+
+
+def enqueue_job(job: ResumeIngestionJob) -> None:
+    """Hand the job to the local worker threads once the creating transaction commits."""
+    job_id = job.id
+    transaction.on_commit(lambda: _get_executor().submit(_run_in_worker, job_id))
+
+
+def _run_in_worker(job_id: int) -> None:
+    close_old_connections()
+    try:
+        # Worker threads start outside any request, so each job is its own (sampled) trace.
+        with start_trace("ingestion.job", job=job_id):
+            run_job(job_id)
+    except Exception:
+        logging.exception(f"[ingestion] Job {job_id} crashed")
+    finally:
+        close_old_connections()
+
+
+def _save_stage(job: ResumeIngestionJob, stage: str, **fields) -> None:
+    job.stages.setdefault(stage, {}).update(fields)
+    job.save(update_fields=["stages", "status", "updated_at"])
+
+
+def _run_stage(job: ResumeIngestionJob, stage: str, job_status: str, fn: Callable[[], Any]) -> Any:
+    """Run one stage with its own retry budget, recording status/attempts/error/timing."""
+    job.status = job_status
+    max_attempts = settings.RESUME_INGESTION_STAGE_RETRIES
+    for attempt in range(1, max_attempts + 1):
+        started = time.monotonic()
+        _save_stage(job, stage, status="running", attempts=attempt)
+        try:
+            with span(f"ingestion.{stage}", attempt=attempt):
+                result = fn()
+        except Exception as e:
+            logging.warning(f"[ingestion] {stage} failed for job {job.job_id} (attempt {attempt}/{max_attempts}): {e}")
+            _save_stage(job, stage, status="retrying" if attempt < max_attempts else "failed", error=str(e))
+            if attempt == max_attempts:
+                raise
+            time.sleep(settings.RESUME_INGESTION_RETRY_DELAY * attempt)
+            continue
+        _save_stage(job, stage, status="completed", error="", seconds=round(time.monotonic() - started, 3))
+        return result
+
+
+def _extraction_stage(job: ResumeIngestionJob) -> Dict[str, Any]:
+    with job.upload.open("rb") as f:
+        return extract_resume(f)
+
+
+def _analysis_stage(job: ResumeIngestionJob) -> Dict[str, Any]:
+    developer = Developer.objects.filter(email=job.email).first()
+    return analyze_resume(job.extracted, build_ai_profile(developer or job.profile))
+
+
+def _persistence_stage(job: ResumeIngestionJob) -> Developer:
+    with transaction.atomic():
+        developer = Developer.objects.filter(email=job.email).first()
+        if developer is None:
+            dev_ser = DeveloperSerializer(data=job.profile)
+            dev_ser.is_valid(raise_exception=True)
+            developer = dev_ser.save()
+        return persist_resume_analysis(developer, job.extracted, job.analysis)
+
+
+def run_job(job_id: int) -> ResumeIngestionJob:
+    """
+    Run the remaining stages of a job. Completed stages are skipped, so a job can be
+    re-run after a crash (see `manage.py run_ingestion_jobs`).
+    """
+    job = ResumeIngestionJob.objects.get(id=job_id)
+    if job.status == "completed":
+        return job
+    try:
+        if job.extracted is None:
+            job.extracted = _run_stage(job, "extraction", "extracting", lambda: _extraction_stage(job))
+            job.save(update_fields=["extracted"])
+        if job.analysis is None:
+            job.analysis = _run_stage(job, "analysis", "analyzing", lambda: _analysis_stage(job))
+            job.save(update_fields=["analysis"])
+        developer = _run_stage(job, "persistence", "persisting", lambda: _persistence_stage(job))
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+        job.save(update_fields=["status", "error", "updated_at"])
+        return job
+
+    job.developer = developer
+    job.status = "completed"
+    job.error = ""
+    # The text now lives in ResumeDocument; drop the copies held for the stages.
+    job.extracted = {k: v for k, v in job.extracted.items() if k != "resume_text"}
+    if job.upload:
+        job.upload.delete(save=False)
+    job.save(update_fields=["developer", "status", "error", "extracted", "upload", "updated_at"])
+    return job
@@ -0,0 +1,348 @@
+"""
+Developer leaderboards by dev_score, overall and per skill.
+
+Each board is a Fenwick tree over score buckets (dev_score is 0-1000) plus a sorted
+list of developer ids per bucket, so rank lookups, "who is at rank k" and updates
+are O(log n). Ties are broken by developer id.
+
+Boards live in process memory. They are loaded from the latest LeaderboardSnapshot
+and kept current by replaying DevScoreEvent rows written since; every dev_score
+change goes through that log (HireMe.scoring), including ones made by other workers.
+Snapshots are written by `manage.py leaderboard_snapshot`, never by a request.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from HireMe.models import DevScoreEvent, Developer, LeaderboardSnapshot
+
+SCORE_MAX = 1000
+EVENT_LOOKBACK = 1000
+
+# (rank, developer_id, dev_score)
+Entry = Tuple[int, int, int]
+
+
+class Leaderboard:
+    """One ranking. Not thread-safe on its own; callers hold the module lock."""
+
+    def __init__(self):
+        self._tree = [0] * (SCORE_MAX + 2)  # 1-indexed Fenwick tree over bucket positions
+        self._buckets: Dict[int, List[int]] = {}
+        self._scores: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, developer_id: int) -> bool:
+        return developer_id in self._scores
+
+    def score(self, developer_id: int) -> Optional[int]:
+        return self._scores.get(developer_id)
+
+    @staticmethod
+    def _position(score: int) -> int:
+        # Highest score first; out-of-range scores share the end buckets.
+        return SCORE_MAX - max(0, min(SCORE_MAX, score))
+
+    def _add(self, position: int, delta: int) -> None:
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _count_before(self, position: int) -> int:
+        """Number of developers in buckets [0, position)."""
+        total, i = 0, position
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _find(self, rank: int) -> Tuple[int, int]:
+        """Bucket position holding `rank` (1-based) and how many ranks precede that bucket."""
+        position, before = 0, 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and before + self._tree[nxt] < rank:
+                position = nxt
+                before += self._tree[nxt]
+            step >>= 1
+        return position, before
+
+    def set(self, developer_id: int, score: int) -> None:
+        old = self._scores.get(developer_id)
+        if old is not None:
+            if old == score:
+                return
+            self.remove(developer_id)
+        self._scores[developer_id] = score
+        position = self._position(score)
+        insort(self._buckets.setdefault(position, []), developer_id)
+        self._add(position, 1)
+
+    def remove(self, developer_id: int) -> None:
+        score = self._scores.pop(developer_id, None)
+        if score is None:
+            return
+        position = self._position(score)
+        bucket = self._buckets[position]
+        del bucket[bisect_left(bucket, developer_id)]
+        self._add(position, -1)
+
+    def rank(self, developer_id: int) -> Optional[int]:
+        score = self._scores.get(developer_id)
+        if score is None:
+            return None
+        position = self._position(score)
+        return self._count_before(position) + bisect_left(self._buckets[position], developer_id) + 1
+
+    def entries(self, start_rank: int, count: int) -> List[Entry]:
+        """Up to `count` entries starting at `start_rank` (1-based)."""
+        start_rank = max(1, start_rank)
+        if count <= 0 or start_rank > len(self._scores):
+            return []
+        position, before = self._find(start_rank)
+        offset = start_rank - before - 1
+        out: List[Entry] = []
+        while position <= SCORE_MAX and len(out) < count:
+            for developer_id in self._buckets.get(position, [])[offset:offset + count - len(out)]:
+                out.append((start_rank + len(out), developer_id, self._scores[developer_id]))
+            position += 1
+            offset = 0
+        return out
+
+    def items(self) -> Iterable[Tuple[int, int]]:
+        return self._scores.items()
+
+
+class _State:
+    def __init__(self):
+        self.overall = Leaderboard()
+        self.by_skill: Dict[str, Leaderboard] = {}
+        self.skills_of: Dict[int, Set[str]] = {}
+        self.last_event_id = 0
+        self.snapshot_id = 0
+        self.synced_at = 0.0
+        self.loaded = False
+        self.dirty = False
+
+
+_state = _State()
+_lock = threading.RLock()
+
+
+def _skill_key(name: str) -> str:
+    return name.strip().lower()
+
+
+def _set_skills(state: _State, developer_id: int, names: Set[str]) -> None:
+    for name in state.skills_of.get(developer_id, set()) - names:
+        board = state.by_skill.get(name)
+        if board is not None:
+            board.remove(developer_id)
+    state.skills_of[developer_id] = names
+    score = state.overall.score(developer_id)
+    if score is None:
+        return
+    for name in names:
+        state.by_skill.setdefault(name, Leaderboard()).set(developer_id, score)
+
+
+def _set_score(state: _State, developer_id: int, score: int) -> None:
+    state.overall.set(developer_id, score)
+    for name in state.skills_of.get(developer_id, ()):
+        state.by_skill.setdefault(name, Leaderboard()).set(developer_id, score)
+
+
+def _load_skills(developer_ids: Optional[List[int]] = None) -> Dict[int, Set[str]]:
+    links = Developer.skills.through.objects.values_list("developer_id", "skill__name")
+    if developer_ids is not None:
+        links = links.filter(developer_id__in=developer_ids)
+    skills: Dict[int, Set[str]] = {dev_id: set() for dev_id in developer_ids or []}
+    for dev_id, name in links.iterator(chunk_size=2000):
+        skills.setdefault(dev_id, set()).add(_skill_key(name))
+    return skills
+
+
+def _build_from_database() -> _State:
+    state = _State()
+    # Read the event high-water mark first: anything committed later is replayed on top.
+    state.last_event_id = DevScoreEvent.objects.order_by("-id").values_list("id", flat=True).first() or 0
+    for dev_id, score in Developer.objects.values_list("id", "dev_score").iterator(chunk_size=2000):
+        state.overall.set(dev_id, score)
+    for dev_id, names in _load_skills().items():
+        _set_skills(state, dev_id, names)
+    return state
+
+
+def _build_from_snapshot(snapshot: LeaderboardSnapshot) -> _State:
+    state = _State()
+    state.last_event_id = snapshot.last_event_id
+    state.snapshot_id = snapshot.id
+    for dev_id, score in snapshot.entries.get("scores", []):
+        state.overall.set(dev_id, score)
+    for dev_id, names in snapshot.entries.get("skills", []):
+        _set_skills(state, dev_id, set(names))
+    return state
+
+
+def _forget(state: _State, developer_id: int) -> None:
+    state.overall.remove(developer_id)
+    for name in state.skills_of.pop(developer_id, ()):
+        board = state.by_skill.get(name)
+        if board is not None:
+            board.remove(developer_id)
+
+
+def _catch_up(state: _State, lookback: int = 0, batch_size: int = 5000) -> None:
+    """
+    Re-read the current score of every developer with events above the applied
+    watermark, and the skills of those whose resume was (re)analysed. Scores are read
+    from the Developer table, which makes replaying an event more than once harmless.
+
+    Event ids are handed out before commit, so a slow transaction can commit an id
+    below one already applied; `lookback` re-scans that many ids below the watermark
+    to pick those up. Only the timed sync passes it, so reads after a local change
+    stay proportional to the new events.
+    """
+    cursor = max(0, state.last_event_id - lookback)
+    while True:
+        events = list(
+            DevScoreEvent.objects.filter(id__gt=cursor).order_by("id")
+            .values_list("id", "developer_id", "kind")[:batch_size]
+        )
+        if not events:
+            return
+        changed = {dev_id for _, dev_id, _ in events}
+        reanalysed = sorted({dev_id for _, dev_id, kind in events if kind != "submission"})
+        scores = dict(Developer.objects.filter(id__in=changed).values_list("id", "dev_score"))
+        for dev_id in changed:
+            if dev_id in scores:
+                _set_score(state, dev_id, scores[dev_id])
+            else:
+                _forget(state, dev_id)
+        for dev_id, names in _load_skills(reanalysed).items():
+            if dev_id in scores:
+                _set_skills(state, dev_id, names)
+        cursor = events[-1][0]
+        state.last_event_id = max(state.last_event_id, cursor)
+
+
+def _current() -> _State:
+    """
+    The process-wide state, loaded on first use and synced at most every
+    LEADERBOARD_REFRESH_SECONDS (or on the next read after a local change). Without a
+    snapshot the boards start empty and are built by replaying the event log, which
+    holds a baseline event for every developer.
+    """
+    global _state
+    with _lock:
+        state = _state
+        stale = time.monotonic() - state.synced_at >= settings.LEADERBOARD_REFRESH_SECONDS
+        if state.loaded and not (stale or state.dirty):
+            return state
+
+        latest = LeaderboardSnapshot.objects.order_by("-id").first()
+        reloaded = latest is not None and latest.id > state.snapshot_id
+        if reloaded:
+            state = _build_from_snapshot(latest)
+        elif not state.loaded:
+            state = _State()
+        if not state.loaded:
+            if latest is None:
+                logging.warning("[leaderboard] No snapshot yet; replaying the score-event log. Run manage.py leaderboard_snapshot.")
+            state.loaded = True
+        _catch_up(state, lookback=EVENT_LOOKBACK if stale and not reloaded else 0)
+        state.synced_at = time.monotonic()
+        state.dirty = False
+        _state = state
+        return state
+
+
+def mark_dirty() -> None:
+    """Called once a dev_score change commits, so this process sees it on its next read."""
+    with _lock:
+        _state.dirty = True
+
+
+def notify_score_change() -> None:
+    transaction.on_commit(mark_dirty)
+
+
+def forget_developer(developer_id: int) -> None:
+    with _lock:
+        _forget(_state, developer_id)
+
+
+def reset() -> None:
+    """Drop the in-process state; the next read reloads it."""
+    global _state
+    with _lock:
+        _state = _State()
+
+
+def _board(state: _State, skill: Optional[str]) -> Leaderboard:
+    if not skill:
+        return state.overall
+    return state.by_skill.get(_skill_key(skill)) or Leaderboard()
+
+
+def top(limit: int = 10, offset: int = 0, skill: Optional[str] = None) -> Dict[str, object]:
+    """Entries ranked offset+1 .. offset+limit, plus the board size."""
+    with _lock:
+        board = _board(_current(), skill)
+        return {"total": len(board), "entries": board.entries(offset + 1, limit)}
+
+
+def rank_of(developer_id: int, radius: int = 0, skill: Optional[str] = None) -> Optional[Dict[str, object]]:
+    """A developer's rank and the `radius` entries on either side, or None if not on the board."""
+    with _lock:
+        board = _board(_current(), skill)
+        rank = board.rank(developer_id)
+        if rank is None:
+            return None
+        start = max(1, rank - radius)
+        return {
+            "rank": rank,
+            "total": len(board),
+            "neighbours": board.entries(start, rank + radius - start + 1),
+        }
+
+
+def _write_snapshot(state: _State) -> int:
+    snapshot = LeaderboardSnapshot.objects.create(
+        last_event_id=state.last_event_id,
+        entries={
+            "scores": [[dev_id, score] for dev_id, score in state.overall.items()],
+            "skills": [[dev_id, sorted(names)] for dev_id, names in state.skills_of.items() if names],
+        },
+    )
+    stale = LeaderboardSnapshot.objects.order_by("-id").values_list("id", flat=True)[settings.LEADERBOARD_SNAPSHOTS_KEPT:]
+    LeaderboardSnapshot.objects.filter(id__in=list(stale)).delete()
+    return snapshot.id
+
+
+def save_snapshot(rebuild: bool = False) -> int:
+    """
+    Persist the current boards. rebuild=True recomputes them from Developer rows
+    first (needed after scores were rewritten without events, e.g. rebuild_dev_scores).
+    Returns the snapshot id; other workers switch to it on their next sync.
+    """
+    global _state
+    with _lock:
+        if rebuild:
+            state = _build_from_database()
+            state.loaded = True
+        else:
+            state = _current()
+        state.snapshot_id = _write_snapshot(state)
+        state.synced_at = time.monotonic()
+        _state = state
+        return state.snapshot_id
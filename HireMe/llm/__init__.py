@@ -0,0 +1,34 @@
+from typing import Optional
+
+from django.conf import settings
+
+from HireMe.llm.base import LLMProvider, ProviderError
+from HireMe.llm.providers import build_providers
+from HireMe.llm.router import LatencyRouter
+
+_router: Optional[LatencyRouter] = None
+
+
+def get_router() -> LatencyRouter:
+    """Process-wide router built from the LLM_* settings on first use."""
+    global _router
+    if _router is None:
+        _router = LatencyRouter(
+            build_providers(settings.LLM_PROVIDERS),
+            window=settings.LLM_LATENCY_WINDOW,
+            percentile=settings.LLM_LATENCY_PERCENTILE,
+            failure_threshold=settings.LLM_FAILURE_THRESHOLD,
+            cooldown=settings.LLM_COOLDOWN_SECONDS,
+            max_attempts=settings.LLM_MAX_ATTEMPTS,
+            retry_delay=settings.LLM_RETRY_DELAY_SECONDS,
+        )
+    return _router
+
+
+def reset_router() -> None:
+    """Drop the cached router so the next call re-reads settings (tests, reconfiguration)."""
+    global _router
+    _router = None
+
+
+__all__ = ["LLMProvider", "ProviderError", "LatencyRouter", "get_router", "reset_router"]
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ProviderError(Exception):
+    """Raised when an LLM provider cannot serve a completion request."""
+
+
+class LLMProvider:
+    """
+    Minimal interface every LLM backend implements.
+
+    A provider receives the already-built chat messages and returns the raw
+    completion text together with a usage dict. JSON decoding and retries are
+    handled by the caller (see HireMe.utils.generate_response_with_groq).
+
+    `acomplete` is the same call for async views. The default runs `complete` in a
+    worker thread; providers with an async SDK override it so nothing blocks.
+    """
+
+    name = "base"
+
+    def is_configured(self) -> bool:
+        return True
+
+    def complete(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        response_format: Optional[str] = None,
+        max_completion_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        flow: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        response_format: Optional[str] = None,
+        max_completion_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        flow: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        return await asyncio.to_thread(
+            self.complete,
+            messages,
+            model=model,
+            response_format=response_format,
+            max_completion_tokens=max_completion_tokens,
+            tools=tools,
+            flow=flow,
+        )
+
+
+def build_request_args(
+    messages: List[Dict[str, Any]],
+    model: Optional[str],
+    response_format: Optional[str] = None,
+    max_completion_tokens: Optional[int] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Build OpenAI-style chat completion kwargs shared by the HTTP providers."""
+    request_args = {
+        "messages": messages,
+        "model": model,
+    }
+    if max_completion_tokens:
+        request_args["max_completion_tokens"] = max_completion_tokens
+    if response_format and response_format == "json":
+        request_args["response_format"] = {"type": "json_object"}
+    if tools:
+        request_args["tools"] = tools
+    return request_args
+
+
+def usage_to_dict(usage: Any) -> Dict[str, Any]:
+    if usage is None:
+        return {}
+    if isinstance(usage, dict):
+        return usage
+    if hasattr(usage, "model_dump"):
+        return usage.model_dump()
+    return dict(usage)
@@ -0,0 +1,36 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+
+class BoundedLLMExecutor:
+    """
+    Thread pool for LLM calls with at most `max_concurrency` calls in flight and at
+    most `max_pending` queued. `submit` blocks when the queue is full, which gives
+    batch jobs back-pressure instead of an unbounded backlog of futures.
+    """
+
+    def __init__(self, max_concurrency: int, max_pending: int = 0, thread_name_prefix: str = "llm"):
+        self.max_concurrency = max(1, max_concurrency)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(self.max_concurrency + max(0, max_pending or self.max_concurrency))
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown(wait=True)
+        return False
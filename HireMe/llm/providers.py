@@ -0,0 +1,201 @@
+import asyncio
+import json
+import os
+import time
+from typing import List
+
+from django.conf import settings
+
+from HireMe.llm.base import LLMProvider, ProviderError, build_request_args, usage_to_dict
+from HireMe.llm.stub import canned_response, detect_flow
+
+
+class GroqProvider(LLMProvider):
+    name = "groq"
+
+    def __init__(self):
+        self._client = None
+        self._async_client = None
+
+    def is_configured(self) -> bool:
+        return bool(os.getenv("GROQ_API_KEY"))
+
+    def _get_client(self):
+        if self._client is None:
+            from groq import Groq
+
+            self._client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        return self._client
+
+    def _get_async_client(self):
+        if self._async_client is None:
+            from groq import AsyncGroq
+
+            self._async_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+        return self._async_client
+
+    def _request_args(self, messages, model, response_format, max_completion_tokens, tools):
+        return build_request_args(
+            messages,
+            model or os.getenv("GROQ_MODEL"),
+            response_format=response_format,
+            max_completion_tokens=max_completion_tokens,
+            tools=tools,
+        )
+
+    def complete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        request_args = self._request_args(messages, model, response_format, max_completion_tokens, tools)
+        chat_completion = self._get_client().chat.completions.create(**request_args)
+        return chat_completion.choices[0].message.content, usage_to_dict(chat_completion.usage)
+
+    async def acomplete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        request_args = self._request_args(messages, model, response_format, max_completion_tokens, tools)
+        chat_completion = await self._get_async_client().chat.completions.create(**request_args)
+        return chat_completion.choices[0].message.content, usage_to_dict(chat_completion.usage)
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """
+    Any endpoint speaking the OpenAI chat completions API (xAI, vLLM, Ollama...).
+    Configured with XAI_API_KEY / XAI_BASE_URL / XAI_MODEL to match
+    TalentAI/extract/message.py.
+    """
+
+    name = "xai"
+
+    def __init__(self):
+        self._client = None
+        self._async_client = None
+
+    def is_configured(self) -> bool:
+        return bool(os.getenv("XAI_API_KEY"))
+
+    def _get_client(self):
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(
+                api_key=os.getenv("XAI_API_KEY"),
+                base_url=os.getenv("XAI_BASE_URL", "https://api.x.ai/v1"),
+            )
+        return self._client
+
+    def _get_async_client(self):
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+
+            self._async_client = AsyncOpenAI(
+                api_key=os.getenv("XAI_API_KEY"),
+                base_url=os.getenv("XAI_BASE_URL", "https://api.x.ai/v1"),
+            )
+        return self._async_client
+
+    def _request_args(self, messages, response_format, max_completion_tokens, tools):
+        # Model names are provider specific, so the caller's (Groq) model is ignored here.
+        return build_request_args(
+            messages,
+            os.getenv("XAI_MODEL", "grok-3-beta"),
+            response_format=response_format,
+            max_completion_tokens=max_completion_tokens,
+            tools=tools,
+        )
+
+    def complete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        request_args = self._request_args(messages, response_format, max_completion_tokens, tools)
+        chat_completion = self._get_client().chat.completions.create(**request_args)
+        return chat_completion.choices[0].message.content, usage_to_dict(chat_completion.usage)
+
+    async def acomplete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        request_args = self._request_args(messages, response_format, max_completion_tokens, tools)
+        chat_completion = await self._get_async_client().chat.completions.create(**request_args)
+        return chat_completion.choices[0].message.content, usage_to_dict(chat_completion.usage)
+
+
+class LiteLLMProvider(LLMProvider):
+    """Routes through litellm, so any model string it understands (LITELLM_MODEL) can be used."""
+
+    name = "litellm"
+
+    def is_configured(self) -> bool:
+        return bool(os.getenv("LITELLM_MODEL"))
+
+    def _request_args(self, messages, response_format, max_completion_tokens, tools):
+        request_args = build_request_args(
+            messages,
+            os.getenv("LITELLM_MODEL"),
+            response_format=response_format,
+            max_completion_tokens=None,
+            tools=tools,
+        )
+        if max_completion_tokens:
+            request_args["max_tokens"] = max_completion_tokens
+        return request_args
+
+    def complete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        import litellm
+
+        completion = litellm.completion(**self._request_args(messages, response_format, max_completion_tokens, tools))
+        return completion.choices[0].message.content, usage_to_dict(getattr(completion, "usage", None))
+
+    async def acomplete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        import litellm
+
+        completion = await litellm.acompletion(**self._request_args(messages, response_format, max_completion_tokens, tools))
+        return completion.choices[0].message.content, usage_to_dict(getattr(completion, "usage", None))
+
+
+class LocalStubProvider(LLMProvider):
+    """
+    Deterministic, network-free provider. Returns canned JSON for the resume,
+    submission and challenge flows so load tests and CI can run the whole pipeline.
+    settings.LLM_STUB_LATENCY_SECONDS adds a simulated response time (a blocking
+    sleep in `complete`, a non-blocking one in `acomplete`).
+    """
+
+    name = "stub"
+
+    def complete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        if settings.LLM_STUB_LATENCY_SECONDS > 0:
+            time.sleep(settings.LLM_STUB_LATENCY_SECONDS)
+        return self._respond(messages, flow)
+
+    async def acomplete(self, messages, model=None, response_format=None, max_completion_tokens=None, tools=None, flow=None):
+        if settings.LLM_STUB_LATENCY_SECONDS > 0:
+            await asyncio.sleep(settings.LLM_STUB_LATENCY_SECONDS)
+        return self._respond(messages, flow)
+
+    def _respond(self, messages, flow):
+        flow = flow or detect_flow(messages)
+        payload = canned_response(flow)
+        if payload is None:
+            raise ProviderError(f"Stub provider has no canned response for flow '{flow}'")
+
+        content = json.dumps(payload)
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return content, usage
+
+
+PROVIDER_CLASSES = {
+    GroqProvider.name: GroqProvider,
+    OpenAICompatibleProvider.name: OpenAICompatibleProvider,
+    LiteLLMProvider.name: LiteLLMProvider,
+    LocalStubProvider.name: LocalStubProvider,
+}
+
+
+def build_providers(names: List[str]) -> List[LLMProvider]:
+    providers = []
+    for name in names:
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in PROVIDER_CLASSES:
+            raise ValueError(f"Unknown LLM provider '{name}'. Choose from: {', '.join(PROVIDER_CLASSES)}")
+        providers.append(PROVIDER_CLASSES[name]())
+    return providers
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from HireMe.llm.base import LLMProvider, ProviderError
+from TalentAI import metrics
+from TalentAI.tracing import span
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+class ProviderStats:
+    """Rolling latency window and health state for one provider."""
+
+    def __init__(self, window: int):
+        self.latencies = deque(maxlen=window)
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return _percentile(list(self.latencies), pct)
+
+
+class LatencyRouter:
+    """
+    Sends each completion to the fastest healthy provider, judged by the
+    configured percentile of its recent latencies, and falls back to the next
+    one on error. A provider that fails `failure_threshold` times in a row is
+    benched for `cooldown` seconds; benched providers are still tried last so a
+    request never fails while any backend could answer it.
+
+    A completion makes at most `max_attempts` calls in total. Falling back to the
+    next provider is immediate; `retry_delay` is only slept before going round
+    the providers again (so a single provider gets the old retry-with-delay).
+    """
+
+    def __init__(
+        self,
+        providers: List[LLMProvider],
+        window: int = 50,
+        percentile: float = 95.0,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        max_attempts: int = 3,
+        retry_delay: float = 2.0,
+    ):
+        self.providers = providers
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.percentile = percentile
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._stats = {p.name: ProviderStats(window) for p in providers}
+        self._lock = threading.Lock()
+
+    def ranked_providers(self) -> List[LLMProvider]:
+        now = time.monotonic()
+        with self._lock:
+            healthy, benched = [], []
+            for position, provider in enumerate(self.providers):
+                if not provider.is_configured():
+                    continue
+                stats = self._stats[provider.name]
+                # Providers without samples rank first so they get probed once.
+                latency = stats.percentile(self.percentile) or 0.0
+                entry = (latency, position, provider)
+                if stats.unhealthy_until > now:
+                    benched.append(entry)
+                else:
+                    healthy.append(entry)
+        healthy.sort(key=lambda e: (e[0], e[1]))
+        benched.sort(key=lambda e: (e[0], e[1]))
+        return [e[2] for e in healthy + benched]
+
+    def record_success(self, provider: LLMProvider, elapsed: float) -> None:
+        with self._lock:
+            stats = self._stats[provider.name]
+            stats.calls += 1
+            stats.latencies.append(elapsed)
+            stats.consecutive_failures = 0
+            stats.unhealthy_until = 0.0
+
+    def record_failure(self, provider: LLMProvider) -> None:
+        with self._lock:
+            stats = self._stats[provider.name]
+            stats.calls += 1
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            if stats.consecutive_failures >= self.failure_threshold:
+                stats.unhealthy_until = time.monotonic() + self.cooldown
+
+    def _attempts(self) -> List[Tuple[int, LLMProvider, bool]]:
+        """(attempt number, provider, sleep first?) for each call a completion may make."""
+        candidates = self.ranked_providers()
+        if not candidates:
+            raise ValueError(
+                "No LLM provider is configured. Set GROQ_API_KEY (or configure LLM_PROVIDERS)."
+            )
+        return [
+            (attempt + 1, candidates[attempt % len(candidates)], attempt > 0 and attempt % len(candidates) == 0)
+            for attempt in range(self.max_attempts)
+        ]
+
+    def _failed(self, provider: LLMProvider, error: Exception, errors: List[str], attempt: int) -> None:
+        self.record_failure(provider)
+        metrics.llm_provider_failures.inc(provider=provider.name)
+        logging.warning(f"LLM provider '{provider.name}' failed (attempt {attempt}/{self.max_attempts}): {error}")
+        errors.append(f"{provider.name}: {error}")
+
+    def complete(self, messages, **kwargs) -> Tuple[str, Dict[str, Any], str]:
+        """
+        Returns:
+            tuple: (content, usage, provider_name) from the first provider that answers.
+
+        Raises:
+            ValueError: no provider is configured.
+            ProviderError: every attempt failed.
+        """
+        errors: List[str] = []
+        for attempt, provider, sleep_first in self._attempts():
+            if attempt > 1:
+                metrics.llm_retries.inc(flow=kwargs.get("flow") or "other")
+            if sleep_first:
+                with span("llm.retry_sleep", seconds=self.retry_delay):
+                    time.sleep(self.retry_delay)
+            started = time.monotonic()
+            try:
+                with span("llm.provider", provider=provider.name, attempt=attempt):
+                    content, usage = provider.complete(messages, **kwargs)
+            except Exception as e:
+                self._failed(provider, e, errors, attempt)
+                continue
+            self.record_success(provider, time.monotonic() - started)
+            return content, usage, provider.name
+
+        raise ProviderError("All LLM providers failed: " + "; ".join(errors))
+
+    async def acomplete(self, messages, **kwargs) -> Tuple[str, Dict[str, Any], str]:
+        """`complete` for async callers; providers are awaited, so the event loop never blocks."""
+        errors: List[str] = []
+        for attempt, provider, sleep_first in self._attempts():
+            if attempt > 1:
+                metrics.llm_retries.inc(flow=kwargs.get("flow") or "other")
+            if sleep_first:
+                with span("llm.retry_sleep", seconds=self.retry_delay):
+                    await asyncio.sleep(self.retry_delay)
+            started = time.monotonic()
+            try:
+                with span("llm.provider", provider=provider.name, attempt=attempt):
+                    content, usage = await provider.acomplete(messages, **kwargs)
+            except Exception as e:
+                self._failed(provider, e, errors, attempt)
+                continue
+            self.record_success(provider, time.monotonic() - started)
+            return content, usage, provider.name
+
+        raise ProviderError("All LLM providers failed: " + "; ".join(errors))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider latency/health numbers, e.g. for logging or an admin view."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "p50": stats.percentile(50),
+                    "p95": stats.percentile(95),
+                    "healthy": stats.unhealthy_until <= now,
+                }
+                for name, stats in self._stats.items()
+            }
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List, Optional
+
+# Canned responses for the local stub provider. They follow the JSON schemas
+# described in HireMe/agents/developer_prompts.py and Recruiter/agent.py.
+
+STUB_RESUME_RESPONSE = {
+    "dev_score": 540,
+    "skills": [
+        {
+            "name": "Python",
+            "level": 72,
+            "validated": False,
+            "challenge": {
+                "title": "Python Validation Challenge",
+                "description": "Fix a flaky data-processing script and make it fast.",
+                "difficulty": "advanced",
+                "time_limit": 90,
+                "challenge_type": "debugging",
+                "challenge_question": (
+                    "The attached script deduplicates events but drops valid rows, leaks file handles "
+                    "and is O(n^2). Find and fix at least 3 issues. Scored by bugs found and runtime "
+                    "under 200 ms on 100k rows."
+                ),
+                "max_score": 100,
+            },
+        },
+        {
+            "name": "SQL",
+            "level": 60,
+            "validated": False,
+            "challenge": {
+                "title": "SQL Validation Challenge",
+                "description": "Write reporting queries against a small schema.",
+                "difficulty": "intermediate",
+                "time_limit": 60,
+                "challenge_type": "coding",
+                "challenge_question": (
+                    "Given orders(id, customer_id, total, created_at), return the top 5 customers by "
+                    "monthly revenue. Scored by correctness over hidden tests."
+                ),
+                "max_score": 100,
+            },
+        },
+    ],
+}
+
+STUB_SUBMISSION_RESPONSE = {
+    "score": 70,
+    "accuracy_rate": 75.0,
+    "bugs_found": 3,
+    "bugs_missed": 1,
+    "false_positives": 0,
+    "ai_feedback": "Solid analysis; one issue was missed. Add tests for edge cases.",
+    "evaluation_details": {
+        "rubric": {"correctness": 0.75, "quality": 0.7, "clarity": 0.8, "efficiency": 0.6},
+        "notes": ["Stub evaluation generated locally."],
+    },
+}
+
+STUB_CHALLENGE_RESPONSE = {
+    "challenges": [
+        {
+            "title": "Project Skills Challenge",
+            "description": "Implement a small service exercising the project's required skills.",
+            "difficulty": "intermediate",
+            "time_limit": 60,
+            "challenge_type": "coding",
+            "challenge_question": "Build the endpoint described in the brief. Scored by hidden tests.",
+            "max_score": 100,
+        }
+    ],
+    "rationale": "Stub suggestion generated locally.",
+}
+
+STUB_RESPONSES = {
+    "resume": STUB_RESUME_RESPONSE,
+    "submission": STUB_SUBMISSION_RESPONSE,
+    "challenge": STUB_CHALLENGE_RESPONSE,
+}
+
+# Markers used when callers don't pass an explicit flow.
+FLOW_MARKERS = (
+    ("resume", "resume_text"),
+    ("submission", "submission_json"),
+    ("challenge", "challenge suggestions"),
+)
+
+
+def detect_flow(messages: List[Dict[str, Any]]) -> Optional[str]:
+    text = " ".join(str(m.get("content", "")) for m in messages).lower()
+    for flow, marker in FLOW_MARKERS:
+        if marker in text:
+            return flow
+    return None
+
+
+def canned_response(flow: Optional[str]) -> Optional[Dict[str, Any]]:
+    return STUB_RESPONSES.get(flow)
@@ -0,0 +1,89 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+
+from HireMe.llm import reset_router
+from HireMe.models import Challenge, Developer
+
+SYNC_URL = "/api/HireMe/developers/submit_challenge/"
+ASYNC_URL = "/api/HireMe/async/developers/submit_challenge/"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare how many slow-LLM requests one process serves at once: submit_challenge on "
+        "the sync view (a fixed pool of worker threads) vs the async view (one event loop). "
+        "Uses the stub LLM provider with a simulated latency; creates and removes its own rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=20, help="Concurrent requests per run.")
+        parser.add_argument("--latency", type=float, default=5.0, help="Simulated LLM latency in seconds.")
+        parser.add_argument("--threads", type=int, default=4, help="Worker threads for the sync run (like gunicorn --threads).")
+        parser.add_argument("--skip-sync", action="store_true", help="Only run the async view.")
+
+    def handle(self, *args, **options):
+        if options["requests"] <= 0 or options["threads"] <= 0:
+            raise CommandError("--requests and --threads must be positive")
+
+        overrides = override_settings(
+            LLM_PROVIDERS=["stub"],
+            LLM_STUB_LATENCY_SECONDS=options["latency"],
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+        )
+        tag = uuid.uuid4().hex[:8]
+        with overrides:
+            reset_router()
+            developer = Developer.objects.create(full_name="Benchmark", email=f"bench-{tag}@example.com")
+            challenge = Challenge.objects.create(
+                title=f"Benchmark challenge {tag}", description="", difficulty="intermediate",
+                time_limit=60, challenge_type="debugging", challenge_question="", max_score=100,
+            )
+            body = {"developer": developer.id, "challenge": challenge.id, "bug_analysis": "", "answer": "benchmark"}
+            try:
+                if not options["skip_sync"]:
+                    self._report("sync ", options, *self._run_sync(body, options["requests"], options["threads"]))
+                self._report("async", options, *self._run_async(body, options["requests"]))
+            finally:
+                developer.delete()
+                challenge.delete()
+                reset_router()
+
+    def _run_sync(self, body, requests, threads):
+        def one(_):
+            try:
+                return Client().post(SYNC_URL, body, content_type="application/json").status_code
+            finally:
+                connection.close()
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(threads) as pool:
+            codes = list(pool.map(one, range(requests)))
+        return time.monotonic() - started, codes
+
+    def _run_async(self, body, requests):
+        async def run():
+            client = AsyncClient()
+            return await asyncio.gather(*(
+                client.post(ASYNC_URL, body, content_type="application/json") for _ in range(requests)
+            ))
+
+        started = time.monotonic()
+        responses = asyncio.run(run())
+        return time.monotonic() - started, [r.status_code for r in responses]
+
+    def _report(self, label, options, seconds, codes):
+        ok = sum(1 for c in codes if c == 201)
+        # Requests that were waiting on the LLM at the same time, on average.
+        concurrency = ok * options["latency"] / seconds if seconds else 0.0
+        self.stdout.write(
+            f"{label}: requests={len(codes)} ok={ok} seconds={seconds:.2f} "
+            f"throughput={len(codes) / seconds:.2f}/s effective_concurrency={concurrency:.1f}"
+        )
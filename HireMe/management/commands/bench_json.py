@@ -0,0 +1,133 @@
+import io
+import json
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from HireMe.models import Challenge, Developer, Skill, Submission
+from HireMe.serializers import SubmissionSerializer
+from Recruiter.models import CandidateRecommendation, Project
+from Recruiter.serializers import CandidateRecommendationSerializer
+from TalentAI.renderers import ORJSONParser, ORJSONRenderer, orjson
+
+NAMES = ["Ada Lovelace", "Grace Hopper", "José Álvarez", "Zoë Müller", "李雷", "Ngozi Okafor"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time DRF's JSONRenderer/JSONParser against the orjson-backed ones on realistic payloads "
+        "(recommendation lists with nested developers, skills and challenges; submission feeds with "
+        "evaluation_details). Builds the rows in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--developers", type=int, default=100, help="Recommendations in the list payload.")
+        parser.add_argument("--skills", type=int, default=8, help="Skills per developer.")
+        parser.add_argument("--submissions", type=int, default=200, help="Submissions in the feed payload.")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed renders per payload (best of 5 rounds).")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson is not installed")
+        if min(options["developers"], options["skills"], options["submissions"], options["repeat"]) <= 0:
+            raise CommandError("all counts must be positive")
+
+        with transaction.atomic():
+            payloads = self._payloads(options)
+            transaction.set_rollback(True)
+
+        for name, data in payloads.items():
+            stock = JSONRenderer().render(data)
+            fast = ORJSONRenderer().render(data)
+            stock_ms = self._best(lambda: JSONRenderer().render(data), options["repeat"])
+            fast_ms = self._best(lambda: ORJSONRenderer().render(data), options["repeat"])
+            self._report(f"render {name}", len(stock), stock_ms, fast_ms, stock == fast)
+
+            parsed = json.loads(stock)
+            stock_ms = self._best(lambda: JSONParser().parse(io.BytesIO(stock)), options["repeat"])
+            fast_ms = self._best(lambda: ORJSONParser().parse(io.BytesIO(stock)), options["repeat"])
+            self._report(f"parse  {name}", len(stock), stock_ms, fast_ms, ORJSONParser().parse(io.BytesIO(stock)) == parsed)
+
+    def _payloads(self, options):
+        rng = random.Random(7)
+        challenges = Challenge.objects.bulk_create([
+            Challenge(
+                title=f"Bench challenge {i}", description="Find and fix the bugs in the handler. " * 4,
+                difficulty=rng.choice(["beginner", "intermediate", "advanced"]), time_limit=60,
+                challenge_type="debugging", challenge_question="def handler(event):\n    ...\n" * 3, max_score=100,
+            )
+            for i in range(20)
+        ])
+        project = Project.objects.create(project_name="Bench project", description="Payments platform rewrite")
+        developers = []
+        for i in range(options["developers"]):
+            dev = Developer.objects.create(
+                full_name=f"{rng.choice(NAMES)} {i}", email=f"bench-json-{i}@example.com",
+                bio="Backend engineer who likes tracing bugs across services. " * 3, location="Lisbon",
+                experience_level=rng.choice(["junior", "mid", "senior"]), dev_score=rng.randint(0, 1000),
+                portfolio_links=[f"https://github.com/bench{i}", f"https://bench{i}.dev"],
+            )
+            skills = Skill.objects.bulk_create([
+                Skill(name=f"skill-{i}-{j}", level=rng.randint(0, 100), validated=rng.random() < 0.5,
+                      challenge=rng.choice(challenges) if rng.random() < 0.6 else None)
+                for j in range(options["skills"])
+            ])
+            dev.skills.set(skills)
+            developers.append(dev)
+
+        CandidateRecommendation.objects.bulk_create([
+            CandidateRecommendation(project=project, developer=dev, fit_score=round(rng.uniform(40, 99), 2),
+                                    rationale="Strong overlap on required skills; recent validated challenges.")
+            for dev in developers
+        ])
+        recs = (
+            CandidateRecommendation.objects.filter(project=project).order_by("-fit_score")
+            .select_related("developer").prefetch_related("developer__skills__challenge")
+        )
+
+        submissions = Submission.objects.bulk_create([
+            Submission(
+                developer=rng.choice(developers), challenge=rng.choice(challenges), bug_analysis="Off-by-one in pagination. " * 5,
+                answer="for i in range(len(items)):\n    ...\n" * 5, score=rng.randint(0, 100), accuracy_rate=rng.random(),
+                bugs_found=rng.randint(0, 5), bugs_missed=rng.randint(0, 3), false_positives=rng.randint(0, 2), status="completed",
+                ai_feedback="Good root-cause analysis; missed the timezone edge case.",
+                evaluation_details={
+                    "criteria": {c: rng.randint(0, 10) for c in ("correctness", "clarity", "testing", "performance")},
+                    "bugs": [{"line": rng.randint(1, 80), "found": rng.random() < 0.7, "note": "boundary check"} for _ in range(4)],
+                    "model": "stub",
+                },
+            )
+            for _ in range(options["submissions"])
+        ])
+
+        return {
+            "recommendations": CandidateRecommendationSerializer(recs, many=True).data,
+            "submissions": {"results": SubmissionSerializer(submissions, many=True).data, "next_cursor": None},
+            # Values serializers normally stringify, as views sometimes return them directly.
+            "mixed": {
+                "generated_at": now(), "day": now().date(), "budget": Decimal("1250.50"),
+                "label": gettext_lazy("Not Available"), "rows": [{"at": now(), "amount": Decimal(i) / 7} for i in range(200)],
+            },
+        }
+
+    def _best(self, fn, repeat):
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                fn()
+            best = min(best, (time.perf_counter() - started) / repeat)
+        return best * 1000
+
+    def _report(self, label, size, stock_ms, fast_ms, identical):
+        self.stdout.write(
+            f"{label}: bytes={size} stock={stock_ms:.3f}ms orjson={fast_ms:.3f}ms "
+            f"speedup={stock_ms / fast_ms:.1f}x identical={'yes' if identical else 'NO'}"
+        )
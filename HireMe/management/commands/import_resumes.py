@@ -0,0 +1,191 @@
+import csv
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from HireMe.bulk_persistence import bulk_persist_resume_results
+from HireMe.agents.developer_agent import ai_analyze_resume
+from HireMe.ingestion import build_ai_profile
+from HireMe.llm.executor import BoundedLLMExecutor
+from HireMe.pdf_extraction import extract_pdf_file
+from HireMe.resume_cache import lookup_by_pdf, lookup_by_text, store_analyses, text_fingerprint
+from HireMe.resume_store import content_hash
+
+EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+
+
+def _extract_worker(path: str, max_pages: int, timeout: float) -> Tuple[str, str, str, str]:
+    """Runs in the process pool: returns (path, pdf_hash, text, error)."""
+    try:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return path, digest.hexdigest(), extract_pdf_file(path, max_pages, timeout), ""
+    except Exception as e:
+        return path, "", "", str(e)
+
+
+def _read_manifest(path: str) -> List[Dict[str, Any]]:
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+    for row in rows:
+        if not os.path.isabs(row["path"]):
+            row["path"] = os.path.join(base, row["path"])
+    return rows
+
+
+def _read_directory(path: str) -> List[Dict[str, Any]]:
+    return [
+        {"path": os.path.join(path, name)}
+        for name in sorted(os.listdir(path))
+        if name.lower().endswith(".pdf")
+    ]
+
+
+def _batches(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import resumes from a directory of PDFs or a manifest (.csv/.jsonl with a 'path' "
+        "column plus optional developer fields such as email and full_name). Resumable via a "
+        "checkpoint file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Directory of PDFs or manifest file.")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="PDF extraction processes.")
+        parser.add_argument("--llm-concurrency", type=int, default=4, help="Max LLM calls in flight.")
+        parser.add_argument("--batch-size", type=int, default=200, help="Resumes persisted per bulk write.")
+        parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: <source>.import-checkpoint).")
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+
+    def handle(self, *args, **options):
+        source = options["source"]
+        if os.path.isdir(source):
+            rows = _read_directory(source)
+        elif os.path.isfile(source):
+            rows = _read_manifest(source)
+        else:
+            raise CommandError(f"{source} is neither a directory nor a manifest file")
+
+        checkpoint = options["checkpoint"] or source.rstrip("/") + ".import-checkpoint"
+        done = set()
+        if os.path.exists(checkpoint) and not options["restart"]:
+            with open(checkpoint, encoding="utf-8") as f:
+                done = {line.strip() for line in f if line.strip()}
+        todo = [r for r in rows if r["path"] not in done]
+        self.stdout.write(f"{len(rows)} resumes found, {len(rows) - len(todo)} already imported, {len(todo)} to go")
+
+        self.stats = {"imported": 0, "skipped": 0, "failed": 0, "cache_hits": 0}
+        self.started = time.monotonic()
+        with ProcessPoolExecutor(max_workers=options["workers"]) as pdf_pool, \
+                BoundedLLMExecutor(options["llm_concurrency"], thread_name_prefix="import-llm") as llm, \
+                open(checkpoint, "a", encoding="utf-8") as checkpoint_file:
+            for batch in _batches(todo, options["batch_size"]):
+                # Only persisted resumes are checkpointed; failures and skips are retried next run.
+                imported = self._import_batch(batch, pdf_pool, llm)
+                checkpoint_file.write("".join(path + "\n" for path in imported))
+                checkpoint_file.flush()
+                self.stdout.write(self._summary())
+
+        self.stdout.write(self.style.SUCCESS(f"Done. {self._summary()}"))
+
+    def _import_batch(self, batch, pdf_pool, llm) -> List[str]:
+        """Import one batch; returns the paths whose developer was written."""
+        max_pages = settings.PDF_MAX_PAGES
+        timeout = settings.PDF_EXTRACT_TIMEOUT_SECONDS
+        rows_by_path = {r["path"]: r for r in batch}
+
+        pending = []
+        for path, pdf_hash, text, error in pdf_pool.map(
+            _extract_worker, list(rows_by_path), [max_pages] * len(batch), [timeout] * len(batch)
+        ):
+            row = rows_by_path[path]
+            if error:
+                self.stats["failed"] += 1
+                self.stderr.write(f"{path}: extraction failed: {error}")
+                continue
+            profile = {k: v for k, v in row.items() if k != "path" and v not in (None, "")}
+            if "email" not in profile:
+                match = EMAIL_RE.search(text)
+                if not match:
+                    self.stats["skipped"] += 1
+                    self.stderr.write(f"{path}: no email in manifest or resume text, skipped")
+                    continue
+                profile["email"] = match.group()
+            profile.setdefault("full_name", os.path.splitext(os.path.basename(path))[0])
+
+            # Cache lookups and all DB writes stay on this thread; the LLM threads only wait on the network.
+            text_hash = text_fingerprint(text)
+            cached = lookup_by_pdf(pdf_hash) or (lookup_by_text(pdf_hash, text_hash) if text else None)
+            extracted = {
+                "pdf_hash": pdf_hash,
+                "text_hash": text_hash,
+                "resume_text": text,
+                "cached": None if cached is None else {
+                    "dev_score": cached.dev_score,
+                    "skills": cached.skills,
+                    "resume_hash": cached.resume_hash,
+                },
+            }
+            record = {"path": path, "profile": profile, "extracted": extracted}
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                record["analysis"] = {"dev_score": cached.dev_score, "skills": cached.skills}
+                pending.append((record, None))
+            elif text:
+                pending.append((record, llm.submit(ai_analyze_resume, text, build_ai_profile(profile))))
+            else:
+                record["analysis"] = {"dev_score": 0, "skills": []}
+                pending.append((record, None))
+
+        records, new_analyses = [], []
+        for record, future in pending:
+            if future is not None:
+                try:
+                    record["analysis"] = future.result()
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    self.stderr.write(f"{record['profile']['email']}: analysis failed: {e}")
+                    continue
+                extracted = record["extracted"]
+                new_analyses.append((
+                    extracted["pdf_hash"], extracted["text_hash"],
+                    content_hash(extracted["resume_text"]), record["analysis"],
+                ))
+            records.append(record)
+
+        if not records:
+            return []
+        with transaction.atomic():
+            store_analyses(new_analyses)
+            counts = bulk_persist_resume_results(records)
+        self.stats["imported"] += counts["created"] + counts["updated"]
+        self.stats["failed"] += counts["invalid"]
+        persisted = set(counts["emails"])
+        return [r["path"] for r in records if r["profile"]["email"] in persisted]
+
+    def _summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        rate = self.stats["imported"] / elapsed * 60 if elapsed > 0 else 0.0
+        return (
+            f"imported={self.stats['imported']} cache_hits={self.stats['cache_hits']} "
+            f"skipped={self.stats['skipped']} failed={self.stats['failed']} "
+            f"elapsed={elapsed:.1f}s rate={rate:.1f} resumes/min"
+        )
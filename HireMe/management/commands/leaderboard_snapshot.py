@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from HireMe.leaderboard import save_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Persist the developer leaderboards so workers start from a recent snapshot "
+        "instead of replaying the whole score-event log. Meant to run periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild", action="store_true",
+            help="Recompute from the Developer table instead of the latest snapshot plus events.",
+        )
+
+    def handle(self, *args, **options):
+        snapshot_id = save_snapshot(rebuild=options["rebuild"])
+        self.stdout.write(self.style.SUCCESS(f"Saved leaderboard snapshot {snapshot_id}"))
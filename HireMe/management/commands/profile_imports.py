@@ -0,0 +1,55 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from TalentAI.startup import HEAVY_MODULES, profile_boot
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile worker boot (application import + URL conf) in a fresh interpreter: "
+        "slowest imports, time per top-level package, and heavy dependencies loaded eagerly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", choices=("wsgi", "asgi"), default="wsgi")
+        parser.add_argument("--top", type=int, default=20, help="Rows per table.")
+        parser.add_argument("--min-ms", type=float, default=1.0, help="Hide imports faster than this (cumulative).")
+        parser.add_argument(
+            "--budget", type=float, default=None, metavar="SECONDS",
+            help=f"Fail if boot takes longer (default settings.STARTUP_BUDGET_SECONDS={settings.STARTUP_BUDGET_SECONDS}).",
+        )
+
+    def handle(self, *args, **options):
+        if options["top"] <= 0:
+            raise CommandError("--top must be positive")
+        budget = settings.STARTUP_BUDGET_SECONDS if options["budget"] is None else options["budget"]
+
+        # Timed without -X importtime, which slows imports down a little.
+        seconds = profile_boot(options["target"], importtime=False)["seconds"]
+        profile = profile_boot(options["target"])
+        imports = profile["imports"]
+
+        self.stdout.write(f"Slowest imports (cumulative, {options['target']} boot):")
+        slowest = sorted(imports, key=lambda r: r["cumulative_ms"], reverse=True)
+        for row in [r for r in slowest if r["cumulative_ms"] >= options["min_ms"]][:options["top"]]:
+            self.stdout.write(f"  {row['cumulative_ms']:9.1f} ms  {row['self_ms']:8.1f} ms self  {row['module']}")
+
+        per_package = defaultdict(float)
+        for row in imports:
+            per_package[row["module"].split(".")[0]] += row["self_ms"]
+        self.stdout.write("Time per top-level package (self time):")
+        for package, ms in sorted(per_package.items(), key=lambda kv: kv[1], reverse=True)[:options["top"]]:
+            if ms >= options["min_ms"]:
+                self.stdout.write(f"  {ms:9.1f} ms  {package}")
+
+        self.stdout.write(f"Modules loaded: {profile['modules']}")
+        if profile["heavy"]:
+            self.stdout.write(self.style.WARNING(
+                f"Heavy modules imported at boot: {', '.join(profile['heavy'])} "
+                f"(should load on first use; checked: {', '.join(HEAVY_MODULES)})"
+            ))
+        self.stdout.write(f"Boot: {seconds:.3f}s (budget {budget:.3f}s)")
+        if seconds > budget:
+            raise CommandError(f"Worker boot took {seconds:.3f}s, over the {budget:.3f}s budget")
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from HireMe.leaderboard import save_snapshot
+from HireMe.scoring import RULES, rebuild_dev_scores
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute dev_score for every developer by replaying the score-event log, "
+        "optionally under a different rule (e.g. --rule normalized)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rule", choices=sorted(RULES), default=None, help="Defaults to settings.DEV_SCORE_RULE.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="Report how many scores would change.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive")
+        totals = rebuild_dev_scores(options["rule"], batch_size=options["batch_size"], dry_run=options["dry_run"])
+        if totals["changed"] and not options["dry_run"]:
+            # Rebuilt scores bypass the event log, so re-snapshot the leaderboards from the table.
+            save_snapshot(rebuild=True)
+        verb = "would change" if options["dry_run"] else "changed"
+        self.stdout.write(self.style.SUCCESS(
+            f"Replayed {totals['developers']} developers; {totals['changed']} scores {verb}"
+        ))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from HireMe.models import Developer
+from HireMe.search import get_backend, index_developers
+
+
+class Command(BaseCommand):
+    help = "Rebuild the developer full-text search index from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        with connection.cursor() as cursor:
+            for sql in backend.drop_sql + backend.create_sql:
+                cursor.execute(sql)
+
+        total = 0
+        last_id = 0
+        while True:
+            ids = list(
+                Developer.objects.filter(id__gt=last_id).order_by("id")
+                .values_list("id", flat=True)[:options["batch_size"]]
+            )
+            if not ids:
+                break
+            total += index_developers(ids)
+            last_id = ids[-1]
+            self.stdout.write(f"Indexed {total} developers")
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt ({total} developers)"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from HireMe.ingestion import run_job
+from HireMe.models import ResumeIngestionJob
+
+
+class Command(BaseCommand):
+    help = "Run unfinished resume ingestion jobs in this process (e.g. after a worker restart)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--include-failed", action="store_true", help="Also retry jobs marked as failed.")
+
+    def handle(self, *args, **options):
+        statuses = ["queued", "extracting", "analyzing", "persisting"]
+        if options["include_failed"]:
+            statuses.append("failed")
+
+        job_ids = list(ResumeIngestionJob.objects.filter(status__in=statuses).order_by("id").values_list("id", flat=True))
+        self.stdout.write(f"Processing {len(job_ids)} ingestion job(s)")
+        for job_id in job_ids:
+            job = run_job(job_id)
+            self.stdout.write(f"{job.job_id}: {job.status}{' - ' + job.error if job.error else ''}")
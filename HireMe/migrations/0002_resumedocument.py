@@ -0,0 +1,26 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('codec', models.CharField(choices=[('zstd', 'zstd'), ('zlib', 'zlib')], default='zlib', max_length=8)),
+                ('content', models.BinaryField()),
+                ('content_hash', models.CharField(db_index=True, max_length=64)),
+                ('original_size', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('developer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='resume_document', to='HireMe.developer')),
+            ],
+        ),
+    ]
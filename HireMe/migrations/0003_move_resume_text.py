@@ -0,0 +1,96 @@
+import base64
+import binascii
+import hashlib
+import zlib
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+# Frozen copies of the HireMe.resume_store helpers, so later changes there can't
+# change what replaying this migration does. Rows are written with zlib; zstd rows
+# (written by the app when zstandard is installed) can still be read back.
+
+def compress_text(text):
+    return "zlib", zlib.compress(text.encode("utf-8"), 6)
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def decompress_text(codec, blob):
+    blob = bytes(blob)
+    if codec == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return zlib.decompress(blob).decode("utf-8")
+
+
+def forwards(apps, schema_editor):
+    """Decode the base64 Developer.resume values into compressed ResumeDocument rows, in batches."""
+    Developer = apps.get_model("HireMe", "Developer")
+    ResumeDocument = apps.get_model("HireMe", "ResumeDocument")
+
+    last_id = 0
+    while True:
+        rows = list(
+            Developer.objects.filter(id__gt=last_id)
+            .exclude(resume__isnull=True)
+            .exclude(resume="")
+            .order_by("id")
+            .values_list("id", "resume")[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        docs = []
+        for dev_id, resume_b64 in rows:
+            try:
+                text = base64.b64decode(resume_b64, validate=True).decode("utf-8")
+            except (binascii.Error, UnicodeDecodeError):
+                # Not base64 (written by hand or an older client); keep it as plain text.
+                text = resume_b64
+            codec, blob = compress_text(text)
+            docs.append(ResumeDocument(
+                developer_id=dev_id,
+                codec=codec,
+                content=blob,
+                content_hash=content_hash(text),
+                original_size=len(text.encode("utf-8")),
+            ))
+        ResumeDocument.objects.bulk_create(docs, ignore_conflicts=True)
+        last_id = rows[-1][0]
+
+
+def backwards(apps, schema_editor):
+    Developer = apps.get_model("HireMe", "Developer")
+    ResumeDocument = apps.get_model("HireMe", "ResumeDocument")
+
+    last_id = 0
+    while True:
+        docs = list(
+            ResumeDocument.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", "developer_id", "codec", "content")[:BATCH_SIZE]
+        )
+        if not docs:
+            break
+        developers = []
+        for _, dev_id, codec, blob in docs:
+            text = decompress_text(codec, blob)
+            developers.append(Developer(id=dev_id, resume=base64.b64encode(text.encode("utf-8")).decode("utf-8")))
+        Developer.objects.bulk_update(developers, ["resume"])
+        last_id = docs[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0002_resumedocument'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0003_move_resume_text'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='developer',
+            name='resume',
+        ),
+    ]
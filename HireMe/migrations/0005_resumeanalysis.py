@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0004_remove_developer_resume'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pdf_hash', models.CharField(max_length=64, unique=True)),
+                ('text_hash', models.CharField(db_index=True, max_length=64)),
+                ('resume_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('dev_score', models.IntegerField(default=0)),
+                ('skills', models.JSONField(default=list)),
+                ('hit_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_hit_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:07
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0005_resumeanalysis'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeIngestionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('email', models.EmailField(max_length=254)),
+                ('profile', models.JSONField(blank=True, default=dict)),
+                ('upload', models.FileField(blank=True, null=True, upload_to='resume_uploads/')),
+                ('status', models.CharField(choices=[('queued', 'queued'), ('extracting', 'extracting'), ('analyzing', 'analyzing'), ('persisting', 'persisting'), ('completed', 'completed'), ('failed', 'failed')], default='queued', max_length=16)),
+                ('stages', models.JSONField(blank=True, default=dict)),
+                ('extracted', models.JSONField(blank=True, null=True)),
+                ('analysis', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('developer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ingestion_jobs', to='HireMe.developer')),
+            ],
+        ),
+    ]
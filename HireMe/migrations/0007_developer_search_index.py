@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# The statements as of this migration (see HireMe.search for the live backends), copied
+# so later changes there can't change what replaying this migration does. Other
+# backends have no index table.
+TABLE = "hireme_developer_search"
+
+CREATE_SQL = {
+    "sqlite": [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+        "skills, bio, location, resume, tokenize = 'porter unicode61')"
+    ],
+    "postgresql": [
+        f"CREATE TABLE IF NOT EXISTS {TABLE} ("
+        "developer_id bigint PRIMARY KEY REFERENCES \"HireMe_developer\"(id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+        "document tsvector NOT NULL)",
+        f"CREATE INDEX IF NOT EXISTS {TABLE}_document_gin ON {TABLE} USING gin (document)",
+    ],
+}
+
+DROP_SQL = {
+    "sqlite": [f"DROP TABLE IF EXISTS {TABLE}"],
+    "postgresql": [f"DROP TABLE IF EXISTS {TABLE}"],
+}
+
+
+def create_search_index(apps, schema_editor):
+    for sql in CREATE_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    for sql in DROP_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0006_resumeingestionjob'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,52 @@
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicates(apps, schema_editor):
+    """
+    Challenges were get_or_create'd by title and skills by (name, challenge), so
+    duplicates only exist from races. Fold them into the oldest row before the
+    unique constraints go on.
+    """
+    Challenge = apps.get_model("HireMe", "Challenge")
+    Skill = apps.get_model("HireMe", "Skill")
+    Submission = apps.get_model("HireMe", "Submission")
+    Invitation = apps.get_model("Recruiter", "Invitation")
+    Through = apps.get_model("HireMe", "Developer").skills.through
+
+    dup_titles = (
+        Challenge.objects.values("title").annotate(n=Count("id"), keep=Min("id")).filter(n__gt=1)
+    )
+    for row in dup_titles:
+        dupes = list(Challenge.objects.filter(title=row["title"]).exclude(id=row["keep"]).values_list("id", flat=True))
+        Skill.objects.filter(challenge_id__in=dupes).update(challenge_id=row["keep"])
+        Submission.objects.filter(challenge_id__in=dupes).update(challenge_id=row["keep"])
+        Invitation.objects.filter(challenge_id__in=dupes).update(challenge_id=row["keep"])
+        Challenge.objects.filter(id__in=dupes).delete()
+
+    dup_skills = (
+        Skill.objects.filter(challenge__isnull=False)
+        .values("name", "challenge_id").annotate(n=Count("id"), keep=Min("id")).filter(n__gt=1)
+    )
+    for row in dup_skills:
+        dupes = list(
+            Skill.objects.filter(name=row["name"], challenge_id=row["challenge_id"])
+            .exclude(id=row["keep"]).values_list("id", flat=True)
+        )
+        developer_ids = set(Through.objects.filter(skill_id__in=dupes).values_list("developer_id", flat=True))
+        Through.objects.bulk_create(
+            [Through(developer_id=d, skill_id=row["keep"]) for d in developer_ids], ignore_conflicts=True
+        )
+        Skill.objects.filter(id__in=dupes).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0007_developer_search_index'),
+        ('Recruiter', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+    ]
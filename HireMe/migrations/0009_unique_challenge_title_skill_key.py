@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+# Kept apart from 0008 so the data fix commits before the ALTER TABLE on PostgreSQL.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0008_merge_duplicate_challenges_skills'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='challenge',
+            name='title',
+            field=models.CharField(max_length=160, unique=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name='skill',
+            unique_together={('name', 'challenge')},
+        ),
+    ]
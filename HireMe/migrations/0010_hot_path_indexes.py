@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:16
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0009_unique_challenge_title_skill_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='developer',
+            index=models.Index(fields=['-dev_score', 'id'], name='developer_dev_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(models.F('challenge'), django.db.models.functions.text.Lower('name'), name='skill_name_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def seed_baselines(apps, schema_editor):
+    """One baseline event per existing developer so replays start from today's score."""
+    Developer = apps.get_model("HireMe", "Developer")
+    DevScoreEvent = apps.get_model("HireMe", "DevScoreEvent")
+
+    last_id = 0
+    while True:
+        rows = list(Developer.objects.filter(id__gt=last_id).order_by("id").values_list("id", "dev_score")[:BATCH_SIZE])
+        if not rows:
+            break
+        DevScoreEvent.objects.bulk_create([
+            DevScoreEvent(developer_id=dev_id, kind="baseline", value=score, score_after=score)
+            for dev_id, score in rows
+        ])
+        last_id = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0010_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DevScoreEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('baseline', 'baseline'), ('resume', 'resume'), ('submission', 'submission')], max_length=16)),
+                ('value', models.IntegerField()),
+                ('max_score', models.IntegerField(blank=True, null=True)),
+                ('score_after', models.IntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_events', to='HireMe.developer')),
+                ('submission', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='HireMe.submission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['developer', 'id'], name='score_event_dev_idx')],
+            },
+        ),
+        migrations.RunPython(seed_baselines, migrations.RunPython.noop),
+    ]
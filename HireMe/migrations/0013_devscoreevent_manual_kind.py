@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0012_leaderboardsnapshot'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='devscoreevent',
+            name='kind',
+            field=models.CharField(choices=[('baseline', 'baseline'), ('resume', 'resume'), ('submission', 'submission'), ('manual', 'manual')], max_length=16),
+        ),
+    ]
@@ -1,11 +1,15 @@
+import uuid
+
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Lower
 
 class Challenge(models.Model):
     CHALLENGE_TYPES = [
         ("coding","coding"), ("system_design","system_design"),
         ("algorithm","algorithm"), ("debugging","debugging"), ("architecture","architecture")
     ]
-    title = models.CharField(max_length=160)
+    title = models.CharField(max_length=160, unique=True)
     description = models.TextField()
     difficulty = models.CharField(max_length=32)
     time_limit = models.IntegerField()
@@ -20,6 +24,14 @@ class Skill(models.Model):
     level = models.IntegerField(default=50)
     validated = models.BooleanField(default=False)
     challenge = models.ForeignKey(Challenge, related_name="skills", on_delete=models.CASCADE, null=True, blank=True)
+
+    class Meta:
+        unique_together = ("name", "challenge")
+        indexes = [
+            # Case-insensitive matching of catalog skills (HireMe.bulk_persistence).
+            models.Index(F("challenge"), Lower("name"), name="skill_name_lower_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -35,11 +47,16 @@ class Developer(models.Model):
     availability = models.CharField(max_length=32, choices=[
         ("available","Available"), ("open_to_offers","Open to Offers"), ("not_available","Not Available")
     ], default="available")
-    resume = models.TextField(null=True, blank=True)
     dev_score = models.IntegerField(default=0)
     validation_status = models.CharField(max_length=32, default="not_validated")
     portfolio_links = models.JSONField(null=True, blank=True)
     skills = models.ManyToManyField(Skill, related_name="developers", blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-dev_score", "id"], name="developer_dev_score_idx"),
+        ]
+
     def __str__(self):
         return self.full_name
 
@@ -59,4 +76,99 @@ class Submission(models.Model):
     evaluation_details = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     def __str__(self):
-        return self.developer.full_name
\ No newline at end of file
+        return self.developer.full_name
+
+class ResumeDocument(models.Model):
+    """
+    Resume text for a developer, kept out of the Developer row and stored compressed.
+    Read it through HireMe.resume_store.load_resume_text.
+    """
+    CODECS = [("zstd", "zstd"), ("zlib", "zlib")]
+    developer = models.OneToOneField(Developer, related_name="resume_document", on_delete=models.CASCADE)
+    codec = models.CharField(max_length=8, choices=CODECS, default="zlib")
+    content = models.BinaryField()
+    content_hash = models.CharField(max_length=64, db_index=True)
+    original_size = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    def __str__(self):
+        return f"Resume of developer {self.developer_id}"
+
+
+class ResumeAnalysis(models.Model):
+    """
+    Cached ai_analyze_resume output keyed by resume fingerprints, so re-uploads of the
+    same PDF (or the same text in a different PDF) skip extraction and the LLM call.
+    """
+    pdf_hash = models.CharField(max_length=64, unique=True)
+    text_hash = models.CharField(max_length=64, db_index=True)
+    resume_hash = models.CharField(max_length=64, blank=True, default="")
+    dev_score = models.IntegerField(default=0)
+    skills = models.JSONField(default=list)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_hit_at = models.DateTimeField(null=True, blank=True)
+    def __str__(self):
+        return self.pdf_hash
+
+
+class ResumeIngestionJob(models.Model):
+    """
+    A resume upload processed in the background: extraction -> analysis -> persistence.
+    `stages` holds {stage: {"status", "attempts", "error", "seconds"}} for each stage.
+    """
+    STATUS = [
+        ("queued","queued"), ("extracting","extracting"), ("analyzing","analyzing"),
+        ("persisting","persisting"), ("completed","completed"), ("failed","failed")
+    ]
+    job_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    email = models.EmailField()
+    profile = models.JSONField(default=dict, blank=True)
+    upload = models.FileField(upload_to="resume_uploads/", null=True, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS, default="queued")
+    stages = models.JSONField(default=dict, blank=True)
+    extracted = models.JSONField(null=True, blank=True)
+    analysis = models.JSONField(null=True, blank=True)
+    developer = models.ForeignKey(Developer, null=True, blank=True, on_delete=models.SET_NULL, related_name="ingestion_jobs")
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    def __str__(self):
+        return f"{self.job_id} ({self.status})"
+
+
+class DevScoreEvent(models.Model):
+    """
+    Append-only log of every dev_score change. Replaying a developer's events in id
+    order reproduces their score, so scores can be rebuilt or re-weighted in bulk
+    (see HireMe.scoring.rebuild_dev_scores).
+    """
+    KINDS = [("baseline","baseline"), ("resume","resume"), ("submission","submission"), ("manual","manual")]
+    developer = models.ForeignKey(Developer, on_delete=models.CASCADE, related_name="score_events")
+    kind = models.CharField(max_length=16, choices=KINDS)
+    # baseline/resume/manual: the absolute score set; submission: the raw submission score
+    value = models.IntegerField()
+    max_score = models.IntegerField(null=True, blank=True)
+    submission = models.ForeignKey(Submission, null=True, blank=True, on_delete=models.SET_NULL)
+    score_after = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["developer", "id"], name="score_event_dev_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.value} -> {self.score_after} (developer {self.developer_id})"
+
+
+class LeaderboardSnapshot(models.Model):
+    """
+    Persisted copy of the in-process leaderboard (HireMe.leaderboard) so a new worker
+    starts from here and only replays DevScoreEvent rows after `last_event_id`.
+    `entries` = {"scores": [[developer_id, dev_score], ...], "skills": [[developer_id, [skill, ...]], ...]}.
+    """
+    last_event_id = models.BigIntegerField(default=0)
+    entries = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    def __str__(self):
+        return f"Leaderboard snapshot {self.id} (events <= {self.last_event_id})"
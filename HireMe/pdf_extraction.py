@@ -0,0 +1,147 @@
+import atexit
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from django.conf import settings
+
+from TalentAI import metrics
+
+# A PDF source is either a filesystem path or the raw bytes of the document.
+PDFSource = Union[str, bytes]
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.PDF_EXTRACT_WORKERS)
+        atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+    return _pool
+
+
+def _open(source: PDFSource):
+    # PyMuPDF takes ~0.1s to import; load it on first use, not at worker boot.
+    import fitz
+
+    if isinstance(source, str):
+        return fitz.open(source, filetype="pdf")
+    return fitz.open(stream=source, filetype="pdf")
+
+
+def _extract_page_range(source: PDFSource, start: int, stop: int, deadline: float) -> List[Tuple[int, str, float]]:
+    """
+    Extract pages [start, stop) and return (page_number, text, seconds) for each page
+    read before `deadline` (a time.time() timestamp, so it is valid across processes).
+    Runs inside pool workers, hence module level.
+    """
+    out = []
+    with _open(source) as doc:
+        for page_no in range(start, stop):
+            if time.time() >= deadline:
+                break
+            started = time.perf_counter()
+            page_text = doc[page_no].get_text("text")
+            out.append((page_no, page_text, time.perf_counter() - started))
+    return out
+
+
+def _resolve_source(attachment) -> PDFSource:
+    """Prefer the upload's temp file path (TemporaryUploadedFile) over copying its bytes."""
+    if hasattr(attachment, "temporary_file_path"):
+        try:
+            return attachment.temporary_file_path()
+        except Exception:
+            pass
+    attachment.seek(0)
+    return attachment.read()
+
+
+def extract_pdf(
+    attachment,
+    max_pages: Optional[int] = None,
+    timeout: Optional[float] = None,
+    parallel_min_pages: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Extract text from a PDF upload page by page.
+
+    Small documents are read on the calling thread. Documents with at least
+    `parallel_min_pages` pages are split into page ranges and extracted in a
+    process pool. Extraction stops at `max_pages` pages or after `timeout` seconds,
+    whichever comes first.
+
+    Args:
+        attachment (File): A Django UploadedFile (in-memory or temporary) or File object.
+
+    Returns:
+        dict:
+            - text (str): Non-empty pages joined in page order.
+            - page_count (int): Pages in the document.
+            - pages_extracted (int): Pages actually read.
+            - page_timings (dict): {page_number: seconds} for every page read.
+            - truncated (bool): True when the page or time cap cut extraction short.
+            - elapsed (float): Wall-clock seconds for the whole extraction.
+    """
+    max_pages = settings.PDF_MAX_PAGES if max_pages is None else max_pages
+    timeout = settings.PDF_EXTRACT_TIMEOUT_SECONDS if timeout is None else timeout
+    parallel_min_pages = settings.PDF_PARALLEL_MIN_PAGES if parallel_min_pages is None else parallel_min_pages
+
+    started = time.perf_counter()
+    deadline = time.time() + timeout
+    source = _resolve_source(attachment)
+
+    with _open(source) as doc:
+        page_count = doc.page_count
+    limit = min(page_count, max_pages)
+
+    pages: List[Tuple[int, str, float]] = []
+    if limit >= parallel_min_pages and settings.PDF_EXTRACT_WORKERS > 1:
+        step = settings.PDF_PAGES_PER_TASK
+        pool = _get_pool()
+        futures = [
+            pool.submit(_extract_page_range, source, start, min(start + step, limit), deadline)
+            for start in range(0, limit, step)
+        ]
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    pages.extend(future.result())
+                except Exception as e:
+                    logging.error(f"[extract_pdf] Page range failed: {e}")
+        for future in pending:
+            future.cancel()
+        pages.sort(key=lambda p: p[0])
+    else:
+        pages = _extract_page_range(source, 0, limit, deadline)
+
+    chunks = [text.strip() for _, text, _ in pages if text and text.strip()]
+    elapsed = time.perf_counter() - started
+    metrics.pdf_pages.inc(len(pages))
+    metrics.pdf_seconds.inc(elapsed)
+    return {
+        "text": "".join(chunk + "\n\n" for chunk in chunks),
+        "page_count": page_count,
+        "pages_extracted": len(pages),
+        "page_timings": {page_no: round(seconds, 6) for page_no, _, seconds in pages},
+        "truncated": len(pages) < page_count,
+        "elapsed": elapsed,
+    }
+
+
+def extract_pdf_file(path: str, max_pages: int, timeout: float) -> str:
+    """
+    Settings-free, single-process extraction of a PDF on disk, for callers that already
+    run in a worker pool (e.g. `manage.py import_resumes`). Same text format as extract_pdf.
+    """
+    with _open(path) as doc:
+        limit = min(doc.page_count, max_pages)
+    pages = _extract_page_range(path, 0, limit, time.time() + timeout)
+    return "".join(text.strip() + "\n\n" for _, text, _ in pages if text and text.strip())
@@ -0,0 +1,160 @@
+"""
+Conditional GET and serialized-response caching for polled read endpoints.
+
+Every cacheable payload depends on a few resources, e.g. ("developer", 7) or
+("project-recs", 3). Each resource has a version stamp in the response cache, and
+writes replace that stamp after they commit (invalidate()). A cached response
+stores the stamps it was built from. A request loads the entry and its current
+stamps in two cache reads. If they still match, it gets a 304 (If-None-Match /
+If-Modified-Since) or the cached body, without touching the ORM.
+
+Signals cover ordinary saves and deletes (HireMe.signals, Recruiter.signals).
+Bulk writes (update(), bulk_create, bulk_update) call invalidate() themselves.
+
+Stamps are only as shared as the cache behind settings.RESPONSE_CACHE_ALIAS. With a
+per-process LocMemCache, a write made in another worker would only show up once the
+entry's RESPONSE_CACHE_TIMEOUT expires, so caching is off by default unless the
+alias points at Redis or Memcached (see RESPONSE_CACHE_ENABLED in settings).
+"""
+import hashlib
+import threading
+import time
+import uuid
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+# ("developer", 7), ("project-recs", 3), ("catalog",) ...
+Resource = Tuple[Any, ...]
+
+# Skills and challenges are nested in every developer payload; they change rarely
+# (resume analysis, challenge upserts), so they share one stamp.
+CATALOG: Resource = ("catalog",)
+
+
+def _cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _version_key(resource: Resource) -> str:
+    return "rv:" + ":".join(str(part) for part in resource)
+
+
+def _new_version() -> Tuple[str, float]:
+    return uuid.uuid4().hex, time.time()
+
+
+def _bump(resources: Iterable[Resource]) -> None:
+    version = _new_version()
+    _cache().set_many({_version_key(r): version for r in resources}, timeout=None)
+
+
+_pending = threading.local()
+
+
+def invalidate(*resources: Resource) -> None:
+    """
+    Give the resources new version stamps once the current transaction commits
+    (immediately in autocommit). Stamps from one transaction are written together.
+    """
+    if not resources:
+        return
+    pending = getattr(_pending, "resources", None)
+    if pending is None:
+        pending = _pending.resources = set()
+    pending.update(resources)
+    transaction.on_commit(_flush_pending)
+
+
+def _flush_pending() -> None:
+    pending = getattr(_pending, "resources", None)
+    if not pending:
+        return
+    _pending.resources = set()
+    _bump(pending)
+
+
+def current_versions(resources: List[Resource]) -> Dict[str, Tuple[str, float]]:
+    """Stamps for `resources`; a resource that has none yet (or was evicted) gets one now."""
+    keys = [_version_key(r) for r in resources]
+    cache = _cache()
+    found = cache.get_many(keys)
+    missing = [k for k in keys if k not in found]
+    if missing:
+        for key in missing:
+            # add() leaves a stamp written concurrently by invalidate() in place.
+            cache.add(key, _new_version(), timeout=None)
+        found.update(cache.get_many(missing))
+    return found
+
+
+def _etag(entry_key: str, versions: Dict[str, Tuple[str, float]]) -> str:
+    digest = hashlib.sha1(entry_key.encode())
+    for key in sorted(versions):
+        digest.update(f"{key}={versions[key][0]};".encode())
+    return quote_etag(digest.hexdigest()[:32])
+
+
+def _last_modified(versions: Dict[str, Tuple[str, float]]) -> int:
+    return int(max((v[1] for v in versions.values()), default=time.time()))
+
+
+def _finish(request, response, etag: str, last_modified: int):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # Dashboards should always revalidate; a 304 costs no serialization.
+    patch_cache_control(response, private=True, no_cache=True)
+    return get_conditional_response(request, etag=etag, last_modified=last_modified, response=response)
+
+
+def cached_response(scope: str, dependencies: Callable[[Any], List[Resource]]):
+    """
+    Cache a detail view's 200 responses, keyed by `scope`, the pk, the query string
+    and the negotiated media type. `dependencies(pk)` lists the resources the payload
+    is built from. It runs only on a miss, so it may query the database.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if not settings.RESPONSE_CACHE_ENABLED or request.method not in ("GET", "HEAD"):
+                return view_method(self, request, *args, **kwargs)
+
+            pk = kwargs.get("pk")
+            entry_key = f"resp:{scope}:{pk}:{request.get_full_path()}:{getattr(request, 'accepted_media_type', '')}"
+            cache = _cache()
+
+            entry: Optional[Dict[str, Any]] = cache.get(entry_key)
+            if entry is not None:
+                versions = cache.get_many(list(entry["versions"]))
+                if versions == entry["versions"]:
+                    return _finish(request, Response(entry["data"]), entry["etag"], entry["last_modified"])
+
+            # Stamps are read before the payload, so a write that lands while it is
+            # built leaves the entry already stale rather than wrongly fresh.
+            try:
+                resources = dependencies(pk)
+            except (TypeError, ValueError):
+                # Malformed pk: let the view answer (404) uncached.
+                return view_method(self, request, *args, **kwargs)
+            versions = current_versions(resources)
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            etag = _etag(entry_key, versions)
+            last_modified = _last_modified(versions)
+            cache.set(
+                entry_key,
+                {"data": response.data, "versions": versions, "etag": etag, "last_modified": last_modified},
+                timeout=settings.RESPONSE_CACHE_TIMEOUT,
+            )
+            return _finish(request, response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
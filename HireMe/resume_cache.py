@@ -0,0 +1,134 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, Optional
+
+from django.db.models import F, Sum
+from django.utils.timezone import now
+
+from HireMe.models import ResumeAnalysis
+
+_WHITESPACE = re.compile(r"\s+")
+
+_stats_lock = threading.Lock()
+_stats = {"pdf_hits": 0, "text_hits": 0, "misses": 0, "stored": 0}
+
+
+def pdf_fingerprint(attachment) -> str:
+    """sha256 of the raw upload, read in chunks; leaves the file rewound."""
+    digest = hashlib.sha256()
+    attachment.seek(0)
+    if hasattr(attachment, "chunks"):
+        for chunk in attachment.chunks():
+            digest.update(chunk)
+    else:
+        digest.update(attachment.read())
+    attachment.seek(0)
+    return digest.hexdigest()
+
+
+def normalize_resume_text(text: str) -> str:
+    """Case-fold and collapse whitespace so re-exports of the same resume hash equally."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def text_fingerprint(text: str) -> str:
+    return hashlib.sha256(normalize_resume_text(text).encode("utf-8")).hexdigest()
+
+
+def _bump(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def _mark_hit(entry: ResumeAnalysis) -> None:
+    ResumeAnalysis.objects.filter(pk=entry.pk).update(hit_count=F("hit_count") + 1, last_hit_at=now())
+
+
+def lookup_by_pdf(pdf_hash: str) -> Optional[ResumeAnalysis]:
+    entry = ResumeAnalysis.objects.filter(pdf_hash=pdf_hash).first()
+    if entry:
+        _bump("pdf_hits")
+        _mark_hit(entry)
+    return entry
+
+
+def lookup_by_text(pdf_hash: str, text_hash: str) -> Optional[ResumeAnalysis]:
+    """
+    Match on normalized text. A hit also records the new PDF hash so the next
+    upload of this exact file is caught before extraction.
+    """
+    entry = ResumeAnalysis.objects.filter(text_hash=text_hash).order_by("-id").first()
+    if entry is None:
+        _bump("misses")
+        return None
+    _bump("text_hits")
+    _mark_hit(entry)
+    ResumeAnalysis.objects.get_or_create(
+        pdf_hash=pdf_hash,
+        defaults={
+            "text_hash": text_hash,
+            "resume_hash": entry.resume_hash,
+            "dev_score": entry.dev_score,
+            "skills": entry.skills,
+        },
+    )
+    return entry
+
+
+def store_analysis(pdf_hash: str, text_hash: str, resume_hash: str, result: Dict[str, Any]) -> None:
+    """
+    Remember an ai_analyze_resume result. Empty results and local fallback results
+    are not cached so the LLM gets another go next time.
+    """
+    if not result.get("skills") or result.get("source") == "local":
+        return
+    ResumeAnalysis.objects.update_or_create(
+        pdf_hash=pdf_hash,
+        defaults={
+            "text_hash": text_hash,
+            "resume_hash": resume_hash,
+            "dev_score": int(result.get("dev_score", 0) or 0),
+            "skills": result.get("skills", []),
+        },
+    )
+    _bump("stored")
+
+
+def cache_stats() -> Dict[str, Any]:
+    """In-process hit counters plus totals persisted on the cache table."""
+    with _stats_lock:
+        process = dict(_stats)
+    lookups = process["pdf_hits"] + process["text_hits"] + process["misses"]
+    hits = process["pdf_hits"] + process["text_hits"]
+    totals = ResumeAnalysis.objects.aggregate(total_hits=Sum("hit_count"))
+    return {
+        "process": {**process, "hit_rate": round(hits / lookups, 4) if lookups else 0.0},
+        "entries": ResumeAnalysis.objects.count(),
+        "total_hits": totals["total_hits"] or 0,
+    }
+
+
+def store_analyses(entries) -> int:
+    """
+    Bulk version of store_analysis for batch imports.
+    entries: iterable of (pdf_hash, text_hash, resume_hash, result). Returns rows written.
+    """
+    rows = [
+        ResumeAnalysis(
+            pdf_hash=pdf_hash,
+            text_hash=text_hash,
+            resume_hash=resume_hash,
+            dev_score=int(result.get("dev_score", 0) or 0),
+            skills=result.get("skills", []),
+        )
+        for pdf_hash, text_hash, resume_hash, result in entries
+        if result.get("skills") and result.get("source") != "local"
+    ]
+    if rows:
+        ResumeAnalysis.objects.bulk_create(rows, ignore_conflicts=True)
+        with _stats_lock:
+            _stats["stored"] += len(rows)
+    return len(rows)
@@ -0,0 +1,140 @@
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+
+try:
+    import zstandard
+except ImportError:  # optional; fall back to zlib
+    zstandard = None
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_text(text: str) -> Tuple[str, bytes]:
+    """
+    Returns:
+        tuple: (codec, compressed_bytes). zstd when the zstandard package is installed, else zlib.
+    """
+    raw = text.encode("utf-8")
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    return "zlib", zlib.compress(raw, ZLIB_LEVEL)
+
+
+def decompress_text(codec: str, blob: bytes) -> str:
+    blob = bytes(blob)  # BinaryField may hand back a memoryview
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Resume was stored with zstd but the zstandard package is not installed.")
+        return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return zlib.decompress(blob).decode("utf-8")
+
+
+class _LRUCache:
+    """Tiny thread-safe LRU keyed by content hash (the content for a hash never changes)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_text_cache = _LRUCache(settings.RESUME_TEXT_CACHE_SIZE)
+
+
+def store_resume(developer, text: str):
+    """Compress and upsert the developer's resume; returns the ResumeDocument."""
+    from HireMe.models import ResumeDocument
+
+    codec, blob = compress_text(text)
+    digest = content_hash(text)
+    doc, _ = ResumeDocument.objects.update_or_create(
+        developer=developer,
+        defaults={
+            "codec": codec,
+            "content": blob,
+            "content_hash": digest,
+            "original_size": len(text.encode("utf-8")),
+        },
+    )
+    _text_cache.put(digest, text)
+    return doc
+
+
+def load_resume_text(developer_id: int) -> Optional[str]:
+    """
+    Return the decoded resume text for a developer, or None if none is stored.
+    Only the hash is read first so cached texts never pull the blob from the DB.
+    """
+    from HireMe.models import ResumeDocument
+
+    row = (
+        ResumeDocument.objects.filter(developer_id=developer_id)
+        .values_list("codec", "content_hash")
+        .first()
+    )
+    if row is None:
+        return None
+    codec, digest = row
+    text = _text_cache.get(digest)
+    if text is not None:
+        return text
+
+    blob = ResumeDocument.objects.filter(developer_id=developer_id).values_list("content", flat=True).first()
+    if blob is None:
+        return None
+    text = decompress_text(codec, blob)
+    _text_cache.put(digest, text)
+    return text
+
+
+def copy_resume(developer, digest: str) -> bool:
+    """
+    Point the developer at an already-stored resume with the given content hash
+    without decoding it. Returns False if no stored resume has that hash.
+    """
+    from HireMe.models import ResumeDocument
+
+    if ResumeDocument.objects.filter(developer=developer, content_hash=digest).exists():
+        return True
+    source = (
+        ResumeDocument.objects.filter(content_hash=digest)
+        .values("codec", "content", "original_size")
+        .first()
+    )
+    if source is None:
+        return False
+    ResumeDocument.objects.update_or_create(
+        developer=developer,
+        defaults={**source, "content_hash": digest},
+    )
+    return True
@@ -0,0 +1,177 @@
+"""
+dev_score updates.
+
+Live updates are applied as one UPDATE with a database-side expression, so two
+submissions from the same developer can't overwrite each other, and each change is
+appended to DevScoreEvent. rebuild_dev_scores replays that log to recompute scores,
+optionally under a different rule.
+"""
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, FloatField, IntegerField, Value
+from django.db.models.expressions import ExpressionWrapper
+from django.db.models.functions import Cast, Floor, Greatest, Least, Round
+
+from HireMe import leaderboard
+from HireMe.models import DevScoreEvent, Developer, Submission
+from HireMe.response_cache import invalidate
+from TalentAI.tracing import traced
+
+
+def compute_new_dev_score(
+    current_dev_score: int,
+    submission_score: int,
+    challenge_max_score: int,
+    weight_current: float = 0.8,
+    weight_new: float = 0.2,
+) -> int:
+    """
+    Compute updated dev_score based on current score and normalized challenge performance.
+
+    Args:
+        current_dev_score (int): Current developer score (0–1000).
+        submission_score (int): Raw score for this challenge (0–max_score).
+        challenge_max_score (int): Maximum possible score for this challenge.
+        weight_current (float): Weight for existing score (default 0.8).
+        weight_new (float): Weight for new challenge performance (default 0.2).
+
+    Returns:
+        int: Updated developer score (0–1000).
+    """
+    if challenge_max_score <= 0:
+        normalized_score = 0
+    else:
+        normalized_score = (submission_score / challenge_max_score) * 1000
+
+    new_score = (current_dev_score * weight_current) + (normalized_score * weight_new)
+
+    # Clamp to 0–1000 range
+    return max(0, min(1000, int(round(new_score))))
+
+
+def _weighted(new_component: float):
+    return ExpressionWrapper(F("dev_score") * 0.8 + new_component * 0.2, output_field=FloatField())
+
+
+def _legacy_expression(score: int, max_score: int):
+    return Cast(Floor(_weighted(score)), IntegerField())
+
+
+def _normalized_expression(score: int, max_score: int):
+    normalized = (score / max_score) * 1000 if max_score > 0 else 0
+    return Greatest(Value(0), Least(Value(1000), Cast(Round(_weighted(normalized)), IntegerField())))
+
+
+class ScoreRule(NamedTuple):
+    # (current, submission_score, challenge_max_score) -> new score, for replays
+    apply: Callable[[int, int, int], int]
+    # (submission_score, challenge_max_score) -> expression over F("dev_score"), for live updates
+    expression: Callable[[int, int], object]
+
+
+RULES: Dict[str, ScoreRule] = {
+    "legacy": ScoreRule(lambda current, score, max_score: int(current * 0.8 + score * 0.2), _legacy_expression),
+    "normalized": ScoreRule(compute_new_dev_score, _normalized_expression),
+}
+
+
+def get_rule(name: Optional[str] = None) -> ScoreRule:
+    name = name or settings.DEV_SCORE_RULE
+    if name not in RULES:
+        raise ValueError(f"Unknown dev_score rule {name!r}; expected one of {sorted(RULES)}")
+    return RULES[name]
+
+
+@traced("db.apply_submission_score")
+def apply_submission_score(submission: Submission, rule: Optional[str] = None) -> int:
+    """
+    Fold an evaluated submission into its developer's dev_score. Only the UPDATE, a
+    read-back and the event insert run in the transaction. Returns the new score.
+    """
+    score = int(submission.score or 0)
+    max_score = submission.challenge.max_score
+    expression = get_rule(rule).expression(score, max_score)
+    developer_rows = Developer.objects.filter(pk=submission.developer_id)
+    with transaction.atomic():
+        developer_rows.update(dev_score=expression)
+        score_after = developer_rows.values_list("dev_score", flat=True).get()
+        DevScoreEvent.objects.create(
+            developer_id=submission.developer_id,
+            kind="submission",
+            value=score,
+            max_score=max_score,
+            submission=submission,
+            score_after=score_after,
+        )
+        leaderboard.notify_score_change()
+        invalidate(("developer", submission.developer_id))
+    return score_after
+
+
+def _record_scores(scores: Dict[int, int], kind: str) -> None:
+    DevScoreEvent.objects.bulk_create([
+        DevScoreEvent(developer_id=dev_id, kind=kind, value=score, score_after=score)
+        for dev_id, score in scores.items()
+    ])
+    leaderboard.notify_score_change()
+    invalidate(*(("developer", dev_id) for dev_id in scores))
+
+
+def record_resume_scores(scores: Dict[int, int]) -> None:
+    """Log dev_scores that were just set from a resume analysis. scores: {developer_id: dev_score}."""
+    _record_scores(scores, "resume")
+
+
+def record_manual_scores(scores: Dict[int, int]) -> None:
+    """Log dev_scores that were set directly, e.g. through a developer PUT/PATCH."""
+    _record_scores(scores, "manual")
+
+
+def replay(events: Iterable[DevScoreEvent], rule: ScoreRule) -> Optional[int]:
+    """Score after applying events (in id order) under `rule`; None if there are none."""
+    current = None
+    for event in events:
+        if event.kind == "submission":
+            current = rule.apply(current or 0, event.value, event.max_score or 0)
+        else:
+            current = event.value
+    return current
+
+
+def rebuild_dev_scores(rule: Optional[str] = None, batch_size: int = 500, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Recompute every developer's dev_score from the event log, a batch of developers at
+    a time. Developers without events keep their score.
+
+    Returns:
+        dict: {"developers": developers with events, "changed": scores that differ}
+    """
+    score_rule = get_rule(rule)
+    totals = {"developers": 0, "changed": 0}
+    last_id = 0
+    while True:
+        developers = list(Developer.objects.filter(id__gt=last_id).order_by("id").only("id", "dev_score")[:batch_size])
+        if not developers:
+            break
+        last_id = developers[-1].id
+
+        events: Dict[int, list] = {}
+        for event in DevScoreEvent.objects.filter(developer__in=developers).order_by("developer_id", "id"):
+            events.setdefault(event.developer_id, []).append(event)
+
+        changed = []
+        for dev in developers:
+            if dev.id not in events:
+                continue
+            totals["developers"] += 1
+            score = replay(events[dev.id], score_rule)
+            if score != dev.dev_score:
+                dev.dev_score = score
+                changed.append(dev)
+        totals["changed"] += len(changed)
+        if changed and not dry_run:
+            Developer.objects.bulk_update(changed, ["dev_score"])
+            invalidate(*(("developer", dev.id) for dev in changed))
+    return totals
@@ -0,0 +1,227 @@
+"""
+Full-text search over developers (skill names, bio, location and resume text).
+
+The index lives in a side table that is not a Django model because its shape is
+backend specific: an FTS5 virtual table on SQLite, a tsvector column with a GIN
+index on PostgreSQL. Other backends fall back to unranked icontains matching.
+The table is created by migration HireMe.0007 and kept current by HireMe.signals.
+"""
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import connection, transaction
+
+from HireMe.models import Developer, ResumeDocument
+from HireMe.resume_store import decompress_text
+
+TABLE = "hireme_developer_search"
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def _documents(developer_ids: Iterable[int]) -> List[Dict[str, str]]:
+    """
+    Index documents for a chunk of developers in three queries (developers, skills,
+    resumes). Resumes are decompressed here rather than through load_resume_text, so
+    one-off reads don't churn its LRU.
+    """
+    ids = list(developer_ids)
+    resumes = {
+        dev_id: decompress_text(codec, blob)
+        for dev_id, codec, blob in ResumeDocument.objects.filter(developer_id__in=ids).values_list(
+            "developer_id", "codec", "content"
+        )
+    }
+    docs = []
+    developers = Developer.objects.filter(id__in=ids).prefetch_related("skills")
+    for dev in developers.only("id", "bio", "location"):
+        docs.append({
+            "id": dev.id,
+            "skills": " ".join(sorted({s.name for s in dev.skills.all()})),
+            "bio": dev.bio or "",
+            "location": dev.location or "",
+            "resume": resumes.get(dev.id, ""),
+        })
+    return docs
+
+
+class SQLiteBackend:
+    """FTS5 table keyed by rowid = developer id, ranked with column-weighted bm25."""
+
+    # bm25 weights for (skills, bio, location, resume)
+    WEIGHTS = (4.0, 2.0, 1.0, 1.0)
+
+    create_sql = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+        "skills, bio, location, resume, tokenize = 'porter unicode61')"
+    ]
+    drop_sql = [f"DROP TABLE IF EXISTS {TABLE}"]
+
+    def upsert(self, cursor, docs: List[Dict[str, str]]) -> None:
+        ids = [(d["id"],) for d in docs]
+        cursor.executemany(f"DELETE FROM {TABLE} WHERE rowid = %s", ids)
+        cursor.executemany(
+            f"INSERT INTO {TABLE} (rowid, skills, bio, location, resume) VALUES (%s, %s, %s, %s, %s)",
+            [(d["id"], d["skills"], d["bio"], d["location"], d["resume"]) for d in docs],
+        )
+
+    def delete(self, cursor, ids: List[int]) -> None:
+        cursor.executemany(f"DELETE FROM {TABLE} WHERE rowid = %s", [(i,) for i in ids])
+
+    @staticmethod
+    def to_query(q: str) -> str:
+        # Quote every word so user input can't inject FTS5 syntax; prefix-match the last one.
+        words = _WORD.findall(q)
+        if not words:
+            return ""
+        terms = ['"%s"' % w for w in words[:-1]] + ['"%s"*' % words[-1]]
+        return " ".join(terms)
+
+    def search(self, cursor, q: str, limit: int, offset: int) -> Tuple[List[Tuple[int, float]], int]:
+        match = self.to_query(q)
+        if not match:
+            return [], 0
+        cursor.execute(f"SELECT count(*) FROM {TABLE} WHERE {TABLE} MATCH %s", [match])
+        total = cursor.fetchone()[0]
+        weights = ", ".join(str(w) for w in self.WEIGHTS)
+        cursor.execute(
+            f"SELECT rowid, bm25({TABLE}, {weights}) AS score FROM {TABLE} "
+            f"WHERE {TABLE} MATCH %s ORDER BY score LIMIT %s OFFSET %s",
+            [match, limit, offset],
+        )
+        # bm25 is lower-is-better; flip it so callers always sort by descending rank.
+        return [(row[0], -row[1]) for row in cursor.fetchall()], total
+
+
+class PostgresBackend:
+    """tsvector per developer (skills weighted A, bio B, location C, resume D) with a GIN index."""
+
+    create_sql = [
+        f"CREATE TABLE IF NOT EXISTS {TABLE} ("
+        "developer_id bigint PRIMARY KEY REFERENCES \"HireMe_developer\"(id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+        "document tsvector NOT NULL)",
+        f"CREATE INDEX IF NOT EXISTS {TABLE}_document_gin ON {TABLE} USING gin (document)",
+    ]
+    drop_sql = [f"DROP TABLE IF EXISTS {TABLE}"]
+
+    def upsert(self, cursor, docs: List[Dict[str, str]]) -> None:
+        cursor.executemany(
+            f"INSERT INTO {TABLE} (developer_id, document) VALUES (%s, "
+            "setweight(to_tsvector('english', %s), 'A') || setweight(to_tsvector('english', %s), 'B') || "
+            "setweight(to_tsvector('english', %s), 'C') || setweight(to_tsvector('english', %s), 'D')) "
+            "ON CONFLICT (developer_id) DO UPDATE SET document = EXCLUDED.document",
+            [(d["id"], d["skills"], d["bio"], d["location"], d["resume"]) for d in docs],
+        )
+
+    def delete(self, cursor, ids: List[int]) -> None:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE developer_id = ANY(%s)", [list(ids)])
+
+    def search(self, cursor, q: str, limit: int, offset: int) -> Tuple[List[Tuple[int, float]], int]:
+        if not _WORD.search(q):
+            return [], 0
+        cursor.execute(
+            f"SELECT count(*) FROM {TABLE} WHERE document @@ websearch_to_tsquery('english', %s)", [q]
+        )
+        total = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT developer_id, ts_rank_cd(document, query) AS score "
+            f"FROM {TABLE}, websearch_to_tsquery('english', %s) query "
+            f"WHERE document @@ query ORDER BY score DESC, developer_id DESC LIMIT %s OFFSET %s",
+            [q, limit, offset],
+        )
+        return [(row[0], float(row[1])) for row in cursor.fetchall()], total
+
+
+class FallbackBackend:
+    """Unindexed ORM matching for databases without a supported full-text engine."""
+
+    create_sql: List[str] = []
+    drop_sql: List[str] = []
+
+    def upsert(self, cursor, docs) -> None:
+        pass
+
+    def delete(self, cursor, ids) -> None:
+        pass
+
+    def search(self, cursor, q: str, limit: int, offset: int) -> Tuple[List[Tuple[int, float]], int]:
+        from django.db.models import Q
+
+        cond = Q()
+        for word in _WORD.findall(q):
+            cond &= Q(bio__icontains=word) | Q(location__icontains=word) | Q(skills__name__icontains=word)
+        if not cond:
+            return [], 0
+        ids = Developer.objects.filter(cond).distinct().order_by("-id").values_list("id", flat=True)
+        return [(i, 0.0) for i in ids[offset:offset + limit]], ids.count()
+
+
+def get_backend(vendor: str = None):
+    vendor = vendor or connection.vendor
+    if vendor == "sqlite":
+        return SQLiteBackend()
+    if vendor == "postgresql":
+        return PostgresBackend()
+    return FallbackBackend()
+
+
+def index_developers(developer_ids: Iterable[int]) -> int:
+    """(Re)index the given developers now. Returns the number of documents written."""
+    ids = sorted(set(developer_ids))
+    if not ids:
+        return 0
+    docs = _documents(ids)
+    backend = get_backend()
+    with connection.cursor() as cursor:
+        backend.upsert(cursor, docs)
+        missing = set(ids) - {d["id"] for d in docs}
+        if missing:
+            backend.delete(cursor, list(missing))
+    return len(docs)
+
+
+def remove_developers(developer_ids: Iterable[int]) -> None:
+    with connection.cursor() as cursor:
+        get_backend().delete(cursor, list(developer_ids))
+
+
+_pending = threading.local()
+
+
+def schedule_reindex(developer_id: int) -> None:
+    """
+    Queue a developer for reindexing when the current transaction commits. All
+    changes in one transaction (profile save, resume, skill links) collapse into a
+    single index write: the first callback to run flushes the whole set and the
+    rest find it empty. Ids left over by a rolled-back transaction are flushed on
+    the next commit, which is harmless (missing developers are dropped from the index).
+    """
+    ids = getattr(_pending, "ids", None)
+    if ids is None:
+        ids = _pending.ids = set()
+    ids.add(developer_id)
+    transaction.on_commit(_flush_pending)
+
+
+def _flush_pending() -> None:
+    ids = getattr(_pending, "ids", None)
+    if not ids:
+        return
+    _pending.ids = set()
+    try:
+        index_developers(ids)
+    except Exception:
+        logging.exception("[search] Failed to update search index")
+
+
+def search_developers(q: str, page: int = 1, page_size: int = 20) -> Dict[str, object]:
+    """
+    Returns:
+        dict: {"count": total_matches, "results": [(developer_id, score), ...]} best first.
+    """
+    page = max(1, page)
+    page_size = max(1, min(page_size, 100))
+    with connection.cursor() as cursor:
+        hits, total = get_backend().search(cursor, q, page_size, (page - 1) * page_size)
+    return {"count": total, "results": hits}
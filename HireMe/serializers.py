@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import Developer, Skill, Challenge, Submission
+from TalentAI.tracing import TracedListSerializer, TracedSerializerMixin
+from .models import Developer, Skill, Challenge, Submission, ResumeIngestionJob
 
 
 class ChallengeSerializer(serializers.ModelSerializer):
@@ -13,18 +14,26 @@ class SkillSerializer(serializers.ModelSerializer):
         model = Skill
         fields = "__all__"
 
-class DeveloperSerializer(serializers.ModelSerializer):
+class DeveloperSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     skills = SkillSerializer(many=True, required=False)
     class Meta:
         model = Developer
         fields = "__all__"
+        list_serializer_class = TracedListSerializer
 
 class ChallengeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Challenge
         fields = "__all__"
 
-class SubmissionSerializer(serializers.ModelSerializer):
+class SubmissionSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Submission
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+        list_serializer_class = TracedListSerializer
+
+class ResumeIngestionJobSerializer(TracedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = ResumeIngestionJob
+        fields = ("job_id", "email", "status", "stages", "developer", "error", "created_at", "updated_at")
+        list_serializer_class = TracedListSerializer
\ No newline at end of file
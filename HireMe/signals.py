@@ -0,0 +1,72 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from HireMe import leaderboard
+from HireMe.models import Challenge, DevScoreEvent, Developer, ResumeDocument, Skill
+from HireMe.response_cache import CATALOG, invalidate
+from HireMe.search import remove_developers, schedule_reindex
+
+
+@receiver(post_save, sender=Developer)
+def reindex_developer(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    # Score/status-only saves don't touch searchable text.
+    if update_fields and not {"bio", "location"} & set(update_fields):
+        return
+    schedule_reindex(instance.id)
+
+
+@receiver(post_save, sender=ResumeDocument)
+def reindex_resume(sender, instance, **kwargs):
+    schedule_reindex(instance.developer_id)
+
+
+@receiver(m2m_changed, sender=Developer.skills.through)
+def reindex_skills(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        schedule_reindex(instance.id)
+    else:
+        for dev_id in pk_set or []:
+            schedule_reindex(dev_id)
+
+
+@receiver(post_delete, sender=Developer)
+def unindex_developer(sender, instance, **kwargs):
+    remove_developers([instance.id])
+    leaderboard.forget_developer(instance.id)
+
+
+@receiver(post_save, sender=Developer)
+def log_starting_score(sender, instance, created, **kwargs):
+    # Puts new developers on the leaderboards; later changes are logged by HireMe.scoring.
+    if created:
+        DevScoreEvent.objects.create(
+            developer=instance, kind="baseline", value=instance.dev_score, score_after=instance.dev_score
+        )
+        leaderboard.notify_score_change()
+
+
+@receiver(post_save, sender=Developer)
+@receiver(post_delete, sender=Developer)
+def invalidate_developer(sender, instance, **kwargs):
+    invalidate(("developer", instance.id))
+
+
+@receiver(m2m_changed, sender=Developer.skills.through)
+def invalidate_developer_skills(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate(("developer", instance.id))
+    else:
+        invalidate(*(("developer", dev_id) for dev_id in pk_set or []))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=Challenge)
+@receiver(post_delete, sender=Challenge)
+def invalidate_catalog(sender, **kwargs):
+    invalidate(CATALOG)
@@ -1,3 +1,1012 @@
-from django.test import TestCase
+import base64
+import io
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from HireMe import async_views, ingestion, leaderboard, pdf_extraction, resume_cache, resume_store
+from HireMe.agents.skill_extractor import extract_skill_candidates, local_resume_analysis
+from HireMe.leaderboard import Leaderboard
+from HireMe.llm import LLMProvider, LatencyRouter, ProviderError, reset_router
+from HireMe.llm.providers import LocalStubProvider
+from HireMe.models import (
+    Challenge, DevScoreEvent, Developer, LeaderboardSnapshot, ResumeAnalysis, ResumeDocument, ResumeIngestionJob,
+    Skill, Submission,
+)
+from HireMe.bulk_persistence import persist_skill_payloads, unattached_skills_by_name
+from HireMe.scoring import apply_submission_score, compute_new_dev_score, rebuild_dev_scores, record_resume_scores
+from HireMe.search import index_developers, search_developers
+from HireMe.views import DeveloperViewSet
+from Recruiter.invitations import bulk_upsert_invitations
+from Recruiter.models import Invitation, Project
+from TalentAI import metrics, renderers, tracing
+from TalentAI.extract import contact_detector, message
+from TalentAI.startup import profile_boot
+
+
+class QueryPlanAssertions:
+    """
+    Fails when a hot-path query falls back to a full table scan (or an unindexed
+    sort). On PostgreSQL sequential scans are disabled for the check so an empty
+    test table doesn't make the planner prefer one.
+    """
+
+    SQLITE_FULL_SCAN = re.compile(r"\bSCAN \S+$|USE TEMP B-TREE FOR ORDER BY")
+
+    def assertUsesIndex(self, queryset, index=None):
+        if connection.vendor == "sqlite":
+            plan = queryset.explain()
+            bad = [line for line in plan.splitlines() if self.SQLITE_FULL_SCAN.search(line.strip())]
+        elif connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+            bad = [line for line in plan.splitlines() if "Seq Scan" in line]
+        else:
+            raise unittest.SkipTest(f"no query plan check for {connection.vendor}")
+        self.assertFalse(bad, f"full scan in plan for:\n{queryset.query}\n{plan}")
+        if index is not None:
+            self.assertIn(index, plan, f"{index} not used for:\n{queryset.query}")
+
+
+class HotPathQueryPlanTests(QueryPlanAssertions, TestCase):
+    def test_skill_by_name_and_challenge(self):
+        self.assertUsesIndex(Skill.objects.filter(name="Python", challenge_id=1))
+
+    def test_unattached_skill_by_lower_name(self):
+        self.assertUsesIndex(unattached_skills_by_name(["python", "go"]), index="skill_name_lower_idx")
+
+    def test_challenge_by_title(self):
+        self.assertUsesIndex(Challenge.objects.filter(title="Build a rate limiter"))
+
+    def test_developer_leaderboard(self):
+        self.assertUsesIndex(Developer.objects.order_by("-dev_score", "id")[:10])
+
+
+class FakeProvider(LLMProvider):
+    def __init__(self, name, failures=0):
+        self.name, self.failures, self.calls = name, failures, 0
+
+    def complete(self, messages, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ProviderError(f"{self.name} is down")
+        return f"from {self.name}", {}
+
+
+class LatencyRouterTests(SimpleTestCase):
+    def router(self, *providers, **kwargs):
+        return LatencyRouter(list(providers), retry_delay=0, **kwargs)
+
+    def test_prefers_the_faster_provider(self):
+        slow, fast = FakeProvider("slow"), FakeProvider("fast")
+        router = self.router(slow, fast)
+        self.assertEqual([p.name for p in router.ranked_providers()], ["slow", "fast"])  # unprobed: config order
+        router.record_success(slow, 2.0)
+        router.record_success(fast, 0.1)
+        self.assertEqual([p.name for p in router.ranked_providers()], ["fast", "slow"])
+        self.assertEqual(router.complete([])[2], "fast")
+
+    def test_falls_back_without_retrying_the_failed_provider_first(self):
+        primary, backup = FakeProvider("primary", failures=1), FakeProvider("backup")
+        with mock.patch("HireMe.llm.router.time.sleep") as sleep:
+            self.assertEqual(self.router(primary, backup).complete([]), ("from backup", {}, "backup"))
+        self.assertEqual((primary.calls, backup.calls), (1, 1))
+        sleep.assert_not_called()
+
+    def test_attempts_are_bounded_across_providers(self):
+        a, b = FakeProvider("a", failures=10), FakeProvider("b", failures=10)
+        router = self.router(a, b, max_attempts=3, failure_threshold=2)
+        with self.assertRaisesMessage(ProviderError, "All LLM providers failed"):
+            router.complete([])
+        self.assertEqual((a.calls, b.calls), (2, 1))
+        self.assertEqual({name: s["failures"] for name, s in router.snapshot().items()}, {"a": 2, "b": 1})
+        # "a" reached the failure threshold, so it is benched behind "b".
+        self.assertEqual([p.name for p in router.ranked_providers()], ["b", "a"])
+
+    def test_single_provider_retries_until_it_answers(self):
+        flaky = FakeProvider("flaky", failures=2)
+        self.assertEqual(self.router(flaky, max_attempts=3).complete([])[0], "from flaky")
+        self.assertEqual(flaky.calls, 3)
+
+    def test_unconfigured_providers_are_skipped(self):
+        missing = FakeProvider("missing")
+        missing.is_configured = lambda: False
+        with self.assertRaisesMessage(ValueError, "No LLM provider is configured"):
+            self.router(missing).complete([])
+
+    @override_settings(LLM_STUB_LATENCY_SECONDS=0)
+    def test_stub_provider_answers_known_flows_only(self):
+        stub = LocalStubProvider()
+        content, usage = stub.complete([{"role": "user", "content": "Analyse this resume_text"}])
+        self.assertIn("dev_score", json.loads(content))
+        self.assertEqual(usage["total_tokens"], usage["prompt_tokens"] + usage["completion_tokens"])
+        self.assertIn("score", json.loads(stub.complete([], flow="submission")[0]))
+        with self.assertRaises(ProviderError):
+            stub.complete([{"role": "user", "content": "hello"}])
+
+
+def make_pdf(pages, text="Resume page {}"):
+    import fitz
+
+    with fitz.open() as doc:
+        for page_no in range(pages):
+            doc.new_page().insert_text((72, 72), text.format(page_no))
+        return SimpleUploadedFile("resume.pdf", doc.tobytes(), content_type="application/pdf")
+
+
+class SkillExtractorTests(SimpleTestCase):
+    def skills(self, text):
+        return {c["name"]: c["evidence"] for c in extract_skill_candidates(text)}
+
+    def test_aliases_phrases_and_counts(self):
+        text = "Python/Django dev (python3, DRF). Built React Native apps and React.js sites; Postgres, K8s, CI/CD."
+        self.assertEqual(self.skills(text), {
+            "Python": 2, "Django": 2, "React Native": 1, "React": 1, "PostgreSQL": 1, "Kubernetes": 1, "CI/CD": 1,
+        })
+
+    def test_ambiguous_words_need_context(self):
+        prose = "Grade C in statistics, led R&D, grew NET income 20% and owned the Go-to-market plan. Let's go."
+        self.assertEqual(self.skills(prose), {})
+        self.assertEqual(
+            self.skills("C/C++, Golang, R language, .NET and ASP.NET"),
+            {"C": 1, "C++": 1, "Go": 1, "R": 1, ".NET": 2},
+        )
+
+    def test_local_analysis_is_conservative(self):
+        self.assertEqual(local_resume_analysis("Sales and marketing lead."), {"dev_score": 0, "skills": []})
+        analysis = local_resume_analysis("Python " * 40 + "Docker")
+        self.assertEqual([s["name"] for s in analysis["skills"]], ["Python", "Docker"])
+        self.assertLessEqual(max(s["level"] for s in analysis["skills"]), 80)
+        self.assertLessEqual(analysis["dev_score"], 600)
+
+
+class PDFExtractionTests(SimpleTestCase):
+    def test_page_cap(self):
+        result = pdf_extraction.extract_pdf(make_pdf(5), max_pages=2, parallel_min_pages=100)
+        self.assertEqual((result["page_count"], result["pages_extracted"], result["truncated"]), (5, 2, True))
+        self.assertEqual(result["text"], "Resume page 0\n\nResume page 1\n\n")
+        self.assertEqual(sorted(result["page_timings"]), [0, 1])
+
+    def test_time_cap(self):
+        result = pdf_extraction.extract_pdf(make_pdf(3), timeout=0, parallel_min_pages=100)
+        self.assertEqual((result["pages_extracted"], result["truncated"], result["text"]), (0, True, ""))
+
+    @override_settings(PDF_EXTRACT_WORKERS=2, PDF_PAGES_PER_TASK=3)
+    def test_process_pool_matches_serial_extraction(self):
+        def reset_pool():
+            if pdf_extraction._pool is not None:
+                pdf_extraction._pool.shutdown()
+            pdf_extraction._pool = None
+
+        reset_pool()
+        self.addCleanup(reset_pool)
+        upload = make_pdf(10)
+        serial = pdf_extraction.extract_pdf(upload, parallel_min_pages=100)
+        self.assertIsNone(pdf_extraction._pool)
+        parallel = pdf_extraction.extract_pdf(upload, parallel_min_pages=4)
+        self.assertIsNotNone(pdf_extraction._pool)
+        self.assertEqual(parallel["text"], serial["text"])
+        self.assertEqual((parallel["pages_extracted"], parallel["truncated"]), (10, False))
+        self.assertEqual(sorted(parallel["page_timings"]), list(range(10)))
+
+
+RESUME = "Zoë Müller — backend engineer.\nPython, PostgreSQL, 李雷 " * 50
+
+
+class ResumeStoreTests(TestCase):
+    def test_round_trip_for_each_codec(self):
+        codecs = [None] + ([] if resume_store.zstandard is None else ["zstd"])
+        for zstd in codecs:
+            with self.subTest(zstd=zstd), mock.patch.object(
+                resume_store, "zstandard", resume_store.zstandard if zstd else None
+            ):
+                codec, blob = resume_store.compress_text(RESUME)
+                self.assertEqual(codec, zstd or "zlib")
+                self.assertLess(len(blob), len(RESUME.encode("utf-8")))
+                self.assertEqual(resume_store.decompress_text(codec, memoryview(blob)), RESUME)
+
+    def test_store_and_load(self):
+        resume_store._text_cache.clear()
+        developer = Developer.objects.create(full_name="Zoë", email="zoe@example.com")
+        doc = resume_store.store_resume(developer, RESUME)
+        self.assertEqual((doc.content_hash, doc.original_size), (resume_store.content_hash(RESUME), len(RESUME.encode())))
+        with self.assertNumQueries(1):  # hash only; the text comes from the LRU
+            self.assertEqual(resume_store.load_resume_text(developer.id), RESUME)
+        resume_store._text_cache.clear()
+        with self.assertNumQueries(2):
+            self.assertEqual(resume_store.load_resume_text(developer.id), RESUME)
+        self.assertIsNone(resume_store.load_resume_text(developer.id + 1))
+
+
+class ResumeFingerprintCacheTests(TestCase):
+    ANALYSIS = {"dev_score": 610, "skills": [{"name": "Python", "level": 70}]}
+
+    def analyze(self, upload, result=ANALYSIS):
+        with mock.patch.object(ingestion, "ai_analyze_resume", return_value=result) as llm:
+            extracted = ingestion.extract_resume(upload)
+            analysis = ingestion.analyze_resume(extracted, {})
+        return extracted, analysis, llm.call_count
+
+    def test_miss_then_pdf_hit_then_text_hit(self):
+        upload = make_pdf(2)
+        extracted, analysis, llm_calls = self.analyze(upload)
+        self.assertIsNone(extracted["cached"])
+        self.assertEqual((analysis, llm_calls), (self.ANALYSIS, 1))
+        self.assertEqual(ResumeAnalysis.objects.count(), 1)
+
+        # Same file again: matched before extraction, no LLM call.
+        with mock.patch.object(ingestion, "read_pdf_text") as extract:
+            extracted, analysis, llm_calls = self.analyze(upload)
+        extract.assert_not_called()
+        self.assertEqual((extracted["resume_text"], extracted["cached"]["dev_score"]), ("", 610))
+        self.assertEqual((analysis, llm_calls), (self.ANALYSIS, 0))
+
+        # A different file with the same text (modulo case/whitespace) hits on the text
+        # fingerprint and remembers its own PDF hash for next time.
+        other = make_pdf(2, text="RESUME   PAGE {}")
+        extracted, analysis, llm_calls = self.analyze(other)
+        self.assertEqual((analysis, llm_calls), (self.ANALYSIS, 0))
+        self.assertTrue(ResumeAnalysis.objects.filter(pdf_hash=resume_cache.pdf_fingerprint(other)).exists())
+        self.assertEqual(ResumeAnalysis.objects.get(pdf_hash=extracted["pdf_hash"]).skills, self.ANALYSIS["skills"])
+
+    def test_local_fallback_results_are_not_cached(self):
+        fallback = {**self.ANALYSIS, "source": "local"}
+        upload = make_pdf(1)
+        self.assertEqual(self.analyze(upload, fallback)[2], 1)
+        self.assertEqual(self.analyze(upload, fallback)[2], 1)
+        self.assertFalse(ResumeAnalysis.objects.exists())
+
+
+@override_settings(RESUME_INGESTION_STAGE_RETRIES=2, RESUME_INGESTION_RETRY_DELAY=0)
+class IngestionJobTests(TestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        self.enterContext(override_settings(MEDIA_ROOT=media))
+
+    def job(self, upload):
+        job = ResumeIngestionJob(email="ada@example.com", profile={"full_name": "Ada", "email": "ada@example.com"})
+        job.upload.save("resume.pdf", upload, save=False)
+        job.save()
+        return ingestion.run_job(job.id)
+
+    def test_corrupt_pdf_fails_the_extraction_stage(self):
+        with mock.patch.object(ingestion, "ai_analyze_resume") as llm:
+            job = self.job(SimpleUploadedFile("resume.pdf", b"%PDF-1.4 not really"))
+        llm.assert_not_called()
+        self.assertEqual(job.status, "failed")
+        self.assertIn("Could not read the resume PDF", job.error)
+        self.assertEqual((job.stages["extraction"]["status"], job.stages["extraction"]["attempts"]), ("failed", 2))
+        self.assertIsNone(job.extracted)
+        self.assertFalse(Developer.objects.exists())
+
+    def test_stages_complete_and_persist_the_developer(self):
+        analysis = {"dev_score": 480, "skills": [{"name": "Go", "level": 60}]}
+        with mock.patch.object(ingestion, "ai_analyze_resume", return_value=analysis):
+            job = self.job(make_pdf(1))
+        self.assertEqual(job.status, "completed")
+        self.assertEqual({stage: state["status"] for stage, state in job.stages.items()},
+                         dict.fromkeys(ingestion.STAGES, "completed"))
+        self.assertNotIn("resume_text", job.extracted)
+        self.assertEqual((job.developer.dev_score, job.developer.skills.get().name), (480, "Go"))
+        self.assertEqual(resume_store.load_resume_text(job.developer.id), "Resume page 0\n\n")
+
+
+class CreateDeveloperTransactionTests(TransactionTestCase):
+    def post(self, **fields):
+        request = APIRequestFactory().post(
+            "/api/HireMe/developers/create_developer/",
+            {"full_name": "Ada", "email": "ada@example.com", "resume": make_pdf(1), **fields},
+            format="multipart",
+        )
+        return DeveloperViewSet.as_view({"post": "create_developer"})(request)
+
+    def test_llm_runs_outside_a_transaction(self):
+        in_transaction = []
+
+        def analyze(extracted, profile):
+            in_transaction.append(connection.in_atomic_block)
+            return {"dev_score": 480, "skills": []}
+
+        with mock.patch("HireMe.views.analyze_resume", side_effect=analyze):
+            response = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(in_transaction, [False])
+        self.assertEqual(Developer.objects.get().dev_score, 480)
+
+    def test_llm_failure_creates_no_developer(self):
+        with mock.patch("HireMe.views.analyze_resume", side_effect=RuntimeError("LLM down")):
+            response = self.post()
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(Developer.objects.exists())
+
+    def test_invalid_profile_is_a_bad_request(self):
+        with mock.patch("HireMe.views.analyze_resume") as analyze:
+            response = self.post(email="not-an-email")
+        self.assertEqual(response.status_code, 400)
+        analyze.assert_not_called()
+
+
+class ImportResumesCommandTests(TestCase):
+    def test_only_persisted_resumes_are_checkpointed(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        files = {
+            "a-good.pdf": make_pdf(1, text="Ada ada@example.com page {}").read(),
+            "b-corrupt.pdf": b"%PDF-1.4 not really",
+            "c-no-email.pdf": make_pdf(1).read(),
+            "d-llm-down.pdf": make_pdf(1, text="Grace grace@example.com page {}").read(),
+        }
+        for name, content in files.items():
+            with open(os.path.join(directory, name), "wb") as f:
+                f.write(content)
+        checkpoint = os.path.join(directory, "checkpoint")
+
+        def analyze(text, profile):
+            if "grace" in text:
+                raise RuntimeError("LLM unavailable")
+            return {"dev_score": 500, "skills": [{"name": "Python", "level": 60}]}
+
+        def run():
+            out, err = io.StringIO(), io.StringIO()
+            with mock.patch("HireMe.management.commands.import_resumes.ai_analyze_resume", side_effect=analyze):
+                call_command("import_resumes", directory, workers=1, checkpoint=checkpoint, stdout=out, stderr=err)
+            return out.getvalue()
+
+        self.assertIn("4 resumes found, 0 already imported, 4 to go", run())
+        with open(checkpoint) as f:
+            self.assertEqual(f.read().splitlines(), [os.path.join(directory, "a-good.pdf")])
+        self.assertEqual(list(Developer.objects.values_list("email", flat=True)), ["ada@example.com"])
+        # The rerun retries everything that wasn't persisted.
+        self.assertIn("4 resumes found, 1 already imported, 3 to go", run())
+
+
+class BulkSkillPersistenceTests(TestCase):
+    def payloads(self, developers, offset):
+        def skill(i, with_challenge):
+            challenge = {"title": f"Challenge {i}", "difficulty": "advanced", "time_limit": 45} if with_challenge else None
+            return {"name": f"Skill {i}", "level": 40 + offset, "validated": False, "challenge": challenge}
+
+        return {dev.id: [skill(i, i % 2 == 0) for i in range(offset, offset + 6)] for dev in developers}
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        developers = [Developer.objects.create(full_name=f"Dev {i}", email=f"dev{i}@example.com") for i in range(20)]
+
+        persist_skill_payloads(self.payloads(developers[:1], 0))
+        # From here on each batch both updates stored skills and creates new ones.
+        with CaptureQueriesContext(connection) as small:
+            persist_skill_payloads(self.payloads(developers[1:2], 3))
+        with self.assertNumQueries(len(small.captured_queries)):
+            links = persist_skill_payloads(self.payloads(developers, 6))
+        self.assertEqual(links, 20 * 6)
+
+        self.assertEqual(Challenge.objects.count(), 6)  # even skills 0..10
+        self.assertEqual(Skill.objects.count(), 12)
+        self.assertEqual(Skill.objects.get(name="Skill 7").level, 46)  # updated by the last batch
+        self.assertEqual(Skill.objects.get(name="Skill 8").challenge.title, "Challenge 8")
+        self.assertEqual(developers[0].skills.count(), 12)
+        self.assertEqual(developers[1].skills.count(), 9)
+        self.assertEqual(developers[5].skills.count(), 6)
+
+    def test_catalog_skills_match_case_insensitively(self):
+        developer = Developer.objects.create(full_name="Ada", email="ada@example.com")
+        python = Skill.objects.create(name="Python", level=50)
+        persist_skill_payloads({developer.id: [
+            {"name": "python", "level": 70},
+            {"name": "Go", "level": 60},
+            {"name": "GO", "level": 65},
+        ]})
+        self.assertEqual(Skill.objects.count(), 2)
+        python.refresh_from_db()
+        self.assertEqual((python.name, python.level), ("Python", 70))
+        self.assertEqual(Skill.objects.get(name="Go").level, 65)  # first spelling, last payload
+        self.assertEqual(sorted(developer.skills.values_list("name", flat=True)), ["Go", "Python"])
+
+
+class DevScoreUpdateTestsMixin:
+    SCORES = (90, 40, 100, 10, 75, 60)
+
+    def setUp(self):
+        self.developer = Developer.objects.create(full_name="Ada", email="ada@example.com", dev_score=500)
+        self.challenge = Challenge.objects.create(
+            title="Scoring challenge", description="", difficulty="intermediate", time_limit=60,
+            challenge_type="debugging", challenge_question="", max_score=100,
+        )
+        # Loaded up front, like request handlers that fetched the developer before scoring.
+        self.submissions = [
+            Submission.objects.select_related("developer", "challenge").get(pk=Submission.objects.create(
+                developer=self.developer, challenge=self.challenge, score=score, status="completed",
+            ).pk)
+            for score in self.SCORES
+        ]
+
+    def assertEveryUpdateApplied(self):
+        events = list(DevScoreEvent.objects.filter(developer=self.developer, kind="submission").order_by("id"))
+        self.assertEqual(len(events), len(self.SCORES))
+        expected = 500
+        for event in events:
+            expected = compute_new_dev_score(expected, event.value, 100)
+            self.assertEqual(event.score_after, expected)
+        self.developer.refresh_from_db()
+        self.assertEqual(self.developer.dev_score, expected)
+        self.assertEqual(rebuild_dev_scores(dry_run=True)["changed"], 0)
+
+
+@override_settings(DEV_SCORE_RULE="normalized")
+class DevScoreUpdateTests(DevScoreUpdateTestsMixin, TestCase):
+    def test_interleaved_updates_from_stale_objects_all_apply(self):
+        for submission in self.submissions:
+            self.assertEqual(submission.developer.dev_score, 500)  # stale by the second update
+            apply_submission_score(submission)
+        self.assertEveryUpdateApplied()
+
+
+@unittest.skipIf(connection.vendor == "sqlite", "SQLite serializes writers with table locks")
+@override_settings(DEV_SCORE_RULE="normalized")
+class ConcurrentDevScoreUpdateTests(DevScoreUpdateTestsMixin, TransactionTestCase):
+    def test_concurrent_updates_all_apply(self):
+        barrier = threading.Barrier(len(self.submissions))
+        errors = []
+
+        def apply(submission):
+            try:
+                barrier.wait()
+                apply_submission_score(submission)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=apply, args=(s,)) for s in self.submissions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEveryUpdateApplied()
+
+
+class SearchIndexTests(TestCase):
+    def developer(self, i, resume):
+        developer = Developer.objects.create(full_name=f"Dev {i}", email=f"dev{i}@example.com", bio="Backend engineer")
+        developer.skills.add(Skill.objects.create(name=f"Skill{i}", level=50))
+        resume_store.store_resume(developer, resume)
+        return developer
+
+    def test_reindexing_a_chunk_takes_constant_queries(self):
+        one = [self.developer(0, "Kafka streaming at scale").id]
+        many = one + [self.developer(i, f"Resume {i} with Terraform").id for i in range(1, 6)]
+        resume_store._text_cache.clear()
+
+        with CaptureQueriesContext(connection) as one_ctx:
+            index_developers(one)
+        with self.assertNumQueries(len(one_ctx.captured_queries)):
+            self.assertEqual(index_developers(many), 6)
+        self.assertIsNone(resume_store._text_cache.get(resume_store.content_hash("Kafka streaming at scale")))
+
+        self.assertEqual([dev_id for dev_id, _ in search_developers("kafka")["results"]], one)
+        self.assertEqual(search_developers("terraform")["count"], 5)
+        self.assertEqual(search_developers("skill3")["count"], 1)
+
+
+class MoveResumeTextMigrationTests(TransactionTestCase):
+    before = [("HireMe", "0002_resumedocument")]
+    after = [("HireMe", "0003_move_resume_text")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_base64_and_plain_resumes_move_compressed_and_back(self):
+        apps = self.migrate(self.before)
+        OldDeveloper = apps.get_model("HireMe", "Developer")
+        encoded = OldDeveloper.objects.create(
+            full_name="Ada", email="ada@example.com", resume=base64.b64encode(RESUME.encode()).decode(),
+        )
+        plain = OldDeveloper.objects.create(full_name="Grace", email="grace@example.com", resume="not base64!")
+        OldDeveloper.objects.create(full_name="Linus", email="linus@example.com", resume="")
+
+        apps = self.migrate(self.after)
+        docs = {d.developer_id: d for d in apps.get_model("HireMe", "ResumeDocument").objects.all()}
+        self.assertEqual(set(docs), {encoded.id, plain.id})
+        self.assertEqual(resume_store.decompress_text(docs[encoded.id].codec, docs[encoded.id].content), RESUME)
+        self.assertEqual(docs[encoded.id].content_hash, resume_store.content_hash(RESUME))
+        self.assertEqual(resume_store.decompress_text(docs[plain.id].codec, docs[plain.id].content), "not base64!")
+
+        apps = self.migrate(self.before)
+        restored = apps.get_model("HireMe", "Developer").objects.get(id=encoded.id)
+        self.assertEqual(base64.b64decode(restored.resume).decode(), RESUME)
+
+
+class LeaderboardTests(SimpleTestCase):
+    def test_matches_sorted_order(self):
+        rng = random.Random(7)
+        board, scores = Leaderboard(), {}
+        for _ in range(5000):
+            dev_id = rng.randint(1, 800)
+            if rng.random() < 0.1:
+                board.remove(dev_id)
+                scores.pop(dev_id, None)
+            else:
+                scores[dev_id] = rng.randint(0, 1000)
+                board.set(dev_id, scores[dev_id])
+
+        expected = sorted(scores, key=lambda d: (-scores[d], d))
+        self.assertEqual([dev_id for _, dev_id, _ in board.entries(1, len(expected))], expected)
+        self.assertEqual([dev_id for _, dev_id, _ in board.entries(41, 10)], expected[40:50])
+        for position, dev_id in enumerate(expected, start=1):
+            self.assertEqual(board.rank(dev_id), position)
+        self.assertIsNone(board.rank(10_000))
+        self.assertEqual(board.entries(len(expected) + 1, 5), [])
+
+
+@override_settings(LEADERBOARD_REFRESH_SECONDS=3600)
+class LeaderboardSyncTests(TestCase):
+    def setUp(self):
+        self.developers = [
+            Developer.objects.create(full_name=f"Dev {i}", email=f"dev{i}@example.com", dev_score=100 * i)
+            for i in range(1, 4)
+        ]
+        leaderboard.reset()
+        self.addCleanup(leaderboard.reset)
+
+    def test_first_read_replays_events_without_writing_a_snapshot(self):
+        with self.assertLogs(level="WARNING"):
+            board = leaderboard.top(limit=10)
+        self.assertEqual([dev_id for _, dev_id, _ in board["entries"]], [d.id for d in reversed(self.developers)])
+        self.assertFalse(LeaderboardSnapshot.objects.exists())
+
+    def test_dirty_read_only_reads_events_above_the_watermark(self):
+        with self.assertLogs(level="WARNING"):
+            leaderboard.save_snapshot()
+        watermark = DevScoreEvent.objects.order_by("-id").values_list("id", flat=True).first()
+        Developer.objects.filter(id=self.developers[0].id).update(dev_score=900)
+        record_resume_scores({self.developers[0].id: 900})
+        leaderboard.mark_dirty()
+
+        with CaptureQueriesContext(connection) as ctx:
+            board = leaderboard.top(limit=1)
+        self.assertEqual(board["entries"][0][1], self.developers[0].id)
+        event_reads = [q["sql"] for q in ctx.captured_queries if "devscoreevent" in q["sql"].lower()]
+        self.assertIn(f'"id" > {watermark} ', event_reads[0])
+
+    def test_patch_moves_the_developers_rank(self):
+        with self.assertLogs(level="WARNING"):
+            leaderboard.save_snapshot()
+        last = self.developers[0]
+        self.assertEqual(leaderboard.rank_of(last.id)["rank"], 3)
+
+        request = APIRequestFactory().patch(f"/api/HireMe/developers/{last.id}/", {"dev_score": 950}, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = DeveloperViewSet.as_view({"patch": "partial_update"})(request, pk=str(last.id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(leaderboard.rank_of(last.id)["rank"], 1)
+        self.assertEqual(DevScoreEvent.objects.filter(developer=last).latest("id").kind, "manual")
+        self.assertEqual(LeaderboardSnapshot.objects.count(), 1)
+
+
+@override_settings(LLM_PROVIDERS=["stub"])
+class AsyncSubmitChallengeTests(TestCase):
+    def setUp(self):
+        reset_router()
+        self.addCleanup(reset_router)
+        self.developer = Developer.objects.create(full_name="Ada", email="ada@example.com", dev_score=500)
+        self.challenge = Challenge.objects.create(
+            title="Async challenge", description="", difficulty="intermediate", time_limit=60,
+            challenge_type="debugging", challenge_question="", max_score=100,
+        )
+
+    async def test_evaluates_and_scores(self):
+        request = AsyncRequestFactory().post(
+            "/api/HireMe/async/developers/submit_challenge/",
+            {"developer": self.developer.id, "challenge": self.challenge.id, "answer": "fix"},
+            content_type="application/json",
+        )
+        response = await async_views.submit_challenge(request)
+        self.assertEqual(response.status_code, 201)
+        body = json.loads(response.content)["body"]
+        self.assertEqual((body["status"], body["score"]), ("completed", 70))
+        self.assertEqual(await Submission.objects.filter(status="completed").acount(), 1)
+        await self.developer.arefresh_from_db()
+        self.assertEqual(self.developer.dev_score, int(500 * 0.8 + 70 * 0.2))
+
+
+@override_settings(LLM_PROVIDERS=["stub"])
+class AsyncCreateDeveloperTests(TestCase):
+    def setUp(self):
+        reset_router()
+        self.addCleanup(reset_router)
+
+    def post(self, **fields):
+        request = AsyncRequestFactory().post(
+            "/api/HireMe/async/developers/create_developer/",
+            {"full_name": "Ada", "resume": make_pdf(1, "Python developer, ada@example.com"), **fields},
+        )
+        return async_views.create_developer(request)
+
+    async def test_creates_and_analyses(self):
+        response = await self.post(email="ada@example.com")
+        self.assertEqual(response.status_code, 201, response.content)
+        developer = await Developer.objects.aget(email="ada@example.com")
+        self.assertEqual(json.loads(response.content)["body"]["id"], developer.id)
+        self.assertTrue(await ResumeDocument.objects.filter(developer=developer).aexists())
+
+        # A second upload for the same email updates that developer.
+        response = await self.post(email="ada@example.com", full_name="Someone else")
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(await Developer.objects.acount(), 1)
+
+    async def test_invalid_profile_is_a_bad_request(self):
+        response = await self.post(email="not-an-email")
+        self.assertEqual(response.status_code, 400, response.content)
+        body = json.loads(response.content)
+        self.assertEqual(body["message"], "Invalid developer data")
+        self.assertIn("email", body["body"])
+        self.assertFalse(await Developer.objects.aexists())
+
+    async def test_missing_resume(self):
+        request = AsyncRequestFactory().post(
+            "/api/HireMe/async/developers/create_developer/", {"email": "ada@example.com"}
+        )
+        response = await async_views.create_developer(request)
+        self.assertEqual(response.status_code, 400)
+
+
+class FetchSubmissionsTests(TestCase):
+    def setUp(self):
+        challenge = Challenge.objects.create(
+            title="Feed challenge", description="", difficulty="intermediate", time_limit=60,
+            challenge_type="debugging", challenge_question="", max_score=100,
+        )
+        self.ada = Developer.objects.create(full_name="Ada", email="ada@example.com")
+        grace = Developer.objects.create(full_name="Grace", email="grace@example.com")
+        self.ids = [
+            Submission.objects.create(
+                developer=self.ada if i % 3 else grace, challenge=challenge, answer=f"answer {i}",
+                status="completed" if i % 2 else "evaluating",
+            ).id
+            for i in range(8)
+        ]
+        self.view = DeveloperViewSet.as_view({"get": "fetch_submissions"})
+
+    def get(self, **params):
+        response = self.view(APIRequestFactory().get("/api/HireMe/developers/fetch_submissions/", params))
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+    def test_keyset_pages_cover_every_row_once(self):
+        seen, cursor = [], None
+        while True:
+            body = json.loads(self.get(limit=3, **({"cursor": cursor} if cursor else {})).content)
+            seen += [row["id"] for row in body["results"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+            self.assertEqual(cursor, seen[-1])
+        self.assertEqual(seen, sorted(self.ids, reverse=True))
+
+    def test_filters_combine_with_the_cursor(self):
+        body = json.loads(self.get(developer=self.ada.id, status="completed", limit=2).content)
+        expected = [i for n, i in enumerate(self.ids) if n % 3 and n % 2][::-1]
+        self.assertEqual([row["id"] for row in body["results"]], expected[:2])
+        rest = json.loads(self.get(developer=self.ada.id, status="completed", cursor=body["next_cursor"]).content)
+        self.assertEqual([row["id"] for row in rest["results"]], expected[2:])
+        self.assertIsNone(rest["next_cursor"])
+        self.assertEqual(self.get(created_after="not-a-date").status_code, 400)
+        self.assertEqual(self.get(cursor="abc").status_code, 400)
+
+    def test_ndjson_export_streams_every_match(self):
+        response = self.get(export="ndjson", cursor=self.ids[-1])
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["id"] for row in rows], sorted(self.ids[:-1], reverse=True))
+        self.assertEqual(rows[-1]["answer"], "answer 0")
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ConditionalDeveloperGetTests(TestCase):
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE_ALIAS].clear()
+        self.developer = Developer.objects.create(full_name="Grace", email="grace@example.com")
+        self.view = DeveloperViewSet.as_view({"get": "retrieve"})
+
+    def get(self, **headers):
+        request = APIRequestFactory().get(f"/api/HireMe/developers/{self.developer.id}/", **headers)
+        response = self.view(request, pk=str(self.developer.id))
+        if hasattr(response, "render"):  # 304s are plain HttpResponses
+            response.render()
+        return response
+
+    def test_revalidates_without_queries_until_the_developer_changes(self):
+        first = self.get()
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+            cached = self.get()
+        self.assertEqual((cached.status_code, cached["ETag"], cached.data), (200, etag, first.data))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.developer.full_name = "Grace Hopper"
+            self.developer.save()
+        changed = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+        self.assertEqual(changed.data["full_name"], "Grace Hopper")
+
+
+@unittest.skipIf(renderers.orjson is None, "orjson is not installed")
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_stock_renderer(self):
+        data = ReturnDict({
+            "at": datetime(2025, 3, 1, 12, 30, 5, 123456, tzinfo=dt_timezone.utc),
+            "naive": datetime(2025, 3, 1, 12, 30),
+            "day": date(2025, 3, 1),
+            "clock": dt_time(9, 15, 0, 500000),
+            "took": timedelta(seconds=90),
+            "budget": Decimal("1250.50"),
+            "label": gettext_lazy("Not Available"),
+            "id": uuid.UUID(int=7),
+            "text": "Zoë \u2028 李雷 \u2029 \"quoted\"",
+            "floats": [0.1, 2.0, 1e16, 123456789.123],
+            "big": 2 ** 70,
+            "keys": {1: "int", None: "none"},
+            "nested": [{"ok": True, "none": None}, ()],
+        }, serializer=None)
+        self.assertEqual(renderers.ORJSONRenderer().render(data), JSONRenderer().render(data))
+        # Indented output falls back to the stock renderer.
+        media = "application/json; indent=4"
+        self.assertEqual(renderers.ORJSONRenderer().render(data, media), JSONRenderer().render(data, media))
+
+    def test_parser_matches_stock_parser(self):
+        body = json.dumps({"developer_ids": [1, 2, 3], "message": "Olá \u2028", "big": 2 ** 70, "x": 1.5}).encode()
+        self.assertEqual(renderers.ORJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+        for bad in (b"{", b'{"x": NaN}'):
+            with self.assertRaisesMessage(ParseError, "JSON parse error"):
+                renderers.ORJSONParser().parse(io.BytesIO(bad))
+
+
+class WorkerStartupTests(SimpleTestCase):
+    def test_boot_stays_within_budget_without_heavy_imports(self):
+        profile = profile_boot("wsgi", importtime=False)
+        self.assertEqual(profile["heavy"], [], "import these on first use, not at module level")
+        self.assertLess(profile["seconds"], settings.STARTUP_BUDGET_SECONDS)
+
+
+class TracingTests(SimpleTestCase):
+    def setUp(self):
+        self.exported = []
+        patcher = mock.patch.dict(tracing.EXPORTERS, {"memory": self.exported.append})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(TRACING_EXPORTERS=["memory"])
+    def test_nested_spans_share_the_trace_and_export_with_the_root(self):
+        @tracing.traced("work")
+        def work():
+            with tracing.span("inner", size=3):
+                pass
+            raise ValueError("boom")
+
+        with tracing.start_trace("request", sample_rate=1) as root:
+            with self.assertRaises(ValueError):
+                work()
+            self.assertEqual(self.exported, [])
+
+        (spans,) = self.exported
+        by_name = {s.name: s for s in spans}
+        self.assertEqual([s.name for s in spans], ["request", "work", "inner"])
+        self.assertEqual({s.trace.trace_id for s in spans}, {root.trace.trace_id})
+        self.assertIsNone(by_name["request"].parent_id)
+        self.assertEqual(by_name["work"].parent_id, by_name["request"].span_id)
+        self.assertEqual(by_name["inner"].parent_id, by_name["work"].span_id)
+        self.assertEqual(by_name["work"].error, "ValueError: boom")
+        self.assertEqual(by_name["inner"].attributes, {"size": 3})
+
+        otlp = tracing.otlp_payload(spans)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(otlp[2]["parentSpanId"], by_name["work"].span_id)
+        self.assertEqual(otlp[1]["status"], {"code": 2, "message": "ValueError: boom"})
+
+    def test_unsampled_work_gets_the_shared_noop_span(self):
+        with tracing.start_trace("request", sample_rate=0) as root:
+            self.assertIs(root, tracing.NOOP_SPAN)
+            self.assertIs(tracing.span("inner"), tracing.NOOP_SPAN)
+        self.assertIs(tracing.span("outside"), tracing.NOOP_SPAN)
+        self.assertEqual(self.exported, [])
+
+
+class ContactDetectorTests(SimpleTestCase):
+    def fields(self, text):
+        return {
+            field: (value["present"], value["confidence"])
+            for field, value in contact_detector.classify_contacts(text).items()
+        }
+
+    def test_clear_hits(self):
+        result = contact_detector.classify_contacts(
+            "Mail ada@example.com, call +44 20 7946 0958, see https://www.linkedin.com/in/ada-l"
+        )
+        self.assertEqual(result["email"]["match"], "ada@example.com")
+        self.assertEqual(result["phone"]["match"], "+44 20 7946 0958")
+        self.assertEqual(result["linkedin"]["match"], "https://www.linkedin.com/in/ada-l")
+        for field in contact_detector.FIELDS:
+            self.assertEqual((result[field]["present"], result[field]["confidence"]), (True, contact_detector.HIT))
+
+    def test_ambiguous_and_negative_cases(self):
+        maybe = contact_detector.MAYBE
+        self.assertEqual(self.fields("ada [at] example [dot] com")["email"], (False, maybe))
+        self.assertEqual(self.fields("I'm on LinkedIn")["linkedin"], (False, maybe))
+        self.assertEqual(self.fields("call 555-2671")["phone"], (False, maybe))
+        self.assertEqual(self.fields("order 12345678")["phone"], (False, contact_detector.MISS))
+        self.assertEqual(self.fields("Experience: 2019 - 2021")["phone"], (False, contact_detector.MISS))
+        self.assertEqual(self.fields("Worked 2020-2023 at Acme")["phone"], (False, contact_detector.MISS))
+        self.assertEqual(self.fields("call 555-12345")["phone"], (False, maybe))  # punctuated 8 digits
+        self.assertEqual(self.fields("id 4155552671")["phone"], (True, 0.7))  # bare digits: could be an id
+        self.assertEqual(self.fields("(415) 555-2671")["phone"], (True, 0.9))
+        self.assertEqual(self.fields("born 2024-01-15")["phone"], (False, contact_detector.MISS))
+        self.assertEqual(set(self.fields("nothing here").values()), {(False, contact_detector.MISS)})
+
+    def test_needs_llm_follows_the_policy(self):
+        clear = contact_detector.classify_contacts("ada@example.com")
+        vague = contact_detector.classify_contacts("ada at example dot com")
+        self.assertFalse(contact_detector.needs_llm(clear, "ambiguous", 0.9))
+        self.assertTrue(contact_detector.needs_llm(vague, "ambiguous", 0.9))
+        self.assertFalse(contact_detector.needs_llm(vague, "never", 0.9))
+        self.assertTrue(contact_detector.needs_llm(clear, "always", 0.9))
+
+    def test_merge_lets_the_llm_decide_only_unsure_fields(self):
+        classified = contact_detector.classify_contacts("ada@example.com, find me on linkedin")
+        merged = contact_detector.merge(classified, {"email": False, "phone": True, "linkedin": True}, 0.9)
+        self.assertEqual((merged["email"], merged["phone"], merged["linkedin"]), (True, False, True))
+        self.assertEqual(merged["source"], "llm")
+        self.assertEqual(merged["confidence"]["linkedin"], 0.8)
+
+        local = contact_detector.merge(classified, None, 0.9)
+        self.assertEqual((local["linkedin"], local["source"]), (False, "local"))
+
+
+CONTACT_CONFIG = {"CONTACT_LLM_POLICY": "ambiguous", "CONTACT_MIN_CONFIDENCE": 0.9}
+
+
+class ContactMessageTests(SimpleTestCase):
+    def setUp(self):
+        self.enterContext(mock.patch.object(message, "get_config", return_value=CONTACT_CONFIG))
+        self.stored = []
+        self.enterContext(mock.patch.object(message, "store_texts", side_effect=self.store_texts))
+        self.send_email = self.enterContext(mock.patch.object(message, "send_email"))
+        self.send_sms = self.enterContext(mock.patch.object(message, "send_sms"))
+
+    def store_texts(self, texts):
+        texts = list(texts)
+        self.stored.extend(texts)
+        return len(texts)
+
+    def test_extract_email_and_phone(self):
+        text = "Mail ada@example.com or call +1 415 555 2671 today"
+        self.assertEqual(message.extract_email(text), "ada@example.com")
+        self.assertEqual(message.extract_phone(text), "+1 415 555 2671")
+        self.assertIsNone(message.extract_email("no contact here"))
+        self.assertIsNone(message.extract_phone("call me maybe"))
+
+    def test_clear_contacts_skip_the_llm_and_notify(self):
+        with mock.patch.object(message, "llm_detect_contacts") as llm, self.assertLogs(level="INFO"):
+            result = message.detect_and_store("Reach me at ada@example.com or +14155552671", message="Hi")
+        llm.assert_not_called()
+        self.assertEqual(self.stored, ["Reach me at ada@example.com or +14155552671"])
+        self.assertEqual((result["email"], result["phone"], result["linkedin"]), (True, True, False))
+        self.assertEqual(result["source"], "local")
+        self.send_email.assert_called_once_with("ada@example.com", "Hi")
+        self.send_sms.assert_called_once_with("+14155552671", "Hi")
+
+    def test_ambiguous_text_asks_the_llm(self):
+        with mock.patch.object(message, "llm_detect_contacts", return_value={"email": True, "phone": False, "linkedin": True}) as llm:
+            result = message.detect_contacts("find me on linkedin, ada at example dot com")
+        llm.assert_called_once()
+        self.assertEqual((result["email"], result["linkedin"], result["source"]), (True, True, "llm"))
+
+    def test_unusable_llm_reply_is_not_stored(self):
+        texts = ["ada@example.com", "nothing to see"]
+        with mock.patch.object(message, "llm_detect_contacts", return_value=None), \
+                mock.patch.object(message, "get_config", return_value={**CONTACT_CONFIG, "CONTACT_LLM_POLICY": "always"}):
+            results = message.detect_and_store_many(texts)
+        self.assertEqual(results, [None, None])
+        self.assertEqual(self.stored, [])
+        self.send_email.assert_not_called()
+
+    def test_bad_llm_json_is_logged(self):
+        client = mock.MagicMock()
+        client.chat.completions.create.return_value.choices[0].message.content = "not json"
+        with mock.patch.object(message, "get_llm_client", return_value=client), self.assertLogs(level="WARNING") as logs:
+            self.assertIsNone(message.llm_detect_contacts("ada@example.com"))
+        self.assertIn("not json", logs.output[0])
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        self.jobs = metrics.Counter("test_jobs_total", "Test counter.", ("kind",))
+        self.latency = metrics.Histogram("test_latency_seconds", "Test histogram.", buckets=(0.1, 1.0))
+        self.addCleanup(metrics.REGISTRY.pop, "test_jobs_total")
+        self.addCleanup(metrics.REGISTRY.pop, "test_latency_seconds")
+
+    def samples(self, prefix="test_"):
+        with self.assertNoLogs(level="ERROR"):  # a failing gauge is logged and skipped
+            text = metrics.render()
+        return {
+            name: float(value)
+            for name, value in (line.rsplit(" ", 1) for line in text.splitlines() if line.startswith(prefix))
+        }
+
+    def test_database_gauges(self):
+        project = Project.objects.create(project_name="Payments")
+        developers = [Developer.objects.create(full_name=f"Dev {i}", email=f"dev{i}@example.com") for i in range(2)]
+        bulk_upsert_invitations(project, [d.id for d in developers])
+        Invitation.objects.filter(developer=developers[0]).update(
+            sent_at=now() - timedelta(hours=settings.INVITATION_TTL_HOURS + 1)
+        )
+        ResumeIngestionJob.objects.create(email="ada@example.com", status="queued")
+        ResumeIngestionJob.objects.create(email="bob@example.com", status="completed")
+
+        samples = {**self.samples("outbox_"), **self.samples("invitation_"), **self.samples("resume_ingestion_")}
+        self.assertEqual(samples["outbox_queue_depth"], 2)
+        self.assertEqual(samples["invitation_expiry_backlog"], 1)
+        self.assertEqual(samples['resume_ingestion_jobs{status="queued"}'], 1)
+        self.assertEqual(samples['resume_ingestion_jobs{status="persisting"}'], 0)
+
+    def test_merges_threads_and_other_worker_processes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with override_settings(METRICS_DIR=directory, METRICS_FLUSH_SECONDS=3600):
+            self.jobs.inc(kind="a")
+            self.latency.observe(0.05)
+            worker = threading.Thread(target=lambda: (self.jobs.inc(2, kind="a"), self.latency.observe(5)))
+            worker.start()
+            worker.join()
+
+            # Pretend the totals so far were flushed by another gunicorn worker. This
+            # process still holds them too, so everything before the flush counts twice.
+            metrics.flush()
+            os.rename(metrics._process_file(), os.path.join(directory, "1-0.json"))
+            self.jobs.inc(kind="b")
+
+            samples = self.samples()
+
+        self.assertEqual(samples['test_jobs_total{kind="a"}'], 2 * 3)
+        self.assertEqual(samples['test_jobs_total{kind="b"}'], 1)
+        self.assertEqual(samples['test_latency_seconds_bucket{le="0.1"}'], 2 * 1)
+        self.assertEqual(samples['test_latency_seconds_bucket{le="1.0"}'], 2 * 1)
+        self.assertEqual(samples['test_latency_seconds_bucket{le="+Inf"}'], 2 * 2)
+        self.assertEqual(samples["test_latency_seconds_count"], 2 * 2)
@@ -1,10 +1,13 @@
 from rest_framework import routers
 from django.urls import path, include
+from . import async_views
 from .views import DeveloperViewSet
 
 router = routers.DefaultRouter()
 router.register(r'developers', DeveloperViewSet, basename='developers')
 
 urlpatterns = [
+    path('async/developers/create_developer/', async_views.create_developer, name='async-create-developer'),
+    path('async/developers/submit_challenge/', async_views.submit_challenge, name='async-submit-challenge'),
     path('', include(router.urls)),  
 ]
\ No newline at end of file
@@ -1,42 +1,48 @@
 import logging
 import os
-import fitz  # PyMuPDF
+from django.http import JsonResponse
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.utils.encoders import JSONEncoder
 import json
 import time
-from groq import Groq
 
 from TalentAI import settings
+from HireMe.llm import get_router
+from HireMe.pdf_extraction import extract_pdf
+from TalentAI import metrics
+from TalentAI.tracing import current_span, span, traced
 
-def extract_pdf_text(attachment):
+def read_pdf_text(attachment):
     """
-    Extracts and summarizes text from a PDF file. Uses direct text extraction and falls back
-    to OCR for scanned pages.
+    Extracts text from a PDF file. Large documents are extracted in parallel and
+    extraction is capped by settings.PDF_MAX_PAGES / PDF_EXTRACT_TIMEOUT_SECONDS
+    (see HireMe.pdf_extraction.extract_pdf for per-page timings).
 
     Args:
         attachment (File): A Django InMemoryUploadedFile or File object.
 
     Returns:
-        tuple:
-            - full_text (str): The combined extracted text from all PDF pages.
-            - summarized_text (str): Summarized version under 20k tokens.
-    """
-    try:
-        # Read and load PDF content
-        attachment.seek(0)
-        raw_bytes = attachment.read()
-        full_text = ""
+        full_text (str): The combined extracted text from all PDF pages.
 
-        with fitz.open(stream=raw_bytes, filetype="pdf") as doc:
-            for i, page in enumerate(doc):
-                page_text = page.get_text("text")
-
-                if page_text and page_text.strip():
-                    full_text += page_text.strip() + "\n\n"
+    Raises:
+        Exception: whatever PyMuPDF raises for an unreadable or corrupt file.
+    """
+    with span("pdf.extract") as s:
+        result = extract_pdf(attachment)
+        s.set(page_count=result["page_count"], pages_extracted=result["pages_extracted"], truncated=result["truncated"])
+    if result["truncated"]:
+        logging.warning(
+            f"[extract_pdf_text] Extracted {result['pages_extracted']}/{result['page_count']} pages "
+            f"in {result['elapsed']:.2f}s (page or time cap reached)"
+        )
+    return result["text"]
 
-        return full_text
 
+def extract_pdf_text(attachment):
+    """read_pdf_text, returning "" instead of raising when the PDF can't be read."""
+    try:
+        return read_pdf_text(attachment)
     except Exception as e:
         logging.error(f"[extract_pdf_text] Failed to extract from PDF: {e}")
         return ""
@@ -51,54 +57,93 @@ def create_response(success, message, body=None, status_code=status.HTTP_200_OK)
         error_message = f"Error creating response: {str(e)}"
         return Response({'success': False, 'message': error_message}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-MAX_RETRIES = 3
-RETRY_DELAY = 2 
+def create_json_response(success, message, body=None, status_code=status.HTTP_200_OK):
+    """create_response for plain Django (async) views, which can't return a DRF Response."""
+    response_data = {'success': success, 'message': message}
+    if body is not None:
+        response_data['body'] = body
+    return JsonResponse(response_data, status=status_code, encoder=JSONEncoder)
 
+def _record_llm_error(flow, started):
+    metrics.llm_errors.inc(flow=flow or "other")
+    metrics.llm_request_duration.observe(time.perf_counter() - started, flow=flow or "other", outcome="error")
 
-def retry_groq_call(fn, *args, **kwargs):
-    for attempt in range(MAX_RETRIES):
-        try:
-            return fn(*args, **kwargs)
-        except Exception as e:
-            logging.warning(f"Groq call failed (attempt {attempt+1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
-            else:
-                raise
 
-def generate_response_with_groq(messages, response_format=None, model=None, max_completion_tokens=None, tools=None):
+@traced("llm.generate")
+def generate_response_with_groq(messages, response_format=None, model=None, max_completion_tokens=None, tools=None, flow=None):
+    """
+    Run a chat completion through the configured LLM providers (see HireMe.llm).
+
+    The name is kept for existing callers; the call is routed to the fastest healthy
+    backend in settings.LLM_PROVIDERS and falls back to the others on failure, with at
+    most settings.LLM_MAX_ATTEMPTS calls in total (retries happen in the router).
+    `flow` ("resume", "submission", "challenge") lets the local stub provider pick
+    its canned response.
+    """
+    started = time.perf_counter()
     try:
-        model = model or os.getenv("GROQ_MODEL")
-        api_key = os.getenv("GROQ_API_KEY")
+        router = get_router()
+        if not router.ranked_providers():
+            raise ValueError("No LLM provider is configured. Please set GROQ_API_KEY or LLM_PROVIDERS.")
+
+        response_content, usage, provider_name = router.complete(
+            messages,
+            model=model,
+            response_format=response_format,
+            max_completion_tokens=max_completion_tokens,
+            tools=tools,
+            flow=flow,
+        )
+        logging.info(f"LLM response served by '{provider_name}'")
+        current_span().set(flow=flow, provider=provider_name)
+        if response_format and response_format == "json":
+            response_content = json.loads(response_content)
+        metrics.llm_request_duration.observe(time.perf_counter() - started, flow=flow or "other", outcome="ok")
+        return response_content, usage
 
-        if not api_key:
-            raise ValueError("API key is missing. Please set the GROQ_API_KEY environment variable.")
+    except ValueError as ve:
+        _record_llm_error(flow, started)
+        current_span().set_error(ve)
+        logging.error(f"[generate_response_with_groq] {ve}")
+        return "There was an issue with your request.", None
+    except Exception as e:
+        _record_llm_error(flow, started)
+        current_span().set_error(e)
+        logging.error(f"[generate_response_with_groq] {e}")
+        return "An error occurred while processing your request.", None
 
-        client = Groq(api_key=api_key)
 
-        request_args = {
-            "messages": messages,
-            "model": model,
-        }
-        if max_completion_tokens:
-            request_args["max_completion_tokens"] = max_completion_tokens
-        if response_format and response_format == "json":
-            request_args["response_format"] = {"type": "json_object"}
-        if tools:
-            request_args["tools"] = tools
-        def groq_completion_request():
-            return client.chat.completions.create(**request_args)
-
-        chat_completion = retry_groq_call(groq_completion_request)
-        response_content = chat_completion.choices[0].message.content
+@traced("llm.generate")
+async def generate_response_with_groq_async(messages, response_format=None, model=None, max_completion_tokens=None, tools=None, flow=None):
+    """generate_response_with_groq for async views: same routing, retries and return values, without blocking the event loop."""
+    started = time.perf_counter()
+    try:
+        router = get_router()
+        if not router.ranked_providers():
+            raise ValueError("No LLM provider is configured. Please set GROQ_API_KEY or LLM_PROVIDERS.")
+
+        response_content, usage, provider_name = await router.acomplete(
+            messages,
+            model=model,
+            response_format=response_format,
+            max_completion_tokens=max_completion_tokens,
+            tools=tools,
+            flow=flow,
+        )
+        logging.info(f"LLM response served by '{provider_name}'")
+        current_span().set(flow=flow, provider=provider_name)
         if response_format and response_format == "json":
             response_content = json.loads(response_content)
-        usage = chat_completion.usage
-        return response_content, usage.model_dump()
+        metrics.llm_request_duration.observe(time.perf_counter() - started, flow=flow or "other", outcome="ok")
+        return response_content, usage
 
     except ValueError as ve:
-        print(f"ValueError: {ve}")
+        _record_llm_error(flow, started)
+        current_span().set_error(ve)
+        logging.error(f"[generate_response_with_groq] {ve}")
         return "There was an issue with your request.", None
     except Exception as e:
-        print(f"An error occurred: {e}")
+        _record_llm_error(flow, started)
+        current_span().set_error(e)
+        logging.error(f"[generate_response_with_groq] {e}")
         return "An error occurred while processing your request.", None
@@ -1,61 +1,108 @@
-import base64
-from typing import Dict, Any, List, Tuple
+from datetime import datetime, time
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 
 from django.db import transaction
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.timezone import now
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.response import Response
-
-from HireMe.utils import create_response, extract_pdf_text
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+
+from HireMe import leaderboard
+from HireMe.ingestion import (
+    STAGES, ResumeExtractionError, analyze_resume, build_ai_profile, enqueue_job, extract_resume, persist_resume_analysis,
+)
+from HireMe.resume_cache import cache_stats
+from HireMe.response_cache import CATALOG, cached_response
+from HireMe.resume_store import load_resume_text
+from HireMe.scoring import apply_submission_score, compute_new_dev_score, record_manual_scores  # noqa: F401 (compute_new_dev_score used to live here)
+from HireMe.search import search_developers
+from HireMe.utils import create_response
+from TalentAI.renderers import ORJSONRenderer
 from Recruiter.models import Invitation
 from Recruiter.serializers import InvitationSerializer
-from .models import Challenge, Developer, Skill, Submission
-from .serializers import DeveloperSerializer, SubmissionSerializer
-
-from HireMe.agents.developer_agent import ai_analyze_resume, ai_evaluate_submission
-
-
-def compute_new_dev_score(
-    current_dev_score: int,
-    submission_score: int,
-    challenge_max_score: int,
-    weight_current: float = 0.8,
-    weight_new: float = 0.2,
-) -> int:
-    """
-    Compute updated dev_score based on current score and normalized challenge performance.
-
-    Args:
-        current_dev_score (int): Current developer score (0–1000).
-        submission_score (int): Raw score for this challenge (0–max_score).
-        challenge_max_score (int): Maximum possible score for this challenge.
-        weight_current (float): Weight for existing score (default 0.8).
-        weight_new (float): Weight for new challenge performance (default 0.2).
-
-    Returns:
-        int: Updated developer score (0–1000).
-    """
-    if challenge_max_score <= 0:
-        normalized_score = 0
-    else:
-        normalized_score = (submission_score / challenge_max_score) * 1000
-
-    new_score = (current_dev_score * weight_current) + (normalized_score * weight_new)
-
-    # Clamp to 0–1000 range
-    return max(0, min(1000, int(round(new_score))))
+from .models import Challenge, Developer, ResumeIngestionJob, Submission
+from .serializers import DeveloperSerializer, ResumeIngestionJobSerializer, SubmissionSerializer
+
+from HireMe.agents.developer_agent import ai_evaluate_submission
+
+
+SUBMISSION_EXPORT_CHUNK_SIZE = 500
+
+
+def _parse_bound(value: str, end_of_day: bool):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date: {value!r}")
+        parsed = datetime.combine(day, time.max if end_of_day else time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _filter_submissions(params) -> QuerySet:
+    """Submissions matching the feed filters, newest first. Raises ValueError on bad input."""
+    submissions = Submission.objects.order_by("-id")
+    for field in ("developer", "challenge"):
+        if params.get(field):
+            submissions = submissions.filter(**{f"{field}_id": int(params[field])})
+    if params.get("status"):
+        submissions = submissions.filter(status=params["status"])
+    if params.get("created_after"):
+        submissions = submissions.filter(created_at__gte=_parse_bound(params["created_after"], end_of_day=False))
+    if params.get("created_before"):
+        submissions = submissions.filter(created_at__lte=_parse_bound(params["created_before"], end_of_day=True))
+    return submissions
+
+
+def _ndjson_lines(submissions: Iterable[Submission]) -> Iterator[str]:
+    encoder = DRFJSONEncoder(ensure_ascii=False)
+    for submission in submissions:
+        yield encoder.encode(SubmissionSerializer(submission).data) + "\n"
+
+
+def _leaderboard_rows(entries) -> List[Dict[str, Any]]:
+    names = dict(Developer.objects.filter(id__in=[dev_id for _, dev_id, _ in entries]).values_list("id", "full_name"))
+    return [
+        {"rank": rank, "developer": dev_id, "full_name": names.get(dev_id, ""), "dev_score": score}
+        for rank, dev_id, score in entries
+    ]
+
 
 class DeveloperViewSet(viewsets.ModelViewSet):
     queryset = Developer.objects.all().order_by("-id")
     serializer_class = DeveloperSerializer
     parser_classes = (MultiPartParser, FormParser, JSONParser)
 
+    @cached_response("developer", lambda pk: [("developer", pk), CATALOG])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        # A dev_score written here is logged like any other, so leaderboards and
+        # rebuild_dev_scores see it.
+        previous = serializer.instance.dev_score
+        with transaction.atomic():
+            developer = serializer.save()
+            if developer.dev_score != previous:
+                record_manual_scores({developer.id: developer.dev_score})
+
     @action(detail=False, methods=["post"], parser_classes=[MultiPartParser, FormParser])
-    @transaction.atomic
     def create_developer(self, request):
+        """
+        Synchronous resume upload. PDF parsing and the LLM call run outside any
+        transaction; only creating the developer and persisting the analysis are atomic
+        (as in HireMe.ingestion._persistence_stage). ingest_resume is the 202 variant.
+        """
         try:
             data = request.data.copy()
 
@@ -64,98 +111,78 @@ class DeveloperViewSet(viewsets.ModelViewSet):
             if not resume_file:
                 return create_response(False, "Resume is required", status_code=status.HTTP_400_BAD_REQUEST)
 
-            resume_text = extract_pdf_text(resume_file)
-            resume_b64 = base64.b64encode(resume_text.encode("utf-8")).decode("utf-8")
-            data["resume"] = resume_b64
+            # Unchanged resumes reuse the stored analysis and skip extraction and the LLM.
+            extracted = extract_resume(resume_file)
+            data.pop("resume", None)
 
             email = data.get("email", None)
             if not email:
                 return create_response(False, "Email is required", status_code=status.HTTP_400_BAD_REQUEST)
 
-            if Developer.objects.filter(email=email).exists():
-                developer = Developer.objects.get(email=email)
-            else:
+            # Validate before the LLM runs, but only create the developer with its analysis.
+            developer = Developer.objects.filter(email=email).first()
+            dev_ser = None
+            if developer is None:
                 dev_ser = DeveloperSerializer(data=data)
                 dev_ser.is_valid(raise_exception=True)
-                developer: Developer = dev_ser.save()
-
-            profile_for_ai = {
-                "full_name": developer.full_name,
-                "email": developer.email,
-                "bio": developer.bio,
-                "location": developer.location,
-                "experience_level": developer.experience_level,
-                "availability": developer.availability,
-                "portfolio_links": developer.portfolio_links or [],
-            }
-
-            dev_score = 0
-            skills_data = []
-            if resume_text:
-                result = ai_analyze_resume(resume_text, profile_for_ai)
-                print("result", result)
-                dev_score = result.get("dev_score", 0)
-                skills_data = result.get("skills", [])
-
-            print("dev_score", dev_score)
-            print("skills_data", skills_data)
-            developer.dev_score = int(dev_score or 0)
-            developer.validation_status = "partially_validated" if skills_data else "not_validated"
-            developer.save(update_fields=["dev_score", "validation_status"])
-
-            created_skill_ids = []
-            for s in skills_data:
-                print("s", s)
-                challenge_payload = s.get("challenge")
-                challenge_obj = None
-                if challenge_payload:
-                    challenge_obj, _ = Challenge.objects.get_or_create(
-                        title=(challenge_payload.get("title") or "").strip(),
-                        defaults={
-                            "description": (challenge_payload.get("description") or "")[:4000],
-                            "difficulty": challenge_payload.get("difficulty", "intermediate"),
-                            "time_limit": int(challenge_payload.get("time_limit", 60)),
-                            "challenge_type": challenge_payload.get("challenge_type", "coding"),
-                            "challenge_question": (challenge_payload.get("challenge_question") or "")[:4000],
-                            "max_score": int(challenge_payload.get("max_score", 100)),
-                        },
-                    )
-
-                skill_obj, created = Skill.objects.get_or_create(
-                    name=(s.get("name") or "").strip(),
-                    challenge=challenge_obj,
-                    defaults={
-                        "level": int(s.get("level", 50)),
-                        "validated": False,
-                    },
-                )
-                if not created:
-                    changed = False
-                    lvl = int(s.get("level", skill_obj.level))
-                    if lvl != skill_obj.level:
-                        skill_obj.level = lvl
-                        changed = True
-                    val = bool(s.get("validated", skill_obj.validated))
-                    if val != skill_obj.validated:
-                        skill_obj.validated = val
-                        changed = True
-                    if changed:
-                        skill_obj.save(update_fields=["level", "validated"])
-
-                created_skill_ids.append(skill_obj.id)
-
-            if created_skill_ids:
-                developer.skills.add(*Skill.objects.filter(id__in=created_skill_ids))
+
+            analysis = analyze_resume(extracted, build_ai_profile(developer or data))
+            with transaction.atomic():
+                if developer is None:
+                    developer = Developer.objects.filter(email=email).first() or dev_ser.save()
+                persist_resume_analysis(developer, extracted, analysis)
 
             return create_response(True, "Developer created", DeveloperSerializer(developer).data, status_code=status.HTTP_201_CREATED)
 
+        except ResumeExtractionError as e:
+            return create_response(False, str(e), status_code=status.HTTP_400_BAD_REQUEST)
+        except ValidationError as e:
+            return create_response(False, "Invalid developer data", e.detail, status_code=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            transaction.set_rollback(True)
             return create_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=["post"], parser_classes=[MultiPartParser, FormParser])
+    def ingest_resume(self, request):
+        """
+        Same input as create_developer, but only stores the upload and returns 202 with a
+        job_id. Extraction, analysis and persistence run on background workers; poll
+        ingestion_jobs/<job_id>/ for progress.
+        """
+        resume_file = request.data.get("resume")
+        if not resume_file:
+            return create_response(False, "Resume is required", status_code=status.HTTP_400_BAD_REQUEST)
+        email = request.data.get("email", None)
+        if not email:
+            return create_response(False, "Email is required", status_code=status.HTTP_400_BAD_REQUEST)
+
+        profile = {k: v for k, v in request.data.items() if k != "resume"}
+        if not Developer.objects.filter(email=email).exists():
+            DeveloperSerializer(data=profile).is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            job = ResumeIngestionJob(
+                email=email,
+                profile=profile,
+                stages={stage: {"status": "pending", "attempts": 0} for stage in STAGES},
+            )
+            job.upload.save(resume_file.name, resume_file, save=False)
+            job.save()
+            enqueue_job(job)
+
+        return create_response(True, "Resume queued for processing", ResumeIngestionJobSerializer(job).data, status_code=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=["get"], url_path=r"ingestion_jobs/(?P<job_id>[0-9a-f-]+)")
+    def ingestion_job(self, request, job_id=None):
+        job = ResumeIngestionJob.objects.filter(job_id=job_id).first()
+        if not job:
+            return Response({"error": "Invalid job_id"}, status=404)
+        return Response(ResumeIngestionJobSerializer(job).data)
+
     @action(detail=False, methods=["post"], parser_classes=[JSONParser])
-    @transaction.atomic
     def submit_challenge(self, request):
+        # No transaction around the LLM evaluation: nothing is locked while it runs,
+        # and dev_score is updated afterwards in one short UPDATE (HireMe.scoring).
+        submission = None
         try:
             payload = request.data
             developer = Developer.objects.filter(id=payload.get("developer")).first()
@@ -183,22 +210,128 @@ class DeveloperViewSet(viewsets.ModelViewSet):
             submission.evaluation_details = scoring.get("evaluation_details", {})
             submission.status = "completed"
             submission.save()
+        except Exception as e:
+            # Same outcome as the old rollback: a submission that wasn't evaluated isn't kept.
+            if submission is not None and submission.pk:
+                submission.delete()
+            return create_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            developer.dev_score = int(developer.dev_score * 0.8 + (submission.score or 0) * 0.2)
-            developer.save(update_fields=["dev_score"])
-
+        try:
+            apply_submission_score(submission)
             return create_response(True, "Submission evaluated", SubmissionSerializer(submission).data, status_code=status.HTTP_201_CREATED)
-
         except Exception as e:
-            transaction.set_rollback(True)
             return create_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
+
+    @action(detail=True, methods=["get"])
+    def resume(self, request, pk=None):
+        dev = self.get_object()
+        text = load_resume_text(dev.id)
+        if text is None:
+            return Response({"error": "No resume stored for this developer"}, status=404)
+        return Response({"developer": dev.id, "resume": text})
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        Ranked full-text search over skill names, bio, location and resume text.
+        Query params: q, page (default 1), page_size (default 20, max 100).
+        """
+        q = (request.query_params.get("q") or "").strip()
+        if not q:
+            return Response({"error": "q is required"}, status=400)
+        try:
+            page = int(request.query_params.get("page", 1))
+            page_size = int(request.query_params.get("page_size", 20))
+        except ValueError:
+            return Response({"error": "page and page_size must be integers"}, status=400)
+
+        found = search_developers(q, page=page, page_size=page_size)
+        ids = [dev_id for dev_id, _ in found["results"]]
+        developers = Developer.objects.filter(id__in=ids).prefetch_related("skills__challenge").in_bulk()
+        results = []
+        for dev_id, score in found["results"]:
+            if dev_id in developers:
+                results.append({"score": round(score, 4), "developer": DeveloperSerializer(developers[dev_id]).data})
+        return Response({"count": found["count"], "page": page, "results": results})
+
     @action(detail=False, methods=["get"])
+    def leaderboard(self, request):
+        """
+        Developers ranked by dev_score. Query params: limit (default 10, max 100),
+        offset, skill (rank only developers with that skill, case-insensitive).
+        """
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 10)), 100))
+            offset = max(0, int(request.query_params.get("offset", 0)))
+        except ValueError:
+            return Response({"error": "limit and offset must be integers"}, status=400)
+        skill = request.query_params.get("skill") or None
+        board = leaderboard.top(limit, offset, skill=skill)
+        return Response({"skill": skill, "total": board["total"], "entries": _leaderboard_rows(board["entries"])})
+
+    @action(detail=True, methods=["get"])
+    def rank(self, request, pk=None):
+        """A developer's leaderboard rank with `radius` (default 2, max 50) neighbours on each side; optional skill."""
+        dev = self.get_object()
+        try:
+            radius = max(0, min(int(request.query_params.get("radius", 2)), 50))
+        except ValueError:
+            return Response({"error": "radius must be an integer"}, status=400)
+        skill = request.query_params.get("skill") or None
+        found = leaderboard.rank_of(dev.id, radius=radius, skill=skill)
+        if found is None:
+            return Response({"error": "Developer is not on this leaderboard"}, status=404)
+        return Response({
+            "developer": dev.id,
+            "skill": skill,
+            "rank": found["rank"],
+            "total": found["total"],
+            "neighbours": _leaderboard_rows(found["neighbours"]),
+        })
+
+    @action(detail=False, methods=["get"])
+    def analysis_cache_stats(self, request):
+        return Response(cache_stats())
+
+    @action(detail=False, methods=["get"], renderer_classes=[ORJSONRenderer])
     def fetch_submissions(self, request):
-        submissions = Submission.objects.all().order_by("-id")
-        return Response(SubmissionSerializer(submissions, many=True).data)
+        """
+        Newest-first submissions, keyset-paginated on id.
+
+        Query params:
+            developer, challenge, status: exact filters.
+            created_after, created_before: ISO date or datetime bounds on created_at.
+            cursor: the `next_cursor` of the previous page.
+            limit: page size (default 50, max 200).
+            export=ndjson: stream every matching row as newline-delimited JSON instead.
+        """
+        params = request.query_params
+        try:
+            submissions = _filter_submissions(params)
+            cursor = int(params["cursor"]) if params.get("cursor") else None
+            limit = max(1, min(int(params.get("limit", 50)), 200))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+        if cursor is not None:
+            submissions = submissions.filter(id__lt=cursor)
+
+        if params.get("export") == "ndjson":
+            response = StreamingHttpResponse(
+                _ndjson_lines(submissions.iterator(chunk_size=SUBMISSION_EXPORT_CHUNK_SIZE)),
+                content_type="application/x-ndjson",
+            )
+            response["Content-Disposition"] = 'attachment; filename="submissions.ndjson"'
+            return response
+
+        page = list(submissions[:limit + 1])
+        next_cursor = page[limit - 1].id if len(page) > limit else None
+        return Response({
+            "results": SubmissionSerializer(page[:limit], many=True).data,
+            "next_cursor": next_cursor,
+        })
         
-    @action(detail=True, methods=["get"])
+    @action(detail=True, methods=["get"], renderer_classes=[ORJSONRenderer])
+    @cached_response("developer-invites", lambda pk: [("developer-invites", pk), ("developer", pk), CATALOG])
     def invites(self, request, pk=None):
         dev = self.get_object()
         invites = Invitation.objects.filter(developer=dev).order_by("-sent_at")
@@ -1,8 +1,8 @@
 # Recruiter/agent.py
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from HireMe.utils import generate_response_with_groq
+from HireMe.utils import generate_response_with_groq, generate_response_with_groq_async
 
 RECRUITER_SYSTEM = (
     "You are an AI recruiting co-pilot for the HireMe platform. "
@@ -47,6 +47,58 @@ def _strip_fences(s: str) -> str:
         return s.strip("`").strip()
     return t
 
+def _suggestion_messages(project_payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    prompt = RECRUITER_PROMPT.format(
+        project_json=json.dumps(project_payload, ensure_ascii=False, indent=2)
+    )
+    return [
+        {"role": "system", "content": RECRUITER_SYSTEM},
+        {"role": "user", "content": prompt},
+    ]
+
+def _normalize_suggestions(raw: Any) -> Dict[str, Any]:
+    # Some providers return (parsed, meta), or str JSON, or dict
+    if isinstance(raw, tuple) and raw:
+        raw = raw[0]
+
+    if isinstance(raw, str):
+        try:
+            data = json.loads(raw)
+        except Exception:
+            try:
+                data = json.loads(_strip_fences(raw))
+            except Exception:
+                return {}
+    elif isinstance(raw, dict):
+        data = raw
+    else:
+        return {}
+
+    # Sometimes wrapped like {"content": {...}} or {"data": {...}} etc.
+    for key in ("content", "data", "body", "result"):
+        if isinstance(data, dict) and key in data and isinstance(data[key], dict):
+            data = data[key]
+
+    out = {"challenges": [], "rationale": ""}
+
+    if isinstance(data, dict):
+        ch = data.get("challenges")
+        if isinstance(ch, list):
+            out["challenges"] = ch
+        out["rationale"] = data.get("rationale", "") or ""
+
+    # Final sanitization
+    for c in out["challenges"]:
+        c["time_limit"] = _coerce_int(c.get("time_limit", 60), 60)
+        c["max_score"] = _coerce_int(c.get("max_score", 100), 100)
+        # normalize types
+        if "challenge_type" in c and isinstance(c["challenge_type"], str):
+            c["challenge_type"] = c["challenge_type"].strip().lower().replace(" ", "_")
+        if "difficulty" in c and isinstance(c["difficulty"], str):
+            c["difficulty"] = c["difficulty"].strip().lower()
+
+    return out
+
 def ai_suggest_challenges_for_project(project_payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Call LLM and normalize whatever comes back into:
@@ -54,57 +106,16 @@ def ai_suggest_challenges_for_project(project_payload: Dict[str, Any]) -> Dict[s
     Never throws; returns {} on failure.
     """
     try:
-        prompt = RECRUITER_PROMPT.format(
-            project_json=json.dumps(project_payload, ensure_ascii=False, indent=2)
-        )
-        messages = [
-            {"role": "system", "content": RECRUITER_SYSTEM},
-            {"role": "user", "content": prompt},
-        ]
-
-        raw = generate_response_with_groq(messages, response_format="json")
-
-        # Some providers return (parsed, meta), or str JSON, or dict
-        if isinstance(raw, tuple) and raw:
-            raw = raw[0]
-
-        if isinstance(raw, str):
-            try:
-                data = json.loads(raw)
-            except Exception:
-                try:
-                    data = json.loads(_strip_fences(raw))
-                except Exception:
-                    return {}
-        elif isinstance(raw, dict):
-            data = raw
-        else:
-            return {}
-
-        # Sometimes wrapped like {"content": {...}} or {"data": {...}} etc.
-        for key in ("content", "data", "body", "result"):
-            if isinstance(data, dict) and key in data and isinstance(data[key], dict):
-                data = data[key]
-
-        out = {"challenges": [], "rationale": ""}
-
-        if isinstance(data, dict):
-            ch = data.get("challenges")
-            if isinstance(ch, list):
-                out["challenges"] = ch
-            out["rationale"] = data.get("rationale", "") or ""
-
-        # Final sanitization
-        for c in out["challenges"]:
-            c["time_limit"] = _coerce_int(c.get("time_limit", 60), 60)
-            c["max_score"] = _coerce_int(c.get("max_score", 100), 100)
-            # normalize types
-            if "challenge_type" in c and isinstance(c["challenge_type"], str):
-                c["challenge_type"] = c["challenge_type"].strip().lower().replace(" ", "_")
-            if "difficulty" in c and isinstance(c["difficulty"], str):
-                c["difficulty"] = c["difficulty"].strip().lower()
-
-        return out
+        raw = generate_response_with_groq(_suggestion_messages(project_payload), response_format="json", flow="challenge")
+        return _normalize_suggestions(raw)
     except Exception:
         # Never let AI issues bubble up
         return {}
+
+async def ai_suggest_challenges_for_project_async(project_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """ai_suggest_challenges_for_project for async views. Never throws; returns {} on failure."""
+    try:
+        raw = await generate_response_with_groq_async(_suggestion_messages(project_payload), response_format="json", flow="challenge")
+        return _normalize_suggestions(raw)
+    except Exception:
+        return {}
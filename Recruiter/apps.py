@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class RecruiterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Recruiter'
+
+    def ready(self):
+        from django.conf import settings
+
+        from Recruiter import signals  # noqa: F401
+
+        from Recruiter.automation import run_automation_tick
+        from Recruiter.expiry import sweep_expired_invitations
+        from Recruiter.outbox import deliver_pending
+        from Recruiter.scheduler import start_periodic
+
+        start_periodic("invitation-expiry", settings.INVITATION_SWEEP_INTERVAL_SECONDS, sweep_expired_invitations)
+        start_periodic("project-automation", settings.AUTOMATION_TICK_SECONDS, run_automation_tick)
+        start_periodic("outbox-delivery", settings.OUTBOX_DELIVERY_INTERVAL_SECONDS, deliver_pending)
@@ -0,0 +1,44 @@
+"""
+Async version of project creation (see HireMe.async_views for the rationale).
+
+Same JSON body and response as ProjectViewSet.create. The project and its
+recommendations are written in one transaction in Django's DB thread; the challenge
+suggestion LLM call is awaited afterwards, outside any transaction.
+"""
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework import status
+
+from HireMe.utils import create_json_response
+from Recruiter.agent import ai_suggest_challenges_for_project_async
+from Recruiter.serializers import ProjectSerializer
+from Recruiter.views import challenge_suggestion_payload, project_created_body, save_project_with_recommendations
+
+
+@transaction.atomic
+def _create_project(data):
+    serializer = ProjectSerializer(data=data)
+    serializer.is_valid(raise_exception=True)
+    project = save_project_with_recommendations(serializer)
+    return project, challenge_suggestion_payload(project)
+
+
+@csrf_exempt
+@require_POST
+async def create_project(request):
+    try:
+        data = json.loads(request.body or b"{}")
+        project, payload = await sync_to_async(_create_project)(data)
+
+        ai_suggestions = await ai_suggest_challenges_for_project_async(payload) or {}
+
+        body = await sync_to_async(project_created_body)(project, ai_suggestions)
+        return create_json_response(True, "Project created with recommendations", body, status_code=status.HTTP_201_CREATED)
+    except Exception as e:
+        logging.exception("Project creation failed")
+        return create_json_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,256 @@
+"""
+Automation for projects with `automation_enabled`.
+
+Each tick walks opted-in, non-closed projects in batches and moves them through
+
+    draft/matching -> re-rank, pick a challenge (LLM suggestion), invite the best
+                      uninvited candidates -> challenging
+    challenging    -> mark accepted invitations with a completed submission for the
+                      challenge as completed; close after enough completions, or go
+                      back to matching when nobody is left to respond
+    matching       -> closed once nobody is left to invite and nothing is open
+
+Per batch the developer table is loaded once, LLM suggestions run concurrently in a
+BoundedLLMExecutor, and every write is a set-based statement issued from the tick's
+own thread, so DB and LLM concurrency stay bounded no matter how many projects opt in.
+"""
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils.timezone import now
+
+from HireMe.bulk_persistence import upsert_challenges
+from HireMe.llm.executor import BoundedLLMExecutor
+from HireMe.models import Developer, Submission
+from HireMe.response_cache import invalidate
+from Recruiter.agent import ai_suggest_challenges_for_project
+from Recruiter.models import CandidateRecommendation, Invitation, Project
+from Recruiter.outbox import enqueue_invitations
+from Recruiter.recommender import recommend_candidates_for_project
+
+OPEN_INVITATION_STATUSES = ("sent", "accepted")
+
+
+def _project_payload(project: Project) -> Dict[str, Any]:
+    return {
+        "project_name": project.project_name,
+        "description": project.description,
+        "required_skills": [{"name": s.name, "required_level": s.required_level} for s in project.required_skills.all()],
+    }
+
+
+def _sync_completions(project_ids: List[int]) -> int:
+    """Accepted invitations whose developer completed a submission for the invited challenge become completed."""
+    done = Submission.objects.filter(
+        developer_id=OuterRef("developer_id"), challenge_id=OuterRef("challenge_id"), status="completed"
+    )
+    rows = list(
+        Invitation.objects.filter(project_id__in=project_ids, status="accepted", challenge__isnull=False)
+        .filter(Exists(done))
+        .values_list("id", "developer_id")
+    )
+    if not rows:
+        return 0
+    invalidate(*{("developer-invites", dev_id) for _, dev_id in rows})
+    return Invitation.objects.filter(id__in=[i for i, _ in rows], status="accepted").update(status="completed")
+
+
+def _invitation_counts(project_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    counts: Dict[int, Dict[str, int]] = defaultdict(lambda: {"open": 0, "completed": 0})
+    rows = (
+        Invitation.objects.filter(project_id__in=project_ids)
+        .values("project_id")
+        .annotate(
+            open=Count("id", filter=Q(status__in=OPEN_INVITATION_STATUSES)),
+            completed=Count("id", filter=Q(status="completed")),
+        )
+    )
+    for row in rows:
+        counts[row["project_id"]] = {"open": row["open"], "completed": row["completed"]}
+    return counts
+
+
+def _project_challenges(project_ids: List[int]) -> Dict[int, int]:
+    """The challenge each project already invites with (its latest invitation's)."""
+    challenges: Dict[int, int] = {}
+    rows = (
+        Invitation.objects.filter(project_id__in=project_ids, challenge__isnull=False)
+        .order_by("project_id", "-sent_at")
+        .values_list("project_id", "challenge_id")
+    )
+    for project_id, challenge_id in rows:
+        challenges.setdefault(project_id, challenge_id)
+    return challenges
+
+
+def _suggest_challenges(projects: List[Project], llm: BoundedLLMExecutor) -> Dict[int, int]:
+    """Ask the LLM for a challenge per project (concurrently) and upsert the first suggestion of each."""
+    futures = {p.id: llm.submit(ai_suggest_challenges_for_project, _project_payload(p)) for p in projects}
+    first: Dict[int, Dict[str, Any]] = {}
+    for project_id, future in futures.items():
+        try:
+            suggestions = (future.result() or {}).get("challenges") or []
+        except Exception:
+            logging.exception(f"[automation] Challenge suggestion failed for project {project_id}")
+            continue
+        usable = [c for c in suggestions if isinstance(c, dict) and (c.get("title") or "").strip()]
+        if usable:
+            first[project_id] = usable[0]
+    ids_by_title = upsert_challenges(first.values())
+    return {
+        project_id: ids_by_title[payload["title"].strip()]
+        for project_id, payload in first.items()
+        if payload["title"].strip() in ids_by_title
+    }
+
+
+def _run_batch(projects: List[Project], developers: List[Developer], llm: BoundedLLMExecutor, stats: Counter) -> None:
+    project_ids = [p.id for p in projects]
+    stats["completed_invitations"] += _sync_completions(project_ids)
+    counts = _invitation_counts(project_ids)
+    invited: Dict[int, Set[int]] = defaultdict(set)
+    for project_id, dev_id in Invitation.objects.filter(project_id__in=project_ids).values_list("project_id", "developer_id"):
+        invited[project_id].add(dev_id)
+
+    transitions: Dict[str, List[int]] = defaultdict(list)
+    to_match: List[Project] = []
+    for project in projects:
+        c = counts[project.id]
+        if project.status == "challenging":
+            if c["completed"] >= settings.AUTOMATION_CLOSE_AFTER_COMPLETIONS:
+                transitions["closed"].append(project.id)
+            elif c["open"] == 0:
+                to_match.append(project)
+        else:
+            to_match.append(project)
+    if not to_match:
+        _apply_transitions(transitions, stats)
+        return
+
+    # Re-rank against the shared developer list and replace the stored recommendations.
+    keep = settings.AUTOMATION_RECOMMENDATIONS_KEPT
+    ranked = {p.id: recommend_candidates_for_project(p, limit=keep, developers=developers) for p in to_match}
+    recommendations = [
+        CandidateRecommendation(
+            project_id=project_id,
+            developer=dev,
+            fit_score=fit,
+            rationale=(
+                f"Skill match {breakdown.get('skill_score', 0)}%, "
+                f"dev adj {breakdown.get('dev_score_component', 0)}"
+            ),
+        )
+        for project_id, rows in ranked.items()
+        for dev, fit, breakdown in rows
+    ]
+    stats["ranked_projects"] += len(to_match)
+
+    # Best uninvited candidates above the threshold, per project.
+    per_round = settings.AUTOMATION_INVITES_PER_ROUND
+    min_fit = settings.AUTOMATION_MIN_FIT_SCORE
+    candidates: Dict[int, List[int]] = {}
+    for project_id, rows in ranked.items():
+        fresh = [dev.id for dev, fit, _ in rows if fit >= min_fit and dev.id not in invited[project_id]]
+        candidates[project_id] = fresh[:per_round]
+
+    challenges = _project_challenges([p.id for p in to_match])
+    need_challenge = [p for p in to_match if candidates[p.id] and p.id not in challenges]
+    if need_challenge:
+        suggested = _suggest_challenges(need_challenge, llm)
+        stats["challenges_suggested"] += len(suggested)
+        challenges.update(suggested)
+
+    invitations = []
+    sent_at = now()
+    for project in to_match:
+        dev_ids = candidates[project.id]
+        if dev_ids and project.id in challenges:
+            invitations.extend(
+                Invitation(
+                    project_id=project.id, developer_id=dev_id, challenge_id=challenges[project.id],
+                    status="sent", sent_at=sent_at,
+                )
+                for dev_id in dev_ids
+            )
+            transitions["challenging"].append(project.id)
+        elif dev_ids:
+            # No challenge yet (suggestion failed); try again next tick.
+            transitions["matching"].append(project.id)
+        elif counts[project.id]["open"] == 0 and (project.status == "challenging" or invited[project.id]):
+            transitions["closed"].append(project.id)
+        else:
+            transitions["matching"].append(project.id)
+
+    with transaction.atomic():
+        CandidateRecommendation.objects.filter(project_id__in=ranked.keys()).delete()
+        CandidateRecommendation.objects.bulk_create(recommendations, batch_size=1000)
+        for project in to_match:
+            project.target_count = len(ranked[project.id])
+        # This also locks the project rows until commit, the lock bulk_upsert_invitations
+        # takes, so an API invite can't interleave with the inserts below.
+        Project.objects.bulk_update(to_match, ["target_count"])
+        invalidate(*(("project-recs", project_id) for project_id in ranked), *(("project", p.id) for p in to_match))
+        stats["recommendations"] += len(recommendations)
+        # Only developers without an invitation are in `invitations`, so conflicts are races; skip them.
+        Invitation.objects.bulk_create(invitations, ignore_conflicts=True, batch_size=1000)
+        if invitations:
+            # Rows that lost a race keep their own sent_at, so this matches only the ones just inserted.
+            inserted = list(
+                Invitation.objects.filter(project_id__in=transitions["challenging"], sent_at=sent_at)
+                .values_list("id", "developer_id")
+            )
+            stats["invited"] += len(inserted)
+            invalidate(*{("developer-invites", dev_id) for _, dev_id in inserted})
+            enqueue_invitations([invitation_id for invitation_id, _ in inserted])
+        _apply_transitions(transitions, stats)
+
+
+def _apply_transitions(transitions: Dict[str, List[int]], stats: Counter) -> None:
+    for status, project_ids in transitions.items():
+        if project_ids:
+            changed = Project.objects.filter(id__in=project_ids).exclude(status=status).update(status=status)
+            stats[f"to_{status}"] += changed
+            if changed:
+                invalidate(*(("project", project_id) for project_id in project_ids))
+
+
+def run_automation_tick(batch_size: Optional[int] = None, llm_concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """
+    One pass over every automation-enabled project that isn't closed.
+
+    Returns:
+        dict: counters (projects, ranked_projects, recommendations, challenges_suggested,
+        invited, completed_invitations, to_<status>) plus seconds.
+    """
+    batch_size = batch_size or settings.AUTOMATION_BATCH_SIZE
+    llm_concurrency = llm_concurrency or settings.AUTOMATION_LLM_CONCURRENCY
+    started = time.monotonic()
+    stats: Counter = Counter()
+
+    active = Project.objects.filter(automation_enabled=True).exclude(status="closed")
+    if not active.exists():
+        return {"projects": 0, "seconds": 0.0}
+
+    developers = list(Developer.objects.prefetch_related("skills"))
+    last_id = 0
+    with BoundedLLMExecutor(llm_concurrency, thread_name_prefix="automation-llm") as llm:
+        while True:
+            projects = list(active.filter(id__gt=last_id).order_by("id").prefetch_related("required_skills")[:batch_size])
+            if not projects:
+                break
+            last_id = projects[-1].id
+            stats["projects"] += len(projects)
+            try:
+                _run_batch(projects, developers, llm, stats)
+            except Exception:
+                stats["failed_batches"] += 1
+                logging.exception(f"[automation] Batch ending at project {last_id} failed")
+
+    result = dict(stats, seconds=round(time.monotonic() - started, 3))
+    logging.info("[automation] tick " + " ".join(f"{k}={v}" for k, v in sorted(result.items())))
+    return result
@@ -0,0 +1,82 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.utils.timezone import now
+
+from HireMe.response_cache import invalidate
+from Recruiter.models import Invitation
+
+_stats_lock = threading.Lock()
+_last_sweep: Dict[str, Any] = {}
+
+
+def expired_backlog(cutoff) -> int:
+    """`sent` invitations older than the cutoff that are still waiting to be expired."""
+    return Invitation.objects.filter(status="sent", sent_at__lt=cutoff).count()
+
+
+def sweep_expired_invitations(
+    ttl_hours: Optional[float] = None,
+    chunk_size: Optional[int] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Mark `sent` invitations older than the TTL as `expired`.
+
+    Works in chunks: pick the next `chunk_size` ids from the (status, sent_at) index,
+    then UPDATE just those rows in their own short statement. Expired rows leave the
+    filter, so every chunk starts at the front of the index range again and no lock is
+    held across chunks. The status re-check in the UPDATE keeps an invitation that was
+    accepted in between from being expired.
+
+    Returns:
+        dict: expired, chunks, backlog_before, backlog_after, seconds, rate (rows/s), cutoff.
+    """
+    ttl_hours = settings.INVITATION_TTL_HOURS if ttl_hours is None else ttl_hours
+    chunk_size = chunk_size or settings.INVITATION_SWEEP_CHUNK_SIZE
+    started = time.monotonic()
+    cutoff = now() - timedelta(hours=ttl_hours)
+    backlog_before = expired_backlog(cutoff)
+
+    expired = chunks = 0
+    if not dry_run:
+        stale = Invitation.objects.filter(status="sent", sent_at__lt=cutoff)
+        while True:
+            rows = list(stale.order_by("sent_at", "id").values_list("id", "developer_id")[:chunk_size])
+            if not rows:
+                break
+            expired += Invitation.objects.filter(id__in=[i for i, _ in rows], status="sent").update(status="expired")
+            invalidate(*{("developer-invites", dev_id) for _, dev_id in rows})
+            chunks += 1
+            if len(rows) < chunk_size:
+                break
+
+    seconds = time.monotonic() - started
+    stats = {
+        "expired": expired,
+        "chunks": chunks,
+        "backlog_before": backlog_before,
+        "backlog_after": backlog_before if dry_run else expired_backlog(cutoff),
+        "seconds": round(seconds, 3),
+        "rate": round(expired / seconds, 1) if seconds > 0 else 0.0,
+        "cutoff": cutoff.isoformat(),
+        "dry_run": dry_run,
+    }
+    with _stats_lock:
+        _last_sweep.clear()
+        _last_sweep.update(stats)
+    logging.info(
+        "[invitation_expiry] expired=%(expired)d chunks=%(chunks)d backlog_before=%(backlog_before)d "
+        "backlog_after=%(backlog_after)d seconds=%(seconds).3f rate=%(rate).1f/s",
+        stats,
+    )
+    return stats
+
+
+def last_sweep_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        return dict(_last_sweep)
@@ -0,0 +1,76 @@
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.utils.timezone import now
+
+from HireMe.models import Challenge
+from HireMe.response_cache import invalidate
+from Recruiter.models import CandidateRecommendation, Invitation, Project
+from Recruiter.outbox import enqueue_invitations
+
+
+def top_recommended_developer_ids(project: Project, top_n: int, min_fit_score: float = 0.0) -> List[int]:
+    """Developer ids of the project's best recommendations, best first."""
+    return list(
+        CandidateRecommendation.objects.filter(project=project, fit_score__gte=min_fit_score)
+        .order_by("-fit_score").values_list("developer_id", flat=True)[:top_n]
+    )
+
+
+def bulk_upsert_invitations(
+    project: Project,
+    developer_ids: Iterable[int],
+    challenge: Optional[Challenge] = None,
+    message: str = "",
+) -> Dict[str, List[int]]:
+    """
+    Invite many developers to a project with one INSERT ... ON CONFLICT (project, developer)
+    statement. Existing invitations are handled like ProjectViewSet.invite: re-sent
+    with a fresh sent_at, and message/challenge replaced only when given.
+
+    The created/updated split is read under a lock on the project row, which every
+    invitation writer (this and Recruiter.automation) takes first, so it matches what
+    the upsert did.
+
+    Returns:
+        dict: {"created": [developer_id, ...], "updated": [developer_id, ...]}
+    """
+    developer_ids = list(dict.fromkeys(developer_ids))
+    if not developer_ids:
+        return {"created": [], "updated": []}
+
+    sent_at = now()
+    update_fields = ["status", "sent_at"]
+    if message:
+        update_fields.append("message")
+    if challenge is not None:
+        update_fields.append("challenge")
+
+    with transaction.atomic():
+        list(Project.objects.select_for_update().filter(pk=project.pk).values_list("id", flat=True))
+        existing = set(
+            Invitation.objects.filter(project=project, developer_id__in=developer_ids)
+            .values_list("developer_id", flat=True)
+        )
+        Invitation.objects.bulk_create(
+            [
+                Invitation(
+                    project=project,
+                    developer_id=dev_id,
+                    challenge=challenge,
+                    message=message,
+                    status="sent",
+                    sent_at=sent_at,
+                )
+                for dev_id in developer_ids
+            ],
+            update_conflicts=True,
+            unique_fields=["project", "developer"],
+            update_fields=update_fields,
+        )
+        enqueue_invitations(Invitation.objects.filter(project=project, developer_id__in=developer_ids, sent_at=sent_at))
+        invalidate(*(("developer-invites", dev_id) for dev_id in developer_ids))
+    return {
+        "created": [d for d in developer_ids if d not in existing],
+        "updated": [d for d in developer_ids if d in existing],
+    }
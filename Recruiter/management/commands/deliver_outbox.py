@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from Recruiter.outbox import deliver_pending, queue_depth
+
+
+class Command(BaseCommand):
+    help = "Deliver queued notifications (OutboxMessage rows) over one SMTP session per run."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Defaults to settings.OUTBOX_BATCH_SIZE.")
+        parser.add_argument("--rate", type=float, default=None, help="Messages per second; defaults to settings.OUTBOX_RATE_PER_SECOND.")
+        parser.add_argument(
+            "--every", type=float, default=None, metavar="SECONDS",
+            help="Keep running, delivering every SECONDS (default: deliver what is due and exit).",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] is not None and options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive")
+        while True:
+            stats = deliver_pending(batch_size=options["batch_size"], rate_per_second=options["rate"])
+            self.stdout.write(
+                f"sent={stats['sent']} retried={stats['retried']} failed={stats['failed']} "
+                f"batches={stats['batches']} seconds={stats['seconds']} queued={queue_depth()}"
+            )
+            if not options["every"]:
+                break
+            time.sleep(options["every"])
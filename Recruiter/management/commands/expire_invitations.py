@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Recruiter.expiry import sweep_expired_invitations
+
+
+class Command(BaseCommand):
+    help = "Mark 'sent' invitations older than INVITATION_TTL_HOURS as 'expired', in small chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ttl-hours", type=float, default=None, help="Defaults to settings.INVITATION_TTL_HOURS.")
+        parser.add_argument("--chunk-size", type=int, default=None, help="Defaults to settings.INVITATION_SWEEP_CHUNK_SIZE.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report the backlog.")
+        parser.add_argument(
+            "--every", type=float, default=None, metavar="SECONDS",
+            help="Keep running, sweeping every SECONDS (default: sweep once and exit).",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] is not None and options["chunk_size"] <= 0:
+            raise CommandError("--chunk-size must be positive")
+        while True:
+            stats = sweep_expired_invitations(
+                ttl_hours=options["ttl_hours"], chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+            )
+            self.stdout.write(
+                f"expired={stats['expired']} chunks={stats['chunks']} backlog_before={stats['backlog_before']} "
+                f"backlog_after={stats['backlog_after']} seconds={stats['seconds']} rate={stats['rate']}/s"
+            )
+            if not options["every"]:
+                break
+            time.sleep(options["every"])
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Recruiter.automation import run_automation_tick
+
+
+class Command(BaseCommand):
+    help = "Run the automation loop (re-rank, invite, advance status) for projects with automation_enabled."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Projects per batch (settings.AUTOMATION_BATCH_SIZE).")
+        parser.add_argument("--llm-concurrency", type=int, default=None, help="Max LLM calls in flight.")
+        parser.add_argument(
+            "--every", type=float, default=None, metavar="SECONDS",
+            help="Keep running, one tick every SECONDS (default: one tick and exit).",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            stats = run_automation_tick(batch_size=options["batch_size"], llm_concurrency=options["llm_concurrency"])
+            self.stdout.write(" ".join(f"{k}={v}" for k, v in sorted(stats.items())))
+            if not options["every"]:
+                break
+            time.sleep(options["every"])
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0010_hot_path_indexes'),
+        ('Recruiter', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidaterecommendation',
+            index=models.Index(fields=['project', '-fit_score'], name='rec_project_fit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['developer', '-sent_at'], name='invitation_dev_sent_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HireMe', '0012_leaderboardsnapshot'),
+        ('Recruiter', '0002_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['status', 'sent_at'], name='invitation_status_sent_idx'),
+        ),
+    ]
@@ -46,6 +46,9 @@ class CandidateRecommendation(models.Model):
 
     class Meta:
         unique_together = ("project", "developer")
+        indexes = [
+            models.Index(fields=["project", "-fit_score"], name="rec_project_fit_idx"),
+        ]
 
 
 class Invitation(models.Model):
@@ -67,3 +70,50 @@ class Invitation(models.Model):
 
     class Meta:
         unique_together = ("project", "developer")
+        indexes = [
+            models.Index(fields=["developer", "-sent_at"], name="invitation_dev_sent_idx"),
+            # expiry sweeper: status='sent' AND sent_at < cutoff
+            models.Index(fields=["status", "sent_at"], name="invitation_status_sent_idx"),
+        ]
+
+
+class OutboxMessage(models.Model):
+    """
+    A notification waiting to be delivered (see Recruiter.outbox). Rows are written in the
+    same transaction as the change they announce and delivered later by a worker.
+    """
+    CHANNELS = [
+        ("email", "Email"),
+        ("sms", "SMS"),
+    ]
+    STATUS = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    # One row per logical message: enqueueing the same key twice is a no-op.
+    dedupe_key = models.CharField(max_length=191, unique=True)
+    channel = models.CharField(max_length=16, choices=CHANNELS, default="email")
+    recipient = models.CharField(max_length=254)
+    subject = models.CharField(max_length=255, blank=True, default="")
+    body = models.TextField()
+    invitation = models.ForeignKey(Invitation, null=True, blank=True, related_name="notifications", on_delete=models.SET_NULL)
+    status = models.CharField(max_length=16, choices=STATUS, default="pending")
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    next_attempt_at = models.DateTimeField(default=now)
+    claimed_by = models.CharField(max_length=32, blank=True, default="")
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # delivery worker: status='pending' AND next_attempt_at <= now, oldest first
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_status_due_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.channel} to {self.recipient} ({self.status})"
@@ -0,0 +1,224 @@
+"""
+Transactional outbox for notifications.
+
+Senders only insert OutboxMessage rows, in the same transaction as the change they
+announce, so a notification exists exactly when its change committed. The delivery
+worker (deliver_pending) claims due rows in batches, sends a whole batch over one
+SMTP connection at no more than OUTBOX_RATE_PER_SECOND, and marks each row sent as
+soon as the transport accepted it. Failures are retried with exponential backoff
+until OUTBOX_MAX_ATTEMPTS.
+
+Each row has a unique dedupe_key, so enqueueing the same notification twice is a
+no-op, and a sent row is never picked up again. Claims are leases: rows left in
+"sending" by a crashed worker go back to pending after OUTBOX_LEASE_SECONDS. That
+crash window is the only way a message can go out twice; its Message-ID is derived
+from the row, so mail servers and clients can drop the duplicate.
+"""
+import logging
+import smtplib
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.utils import DNS_NAME
+from django.db.models import F
+from django.utils.timezone import now
+
+from Recruiter.models import Invitation, OutboxMessage
+
+MAX_RETRY_DELAY_SECONDS = 3600
+
+# The recipient will never be accepted; retrying doesn't help.
+PERMANENT_ERRORS = (smtplib.SMTPRecipientsRefused, ValueError)
+
+
+def invitation_dedupe_key(invitation: Invitation) -> str:
+    # A re-sent invitation gets a fresh sent_at, and with it a new notification.
+    return f"invitation:{invitation.id}:{int(invitation.sent_at.timestamp() * 1000)}"
+
+
+def _invitation_message(invitation: Invitation) -> OutboxMessage:
+    project = invitation.project
+    lines = [f"Hi {invitation.developer.full_name},", "", f"You've been invited to join \"{project.project_name}\"."]
+    if invitation.challenge is not None:
+        lines.append(f"Your challenge: {invitation.challenge.title}")
+    if invitation.message:
+        lines += ["", invitation.message]
+    return OutboxMessage(
+        dedupe_key=invitation_dedupe_key(invitation),
+        channel="email",
+        recipient=invitation.developer.email,
+        subject=f"Invitation: {project.project_name}",
+        body="\n".join(lines),
+        invitation=invitation,
+    )
+
+
+def enqueue(messages: Iterable[OutboxMessage]) -> None:
+    """Queue messages; ones whose dedupe_key is already queued (or sent) are skipped."""
+    OutboxMessage.objects.bulk_create(list(messages), ignore_conflicts=True, batch_size=500)
+
+
+def enqueue_invitations(invitations) -> None:
+    """Queue an invitation email for each invitation (a queryset or list of ids). Call inside the write's transaction."""
+    ids = invitations.values_list("id", flat=True) if hasattr(invitations, "values_list") else list(invitations)
+    rows = Invitation.objects.filter(id__in=ids).select_related("developer", "project", "challenge")
+    enqueue(_invitation_message(inv) for inv in rows)
+
+
+class _RateLimiter:
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self.next_at = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        delay = self.next_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_at = max(self.next_at, time.monotonic()) + self.interval
+
+
+class EmailTransport:
+    """Django's email backend, with one connection kept open for the whole batch."""
+
+    def __init__(self):
+        self.connection = None
+
+    def _connection(self):
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=False)
+        if getattr(self.connection, "connection", True) is None:
+            self.connection.open()
+        return self.connection
+
+    def send(self, message: OutboxMessage) -> None:
+        email = EmailMessage(
+            subject=message.subject,
+            body=message.body,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[message.recipient],
+            headers={"Message-ID": f"<outbox-{message.id}@{DNS_NAME}>"},
+            connection=self._connection(),
+        )
+        try:
+            email.send()
+        except smtplib.SMTPServerDisconnected:
+            # Drop the dead session; the next message opens a new one.
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+
+
+class SmsTransport:
+    def send(self, message: OutboxMessage) -> None:
+        from TalentAI.extract.message import get_config, get_twilio_client
+
+        get_twilio_client().messages.create(body=message.body, from_=get_config()["TWILIO_PHONE"], to=message.recipient)
+
+    def close(self) -> None:
+        pass
+
+
+TRANSPORTS = {
+    "email": EmailTransport,
+    "sms": SmsTransport,
+}
+
+
+def _release_expired_leases() -> int:
+    cutoff = now() - timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+    return OutboxMessage.objects.filter(status="sending", claimed_at__lt=cutoff).update(status="pending", claimed_by="")
+
+
+def _claim(batch_size: int, worker: str) -> List[OutboxMessage]:
+    due = OutboxMessage.objects.filter(status="pending", next_attempt_at__lte=now())
+    ids = list(due.order_by("next_attempt_at", "id").values_list("id", flat=True)[:batch_size])
+    if not ids:
+        return []
+    # Another worker may have claimed some of these in between; the status check skips them.
+    OutboxMessage.objects.filter(id__in=ids, status="pending").update(status="sending", claimed_by=worker, claimed_at=now())
+    return list(OutboxMessage.objects.filter(id__in=ids, status="sending", claimed_by=worker).order_by("id"))
+
+
+def _retry_delay(attempts: int) -> float:
+    return min(MAX_RETRY_DELAY_SECONDS, settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1))
+
+
+def _record_failure(message: OutboxMessage, worker: str, error: Exception, stats: Dict[str, Any]) -> None:
+    attempts = message.attempts + 1
+    give_up = isinstance(error, PERMANENT_ERRORS) or attempts >= settings.OUTBOX_MAX_ATTEMPTS
+    OutboxMessage.objects.filter(id=message.id, claimed_by=worker).update(
+        status="failed" if give_up else "pending",
+        attempts=attempts,
+        last_error=f"{type(error).__name__}: {error}"[:2000],
+        next_attempt_at=now() + timedelta(seconds=_retry_delay(attempts)),
+        claimed_by="",
+    )
+    stats["failed" if give_up else "retried"] += 1
+    logging.warning(f"[outbox] {message.channel} #{message.id} attempt {attempts} failed: {error}")
+
+
+def deliver_pending(
+    batch_size: Optional[int] = None,
+    rate_per_second: Optional[float] = None,
+    max_batches: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Deliver due messages, a batch at a time, until none are due (or max_batches).
+
+    Returns:
+        dict: sent, retried, failed, batches, seconds.
+    """
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    rate = settings.OUTBOX_RATE_PER_SECOND if rate_per_second is None else rate_per_second
+    worker = uuid.uuid4().hex
+    limiter = _RateLimiter(rate)
+    transports: Dict[str, Any] = {}
+    stats: Dict[str, Any] = {"sent": 0, "retried": 0, "failed": 0, "batches": 0}
+    started = time.monotonic()
+
+    _release_expired_leases()
+    try:
+        while max_batches is None or stats["batches"] < max_batches:
+            batch = _claim(batch_size, worker)
+            if not batch:
+                break
+            stats["batches"] += 1
+            for message in batch:
+                limiter.wait()
+                try:
+                    transport = transports.get(message.channel)
+                    if transport is None:
+                        transport = transports[message.channel] = TRANSPORTS[message.channel]()
+                    transport.send(message)
+                except Exception as e:
+                    _record_failure(message, worker, e, stats)
+                    continue
+                OutboxMessage.objects.filter(id=message.id, claimed_by=worker).update(
+                    status="sent", sent_at=now(), attempts=F("attempts") + 1, last_error="", claimed_by=""
+                )
+                stats["sent"] += 1
+    finally:
+        for transport in transports.values():
+            try:
+                transport.close()
+            except Exception:
+                logging.exception("[outbox] Closing transport failed")
+
+    stats["seconds"] = round(time.monotonic() - started, 3)
+    if stats["batches"]:
+        logging.info("[outbox] " + " ".join(f"{k}={v}" for k, v in stats.items()))
+    return stats
+
+
+def queue_depth() -> int:
+    """Messages waiting to be delivered (pending or claimed)."""
+    return OutboxMessage.objects.filter(status__in=("pending", "sending")).count()
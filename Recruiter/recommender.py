@@ -1,7 +1,10 @@
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from HireMe.models import Developer
 from Recruiter.models import Project
+from TalentAI import metrics
+from TalentAI.tracing import span
 
 
 def _build_dev_skill_map(dev: Developer) -> Dict[str, Tuple[int, bool]]:
@@ -64,14 +67,23 @@ def compute_fit_score(project: Project, developer: Developer) -> Tuple[float, Di
     return round(final, 2), breakdown
 
 
-def recommend_candidates_for_project(project: Project, limit: int = 50) -> List[Tuple[Developer, float, Dict]]:
+def recommend_candidates_for_project(
+    project: Project, limit: int = 50, developers: Optional[Iterable[Developer]] = None
+) -> List[Tuple[Developer, float, Dict]]:
     """
-    Rank all developers by fit for the given project.
+    Rank all developers by fit for the given project. Pass `developers` (with skills
+    prefetched) to score many projects against one load of the developer table.
     """
-    developers = Developer.objects.prefetch_related("skills").all()
-    scored: List[Tuple[Developer, float, Dict]] = []
-    for dev in developers:
-        fit, breakdown = compute_fit_score(project, dev)
-        scored.append((dev, fit, breakdown))
-    scored.sort(key=lambda t: t[1], reverse=True)
-    return scored[:limit]
+    with span("recommender.rank", project=project.id) as s:
+        if developers is None:
+            developers = Developer.objects.prefetch_related("skills").all()
+        started = time.perf_counter()
+        scored: List[Tuple[Developer, float, Dict]] = []
+        for dev in developers:
+            fit, breakdown = compute_fit_score(project, dev)
+            scored.append((dev, fit, breakdown))
+        scored.sort(key=lambda t: t[1], reverse=True)
+        metrics.recommender_candidates.inc(len(scored))
+        metrics.recommender_seconds.inc(time.perf_counter() - started)
+        s.set(candidates=len(scored))
+        return scored[:limit]
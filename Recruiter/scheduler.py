@@ -0,0 +1,57 @@
+"""
+Minimal in-process periodic runner for maintenance jobs (invitation expiry,
+project automation, outbox delivery). One daemon thread per job; each run gets
+fresh DB connections.
+For multi-worker deployments prefer the matching management commands under cron.
+"""
+import logging
+import sys
+import threading
+from typing import Callable, Dict
+
+from django.db import close_old_connections
+
+_threads: Dict[str, threading.Thread] = {}
+_lock = threading.Lock()
+
+
+def _should_run_in_process() -> bool:
+    # Skip one-off management commands (migrate, shell, ...); servers and runserver are fine.
+    argv = sys.argv
+    if argv and argv[0].endswith("manage.py"):
+        return len(argv) > 1 and argv[1] == "runserver"
+    return True
+
+
+def _loop(name: str, interval: float, fn: Callable[[], object], stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        close_old_connections()
+        try:
+            fn()
+        except Exception:
+            logging.exception(f"[scheduler] {name} failed")
+        finally:
+            close_old_connections()
+
+
+def start_periodic(name: str, interval: float, fn: Callable[[], object]) -> bool:
+    """Run `fn` every `interval` seconds in a daemon thread, once per process. Returns True if started."""
+    if interval <= 0 or not _should_run_in_process():
+        return False
+    with _lock:
+        if name in _threads:
+            return False
+        stop = threading.Event()
+        thread = threading.Thread(target=_loop, args=(name, interval, fn, stop), name=f"periodic-{name}", daemon=True)
+        thread.stop_event = stop
+        _threads[name] = thread
+        thread.start()
+    logging.info(f"[scheduler] {name} every {interval:g}s")
+    return True
+
+
+def stop_periodic(name: str) -> None:
+    with _lock:
+        thread = _threads.pop(name, None)
+    if thread is not None:
+        thread.stop_event.set()
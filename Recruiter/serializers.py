@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from Recruiter.models import Project, ProjectSkill, CandidateRecommendation, Invitation
 from HireMe.serializers import DeveloperSerializer, ChallengeSerializer
+from TalentAI.tracing import TracedListSerializer, TracedSerializerMixin
 
 
 class ProjectSkillSerializer(serializers.ModelSerializer):
@@ -21,12 +22,13 @@ class ProjectSkillSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     required_skills = ProjectSkillSerializer(many=True, required=False)
 
     class Meta:
         model = Project
         fields = "__all__"
+        list_serializer_class = TracedListSerializer
 
     def create(self, validated_data):
         skills_data = validated_data.pop("required_skills", [])
@@ -82,18 +84,20 @@ class ProjectSerializer(serializers.ModelSerializer):
         return instance
 
 
-class CandidateRecommendationSerializer(serializers.ModelSerializer):
+class CandidateRecommendationSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     developer = DeveloperSerializer()
 
     class Meta:
         model = CandidateRecommendation
         fields = "__all__"
+        list_serializer_class = TracedListSerializer
 
 
-class InvitationSerializer(serializers.ModelSerializer):
+class InvitationSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     developer = DeveloperSerializer(read_only=True)
     challenge = ChallengeSerializer(read_only=True)
 
     class Meta:
         model = Invitation
         fields = "__all__"
+        list_serializer_class = TracedListSerializer
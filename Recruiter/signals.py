@@ -0,0 +1,33 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from HireMe.response_cache import invalidate
+from Recruiter.models import CandidateRecommendation, Invitation, Project
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project(sender, instance, **kwargs):
+    invalidate(("project", instance.id))
+
+
+@receiver(m2m_changed, sender=Project.required_skills.through)
+def invalidate_project_skills(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate(("project", instance.id))
+    else:
+        invalidate(*(("project", project_id) for project_id in pk_set or []))
+
+
+@receiver(post_save, sender=CandidateRecommendation)
+@receiver(post_delete, sender=CandidateRecommendation)
+def invalidate_recommendations(sender, instance, **kwargs):
+    invalidate(("project-recs", instance.project_id))
+
+
+@receiver(post_save, sender=Invitation)
+@receiver(post_delete, sender=Invitation)
+def invalidate_invitations(sender, instance, **kwargs):
+    invalidate(("developer-invites", instance.developer_id))
@@ -1,3 +1,280 @@
-from django.test import TestCase
+import json
+import socketserver
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from HireMe.llm import reset_router
+from HireMe.models import Developer, Submission
+from HireMe.tests import QueryPlanAssertions
+from Recruiter import async_views, automation
+from Recruiter.invitations import bulk_upsert_invitations
+from Recruiter.models import CandidateRecommendation, Invitation, OutboxMessage, Project
+from Recruiter.outbox import deliver_pending
+
+
+class HotPathQueryPlanTests(QueryPlanAssertions, TestCase):
+    def test_recommendations_by_fit(self):
+        self.assertUsesIndex(CandidateRecommendation.objects.filter(project_id=1).order_by("-fit_score")[:20])
+
+    def test_invitations_by_developer(self):
+        self.assertUsesIndex(Invitation.objects.filter(developer_id=1).order_by("-sent_at"))
+
+    def test_expiry_sweep_chunk(self):
+        self.assertUsesIndex(
+            Invitation.objects.filter(status="sent", sent_at__lt=now()).order_by("sent_at", "id").values_list("id")[:1000]
+        )
+
+
+class BulkUpsertInvitationsTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(project_name="Payments")
+        self.developers = [
+            Developer.objects.create(full_name=f"Dev {i}", email=f"dev{i}@example.com") for i in range(3)
+        ]
+
+    def test_splits_created_and_updated(self):
+        first, second, third = (d.id for d in self.developers)
+        self.assertEqual(
+            bulk_upsert_invitations(self.project, [first, second, first]),
+            {"created": [first, second], "updated": []},
+        )
+        Invitation.objects.filter(developer_id=first).update(status="declined", message="old")
+
+        result = bulk_upsert_invitations(self.project, [third, first])
+        self.assertEqual(result, {"created": [third], "updated": [first]})
+        self.assertEqual(Invitation.objects.filter(project=self.project).count(), 3)
+        resent = Invitation.objects.get(developer_id=first)
+        self.assertEqual((resent.status, resent.message), ("sent", "old"))  # message kept when none is given
+
+        bulk_upsert_invitations(self.project, [first], message="Try again")
+        self.assertEqual(Invitation.objects.get(developer_id=first).message, "Try again")
+
+    def test_split_is_read_under_the_project_lock(self):
+        with CaptureQueriesContext(connection) as ctx:
+            bulk_upsert_invitations(self.project, [self.developers[0].id])
+        sql = [q["sql"] for q in ctx.captured_queries]
+        lock = next(i for i, q in enumerate(sql) if '"Recruiter_project"' in q)
+        read = next(i for i, q in enumerate(sql) if q.startswith('SELECT "Recruiter_invitation"."developer_id"'))
+        self.assertLess(lock, read)
+        if connection.features.has_select_for_update:
+            self.assertIn("FOR UPDATE", sql[lock])
+
+    def test_empty_input(self):
+        self.assertEqual(bulk_upsert_invitations(self.project, []), {"created": [], "updated": []})
+        self.assertFalse(Invitation.objects.exists())
+
+
+SUGGESTION = {"challenges": [{"title": "Build a rate limiter", "difficulty": "intermediate"}]}
+
+
+@override_settings(AUTOMATION_INVITES_PER_ROUND=10, AUTOMATION_MIN_FIT_SCORE=50, AUTOMATION_CLOSE_AFTER_COMPLETIONS=1)
+class AutomationTickTests(TestCase):
+    def setUp(self):
+        # No required skills, so fit is dev_score / 10: 90, 80 and 10.
+        self.project = Project.objects.create(project_name="Payments", status="matching", automation_enabled=True)
+        self.strong, self.good, self.weak = (
+            Developer.objects.create(full_name=f"Dev {score}", email=f"dev{score}@example.com", dev_score=score)
+            for score in (900, 800, 100)
+        )
+
+    def tick(self, suggestion=SUGGESTION, **kwargs):
+        with mock.patch.object(automation, "ai_suggest_challenges_for_project", **kwargs, return_value=suggestion) as llm:
+            stats = automation.run_automation_tick()
+        self.project.refresh_from_db()
+        return stats, llm
+
+    def test_matching_to_challenging_to_closed(self):
+        stats, llm = self.tick()
+        self.assertEqual(llm.call_count, 1)
+        self.assertEqual(self.project.status, "challenging")
+        self.assertEqual(stats["invited"], 2)
+        invitations = Invitation.objects.filter(project=self.project)
+        self.assertEqual({i.developer_id for i in invitations}, {self.strong.id, self.good.id})
+        challenge = invitations[0].challenge
+        self.assertEqual(challenge.title, "Build a rate limiter")
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+        self.assertEqual(CandidateRecommendation.objects.filter(project=self.project).count(), 3)
+
+        # Invitations still open: nothing changes.
+        stats, llm = self.tick()
+        self.assertEqual((self.project.status, stats.get("invited", 0)), ("challenging", 0))
+        llm.assert_not_called()
+
+        Invitation.objects.filter(developer=self.strong).update(status="accepted")
+        Submission.objects.create(
+            developer=self.strong, challenge=challenge, bug_analysis="", answer="", status="completed"
+        )
+        stats, _ = self.tick()
+        self.assertEqual(stats["completed_invitations"], 1)
+        self.assertEqual(self.project.status, "closed")
+        self.assertEqual(Invitation.objects.get(developer=self.strong).status, "completed")
+
+    def test_invites_only_uninvited_candidates_above_the_threshold(self):
+        Invitation.objects.create(project=self.project, developer=self.strong, status="declined")
+        stats, _ = self.tick()
+        self.assertEqual(stats["invited"], 1)
+        self.assertEqual(Invitation.objects.get(developer=self.good).status, "sent")
+        self.assertFalse(Invitation.objects.filter(developer=self.weak).exists())
+
+    def test_counts_only_inserted_invitations(self):
+        project_challenges = automation._project_challenges
+
+        def racing_invite(project_ids):
+            # Another writer invites a candidate between selection and insert.
+            Invitation.objects.create(project=self.project, developer=self.good, status="sent")
+            return project_challenges(project_ids)
+
+        with mock.patch.object(automation, "_project_challenges", side_effect=racing_invite):
+            stats, _ = self.tick()
+        self.assertEqual(stats["invited"], 1)
+        self.assertEqual(Invitation.objects.filter(project=self.project).count(), 2)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_llm_failure_keeps_the_project_matching(self):
+        with self.assertLogs(level="ERROR"):
+            stats, llm = self.tick(side_effect=RuntimeError("LLM down"))
+        self.assertEqual(llm.call_count, 1)
+        self.assertEqual(self.project.status, "matching")
+        self.assertEqual(stats.get("invited", 0), 0)
+        self.assertFalse(Invitation.objects.exists())
+
+        # An empty suggestion is no better; the next tick asks again.
+        stats, llm = self.tick(suggestion={})
+        self.assertEqual((self.project.status, llm.call_count), ("matching", 1))
+        self.assertFalse(Invitation.objects.exists())
+
+        stats, _ = self.tick()
+        self.assertEqual((self.project.status, stats["invited"]), ("challenging", 2))
+
+
+@override_settings(LLM_PROVIDERS=["stub"])
+class AsyncCreateProjectTests(TestCase):
+    def setUp(self):
+        reset_router()
+        self.addCleanup(reset_router)
+        Developer.objects.create(full_name="Ada", email="ada@example.com", dev_score=700)
+
+    async def test_creates_project_with_recommendations(self):
+        request = AsyncRequestFactory().post(
+            "/api/Recruiter/async/projects/",
+            {"project_name": "Payments", "required_skills": [{"name": "Python", "required_level": 70}]},
+            content_type="application/json",
+        )
+        response = await async_views.create_project(request)
+        self.assertEqual(response.status_code, 201)
+        body = json.loads(response.content)["body"]
+        self.assertEqual((body["project"]["project_name"], body["project"]["status"]), ("Payments", "matching"))
+        self.assertEqual(len(body["recommendations"]), 1)
+        self.assertIn("challenges", body["ai_suggestions"])
+        project = await Project.objects.aget()
+        self.assertEqual(await project.required_skills.acount(), 1)
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: records connections and messages, can refuse DATA."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                return
+            command = line[:4].upper()
+            if command in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif command == "DATA":
+                self.reply("354 go ahead")
+                data = []
+                while (chunk := self.rfile.readline().decode()) not in (".\r\n", ""):
+                    data.append(chunk)
+                if server.refuse_next:
+                    server.refuse_next -= 1
+                    self.reply("451 try again later")
+                else:
+                    server.messages.append("".join(data))
+                    self.reply("250 queued")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self.reply("250 ok")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.refuse_next = 0
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class OutboxDeliveryTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(project_name="Payments")
+        self.developers = [
+            Developer.objects.create(full_name=f"Dev {i}", email=f"dev{i}@example.com") for i in range(3)
+        ]
+
+    def deliver(self, smtp, **kwargs):
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=smtp.server_address[1],
+            EMAIL_USE_TLS=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+        ):
+            return deliver_pending(rate_per_second=0, **kwargs)
+
+    def test_invitations_delivered_once_over_one_session(self):
+        dev_ids = [d.id for d in self.developers]
+        bulk_upsert_invitations(self.project, dev_ids)
+        self.assertEqual(OutboxMessage.objects.filter(status="pending").count(), 3)
+
+        with LocalSMTPServer() as smtp:
+            stats = self.deliver(smtp)
+            self.assertEqual(stats["sent"], 3)
+            self.assertEqual(len(smtp.messages), 3)
+            self.assertEqual(smtp.connections, 1)
+            self.assertIn("Payments", smtp.messages[0])
+
+            # Nothing is due any more; a second run sends nothing.
+            self.assertEqual(self.deliver(smtp)["sent"], 0)
+            self.assertEqual(len(smtp.messages), 3)
+        self.assertEqual(OutboxMessage.objects.filter(status="sent").count(), 3)
+
+    def test_transient_failure_is_retried_later(self):
+        bulk_upsert_invitations(self.project, [self.developers[0].id])
+        with LocalSMTPServer() as smtp:
+            smtp.refuse_next = 1
+            stats = self.deliver(smtp)
+        self.assertEqual((stats["sent"], stats["retried"]), (0, 1))
+        message = OutboxMessage.objects.get()
+        self.assertEqual((message.status, message.attempts), ("pending", 1))
+        self.assertGreater(message.next_attempt_at, now())
+
+        OutboxMessage.objects.update(next_attempt_at=now())
+        with LocalSMTPServer() as smtp:
+            self.assertEqual(self.deliver(smtp)["sent"], 1)
+        self.assertEqual(OutboxMessage.objects.get().status, "sent")
@@ -1,10 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from Recruiter import async_views
 from Recruiter.views import ProjectViewSet
 
 router = DefaultRouter()
 router.register(r"projects", ProjectViewSet, basename="projects")
 
 urlpatterns = [
+    path("async/projects/", async_views.create_project, name="async-create-project"),
     path("", include(router.urls)),
 ]
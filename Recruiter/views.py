@@ -1,4 +1,6 @@
 import logging
+from typing import Any, Dict, List, Tuple
+
 from django.db import transaction
 from django.utils.timezone import now
 
@@ -13,9 +15,65 @@ from Recruiter.serializers import (
     CandidateRecommendationSerializer,
     InvitationSerializer,
 )
+from Recruiter.invitations import bulk_upsert_invitations, top_recommended_developer_ids
+from Recruiter.outbox import enqueue_invitations
 from Recruiter.recommender import recommend_candidates_for_project
+from HireMe.response_cache import CATALOG, cached_response
 from HireMe.utils import create_response
 from Recruiter.agent import ai_suggest_challenges_for_project
+from TalentAI.renderers import ORJSONParser, ORJSONRenderer
+from TalentAI.tracing import traced
+
+
+@traced("db.save_project_with_recommendations")
+def save_project_with_recommendations(serializer: ProjectSerializer) -> Project:
+    """Save a validated ProjectSerializer as a 'matching' project and store its top 100 recommendations."""
+    project: Project = serializer.save(status="matching")
+
+    ranked = recommend_candidates_for_project(project, limit=100)
+    CandidateRecommendation.objects.filter(project=project).delete()
+
+    created = 0
+    for dev, fit, breakdown in ranked:
+        CandidateRecommendation.objects.create(
+            project=project,
+            developer=dev,
+            fit_score=fit,
+            rationale=(
+                f"Skill match {breakdown.get('skill_score', 0)}%, "
+                f"dev adj {breakdown.get('dev_score_component', 0)}"
+            ),
+        )
+        created += 1
+
+    project.target_count = created
+    project.save(update_fields=["target_count"])
+    return project
+
+
+def challenge_suggestion_payload(project: Project) -> Dict[str, Any]:
+    return {
+        "project_name": project.project_name,
+        "description": project.description,
+        "required_skills": list(project.required_skills.values("name", "required_level")),
+    }
+
+
+def project_created_body(project: Project, ai_suggestions: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "project": ProjectSerializer(project).data,
+        "recommendations": CandidateRecommendationSerializer(
+            CandidateRecommendation.objects.filter(project=project)
+            .order_by("-fit_score")[:20],
+            many=True,
+        ).data,
+        "ai_suggestions": ai_suggestions,
+    }
+
+
+def _recommendation_dependencies(pk) -> List[Tuple[Any, ...]]:
+    dev_ids = CandidateRecommendation.objects.filter(project_id=int(pk)).values_list("developer_id", flat=True)
+    return [("project-recs", pk), CATALOG, *(("developer", dev_id) for dev_id in dev_ids)]
 
 
 class ProjectViewSet(viewsets.ModelViewSet):
@@ -27,52 +85,18 @@ class ProjectViewSet(viewsets.ModelViewSet):
         try:
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
-            project: Project = serializer.save(status="matching")
-
-            ranked = recommend_candidates_for_project(project, limit=100)
-            CandidateRecommendation.objects.filter(project=project).delete()
-
-            created = 0
-            for dev, fit, breakdown in ranked:
-                CandidateRecommendation.objects.create(
-                    project=project,
-                    developer=dev,
-                    fit_score=fit,
-                    rationale=(
-                        f"Skill match {breakdown.get('skill_score', 0)}%, "
-                        f"dev adj {breakdown.get('dev_score_component', 0)}"
-                    ),
-                )
-                created += 1
-
-            project.target_count = created
-            project.save(update_fields=["target_count"])
-
-            payload = {
-                "project_name": project.project_name,
-                "description": project.description,
-                "required_skills": list(project.required_skills.values("name", "required_level")),
-            }
+            project = save_project_with_recommendations(serializer)
 
             try:
-                ai_suggestions = ai_suggest_challenges_for_project(payload) or {}
+                ai_suggestions = ai_suggest_challenges_for_project(challenge_suggestion_payload(project)) or {}
             except Exception as e:
                 logging.warning("AI suggestions failed: %s", e, exc_info=True)
                 ai_suggestions = {}
 
-            resp = {
-                "project": ProjectSerializer(project).data,
-                "recommendations": CandidateRecommendationSerializer(
-                    CandidateRecommendation.objects.filter(project=project)
-                    .order_by("-fit_score")[:20],
-                    many=True,
-                ).data,
-                "ai_suggestions": ai_suggestions,
-            }
             return create_response(
                 True,
                 "Project created with recommendations",
-                resp,
+                project_created_body(project, ai_suggestions),
                 status_code=status.HTTP_201_CREATED,
             )
         except Exception as e:
@@ -80,7 +104,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
             logging.exception("Project creation failed")
             return create_response(False, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    @action(detail=True, methods=["get"])
+    @cached_response("project", lambda pk: [("project", pk)])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @action(detail=True, methods=["get"], renderer_classes=[ORJSONRenderer])
+    @cached_response("project-recs", _recommendation_dependencies)
     def recommendations(self, request, pk=None):
         project = self.get_object()
         recs = CandidateRecommendation.objects.filter(project=project).order_by("-fit_score")
@@ -106,18 +135,70 @@ class ProjectViewSet(viewsets.ModelViewSet):
             if not challenge:
                 return Response({"error": "Invalid challenge_id"}, status=400)
 
-        inv, created = Invitation.objects.get_or_create(
-            project=project,
-            developer=developer,
-            defaults={"challenge": challenge, "message": msg, "status": "sent"}
-        )
-        if not created:
-            if msg:
-                inv.message = msg
-            if challenge:
-                inv.challenge = challenge
-            inv.status = "sent"
-            inv.sent_at = now()
-            inv.save()
+        with transaction.atomic():
+            inv, created = Invitation.objects.get_or_create(
+                project=project,
+                developer=developer,
+                defaults={"challenge": challenge, "message": msg, "status": "sent"}
+            )
+            if not created:
+                if msg:
+                    inv.message = msg
+                if challenge:
+                    inv.challenge = challenge
+                inv.status = "sent"
+                inv.sent_at = now()
+                inv.save()
+            enqueue_invitations([inv.id])
 
         return Response(InvitationSerializer(inv).data, status=201 if created else 200)
+
+    @action(detail=True, methods=["post"], parser_classes=[ORJSONParser])
+    def bulk_invite(self, request, pk=None):
+        """
+        Invite many developers at once.
+        Body: { "developer_ids": [<id>, ...] }  or  { "top_n": <int>, "min_fit_score": <0-100, default 0> },
+              plus optional "challenge_id" and "message".
+        """
+        project = self.get_object()
+        data = request.data
+        ch_id = data.get("challenge_id")
+        msg = data.get("message", "")
+
+        challenge = None
+        if ch_id:
+            challenge = Challenge.objects.filter(id=ch_id).first()
+            if not challenge:
+                return Response({"error": "Invalid challenge_id"}, status=400)
+
+        invalid: List[Any] = []
+        if data.get("developer_ids") is not None:
+            requested = data.get("developer_ids")
+            if not isinstance(requested, list):
+                return Response({"error": "developer_ids must be a list"}, status=400)
+            valid = set(Developer.objects.filter(id__in=[i for i in requested if str(i).isdigit()]).values_list("id", flat=True))
+            developer_ids = [int(i) for i in requested if str(i).isdigit() and int(i) in valid]
+            invalid = [i for i in requested if not (str(i).isdigit() and int(i) in valid)]
+        elif data.get("top_n") is not None:
+            try:
+                top_n = int(data.get("top_n"))
+                min_fit = float(data.get("min_fit_score", 0))
+            except (TypeError, ValueError):
+                return Response({"error": "top_n and min_fit_score must be numbers"}, status=400)
+            if top_n <= 0:
+                return Response({"error": "top_n must be positive"}, status=400)
+            developer_ids = top_recommended_developer_ids(project, top_n, min_fit)
+        else:
+            return Response({"error": "Provide developer_ids or top_n"}, status=400)
+
+        result = bulk_upsert_invitations(project, developer_ids, challenge=challenge, message=msg)
+        return Response(
+            {
+                "created": len(result["created"]),
+                "updated": len(result["updated"]),
+                "created_developer_ids": result["created"],
+                "updated_developer_ids": result["updated"],
+                "invalid_developer_ids": invalid,
+            },
+            status=201 if result["created"] else 200,
+        )
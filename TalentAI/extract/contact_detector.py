@@ -0,0 +1,121 @@
+"""
+Deterministic contact detection (email, phone, LinkedIn).
+
+One precompiled alternation is scanned once per text; each named group is either a
+clear hit, or a "maybe" (obfuscated email, bare "linkedin" mention, digit run that
+may or may not be a phone number). Each field gets a decision and a confidence, and
+only fields below the caller's confidence threshold need the LLM.
+"""
+import re
+from typing import Dict, List, Optional
+
+FIELDS = ("email", "phone", "linkedin")
+
+_PATTERN = re.compile(
+    r"""
+    (?P<linkedin>(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub|company)/[\w\-%.]+)
+  | (?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-z]{2,})
+  | (?P<email_maybe>\b[\w.+-]+\s*(?:\[at\]|\(at\)|\s+at\s+)\s*[\w-]+\s*(?:\[dot\]|\(dot\)|\s+dot\s+)\s*[a-z]{2,}\b)
+  | (?P<phone>(?<![\w+])(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?)?\d[\d\s.-]{6,}\d(?!\w))
+  | (?P<linkedin_maybe>\blinked\s?in\b)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_DIGITS = re.compile(r"\d")
+_DATE_LIKE = re.compile(r"^\d{1,4}[./-]\d{1,2}[./-]\d{1,4}$")
+_YEAR_RANGE = re.compile(r"^(\d{4})\s*[-\u2013]\s*(\d{4})$")
+
+# Confidence of each decision.
+HIT = 0.99
+MISS = 0.95
+MAYBE = 0.5
+
+
+def _phone_confidence(candidate: str) -> float:
+    digits = len(_DIGITS.findall(candidate))
+    candidate = candidate.strip()
+    if _DATE_LIKE.match(candidate):
+        return 0.0
+    years = _YEAR_RANGE.match(candidate)
+    if years and all(1900 <= int(y) <= 2099 for y in years.groups()):
+        return 0.0  # "2019 - 2021": in nearly every resume
+    if candidate.isdigit() and digits == 8:
+        return 0.0  # bare 8 digits: a YYYYMMDD date or an id, not a phone number
+    if candidate.startswith("+") and 8 <= digits <= 15:
+        return HIT
+    if 10 <= digits <= 15:
+        # A formatted number is a phone; a bare run of digits may just as well be an id.
+        return 0.9 if len(candidate) > digits else 0.7
+    if 7 <= digits <= 9:
+        return MAYBE  # local number, or an id / amount
+    return 0.0
+
+
+def classify_contacts(text: str) -> Dict[str, Dict[str, object]]:
+    """
+    Returns:
+        dict: {field: {"present": bool, "confidence": float, "match": str | None}}
+        for email, phone and linkedin.
+    """
+    out = {f: {"present": False, "confidence": MISS, "match": None} for f in FIELDS}
+    for m in _PATTERN.finditer(text or ""):
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind in ("email", "linkedin"):
+            if not out[kind]["present"]:
+                out[kind] = {"present": True, "confidence": HIT, "match": value}
+        elif kind == "phone":
+            # Keep the most phone-like candidate; weak ones stay below the threshold.
+            confidence = _phone_confidence(value)
+            best = out["phone"]["confidence"] if out["phone"]["match"] else 0.0
+            if confidence > best:
+                out["phone"] = {"present": confidence > MAYBE, "confidence": confidence, "match": value.strip()}
+        else:
+            field = kind[:-len("_maybe")]
+            if not out[field]["present"]:
+                out[field] = {"present": False, "confidence": MAYBE, "match": value}
+    return out
+
+
+def classify_many(texts: List[str]) -> List[Dict[str, Dict[str, object]]]:
+    return [classify_contacts(t) for t in texts]
+
+
+def needs_llm(classified: Dict[str, Dict[str, object]], policy: str, min_confidence: float) -> bool:
+    """
+    policy: "never" (local only), "always" (always ask the LLM) or "ambiguous"
+    (ask only when some field's confidence is below `min_confidence`).
+    """
+    if policy == "always":
+        return True
+    if policy == "never":
+        return False
+    return any(classified[f]["confidence"] < min_confidence for f in FIELDS)
+
+
+def merge(
+    classified: Dict[str, Dict[str, object]],
+    llm_result: Optional[Dict[str, bool]],
+    min_confidence: float,
+) -> Dict[str, object]:
+    """
+    Final detection in detect_and_store's shape ({"email": bool, "phone": bool,
+    "linkedin": bool}) plus "confidence", "matches" and "source". The LLM only
+    decides fields the local pass was unsure about.
+    """
+    result: Dict[str, object] = {}
+    confidence: Dict[str, float] = {}
+    used_llm = False
+    for field in FIELDS:
+        local = classified[field]
+        if llm_result is not None and local["confidence"] < min_confidence and field in llm_result:
+            result[field] = bool(llm_result[field])
+            confidence[field] = 0.8
+            used_llm = True
+        else:
+            result[field] = bool(local["present"])
+            confidence[field] = float(local["confidence"])
+    result["confidence"] = confidence
+    result["matches"] = {f: classified[f]["match"] for f in FIELDS if classified[f]["match"]}
+    result["source"] = "llm" if used_llm else "local"
+    return result
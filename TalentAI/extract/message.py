@@ -1,64 +1,173 @@
 import os
 import json
+import logging
 import re
 import smtplib
-import psycopg2
+import threading
+from contextlib import contextmanager
 from email.mime.text import MIMEText
-from openai import OpenAI
-from twilio.rest import Client as TwilioClient
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv("config.env")
-
-# CONFIGS from .env
-XAI_API_KEY = os.getenv("XAI_API_KEY")
-TWILIO_SID = os.getenv("TWILIO_SID")
-TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
-TWILIO_PHONE = os.getenv("TWILIO_PHONE")
-EMAIL_USER = os.getenv("EMAIL_USER")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-
-DB_CONFIG = {
-    "dbname": os.getenv("DB_NAME"),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PASSWORD"),
-    "host": os.getenv("DB_HOST"),
-    "port": os.getenv("DB_PORT")
-}
-
-client = OpenAI(api_key=XAI_API_KEY, base_url="https://api.x.ai/v1")
-twilio_client = TwilioClient(TWILIO_SID, TWILIO_AUTH_TOKEN)
+from typing import Dict, Iterable, List, Optional
+
+from TalentAI.extract import contact_detector
+
+# Clients, the DB pool and the SMTP session are all created on first use, so importing
+# this module has no side effects (no network, no DB, no env file read).
+
+_lock = threading.RLock()
+_config: Optional[Dict[str, object]] = None
+_llm_client = None
+_twilio_client = None
+_db_pool = None
+_smtp = None
+
+DEFAULT_MESSAGE = "Hey there! Thanks for sharing your contact info."
+
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'(\+?\d[\d\s-]{7,})')
+
+CONTACT_LLM_POLICIES = ("never", "ambiguous", "always")
+
+
+def get_config() -> Dict[str, object]:
+    global _config
+    with _lock:
+        if _config is None:
+            from dotenv import load_dotenv
+
+            # Load environment variables
+            load_dotenv("config.env")
+            _config = {
+                "XAI_API_KEY": os.getenv("XAI_API_KEY"),
+                "TWILIO_SID": os.getenv("TWILIO_SID"),
+                "TWILIO_AUTH_TOKEN": os.getenv("TWILIO_AUTH_TOKEN"),
+                "TWILIO_PHONE": os.getenv("TWILIO_PHONE"),
+                "EMAIL_USER": os.getenv("EMAIL_USER"),
+                "EMAIL_PASSWORD": os.getenv("EMAIL_PASSWORD"),
+                "DB_CONFIG": {
+                    "dbname": os.getenv("DB_NAME"),
+                    "user": os.getenv("DB_USER"),
+                    "password": os.getenv("DB_PASSWORD"),
+                    "host": os.getenv("DB_HOST"),
+                    "port": os.getenv("DB_PORT")
+                },
+                "DB_POOL_MIN": int(os.getenv("DB_POOL_MIN", "1")),
+                "DB_POOL_MAX": int(os.getenv("DB_POOL_MAX", "5")),
+                # When to ask the LLM: never, ambiguous (some field below the threshold) or always
+                "CONTACT_LLM_POLICY": os.getenv("CONTACT_LLM_POLICY", "ambiguous"),
+                "CONTACT_MIN_CONFIDENCE": float(os.getenv("CONTACT_MIN_CONFIDENCE", "0.9")),
+            }
+        return _config
+
+
+def get_llm_client():
+    global _llm_client
+    with _lock:
+        if _llm_client is None:
+            from openai import OpenAI
+
+            _llm_client = OpenAI(api_key=get_config()["XAI_API_KEY"], base_url="https://api.x.ai/v1")
+        return _llm_client
+
+
+def get_twilio_client():
+    global _twilio_client
+    with _lock:
+        if _twilio_client is None:
+            from twilio.rest import Client as TwilioClient
+
+            config = get_config()
+            _twilio_client = TwilioClient(config["TWILIO_SID"], config["TWILIO_AUTH_TOKEN"])
+        return _twilio_client
+
+
+def get_db_pool():
+    """Thread-safe psycopg2 pool, sized by DB_POOL_MIN / DB_POOL_MAX."""
+    global _db_pool
+    with _lock:
+        if _db_pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+
+            config = get_config()
+            _db_pool = ThreadedConnectionPool(config["DB_POOL_MIN"], config["DB_POOL_MAX"], **config["DB_CONFIG"])
+        return _db_pool
+
+
+@contextmanager
+def db_connection():
+    """Borrow a pooled connection; commits on success, rolls back on error."""
+    pool = get_db_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+def _smtp_session() -> smtplib.SMTP:
+    """The shared, logged-in SMTP session; reconnects if the server dropped it."""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.noop()
+            return _smtp
+        except smtplib.SMTPException:
+            _smtp = None
+    config = get_config()
+    server = smtplib.SMTP("smtp.gmail.com", 587)
+    server.starttls()
+    server.login(config["EMAIL_USER"], config["EMAIL_PASSWORD"])
+    _smtp = server
+    return server
+
+
+def close():
+    """Release the SMTP session and the DB pool (e.g. at process shutdown)."""
+    global _smtp, _db_pool
+    with _lock:
+        if _smtp is not None:
+            try:
+                _smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            _smtp = None
+        if _db_pool is not None:
+            _db_pool.closeall()
+            _db_pool = None
+
 
 def extract_email(text):
-    match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    match = EMAIL_RE.search(text)
     return match.group() if match else None
 
 def extract_phone(text):
-    match = re.search(r'(\+?\d[\d\s-]{7,})', text)
+    match = PHONE_RE.search(text)
     return match.group().strip() if match else None
 
 def send_email(recipient, body):
     msg = MIMEText(body)
     msg["Subject"] = "Hello from your assistant"
-    msg["From"] = EMAIL_USER
+    msg["From"] = get_config()["EMAIL_USER"]
     msg["To"] = recipient
 
-    with smtplib.SMTP("smtp.gmail.com", 587) as server:
-        server.starttls()
-        server.login(EMAIL_USER, EMAIL_PASSWORD)
-        server.send_message(msg)
-    print("✅ Email sent to", recipient)
+    with _lock:
+        _smtp_session().send_message(msg)
+    logging.info(f"[contacts] Email sent to {recipient}")
 
 def send_sms(recipient, body):
-    twilio_client.messages.create(
+    get_twilio_client().messages.create(
         body=body,
-        from_=TWILIO_PHONE,
+        from_=get_config()["TWILIO_PHONE"],
         to=recipient
     )
-    print("✅ SMS sent to", recipient)
+    logging.info(f"[contacts] SMS sent to {recipient}")
+
 
-def detect_and_store(text):
+def llm_detect_contacts(text) -> Optional[Dict[str, bool]]:
+    """Ask the LLM which contact types the text contains; None if the reply isn't JSON."""
     prompt = f"""
 Check if the following text contains:
 - Email
@@ -70,7 +179,7 @@ Text: "{text}"
 Respond in JSON like: {{"email": true/false, "phone": true/false, "linkedin": true/false}}
 """
 
-    response = client.chat.completions.create(
+    response = get_llm_client().chat.completions.create(
         model="grok-3-beta",
         messages=[
             {"role": "system", "content": "You are Grok, a highly intelligent assistant."},
@@ -79,31 +188,96 @@ Respond in JSON like: {{"email": true/false, "phone": true/false, "linkedin": tr
     )
 
     try:
-        result = json.loads(response.choices[0].message.content)
+        return json.loads(response.choices[0].message.content)
     except json.JSONDecodeError:
-        print("❌ Bad JSON response:", response.choices[0].message.content)
-        return
+        logging.warning(f"[contacts] Bad JSON from the LLM: {response.choices[0].message.content!r}")
+        return None
+
+
+def _policy(policy: Optional[str], min_confidence: Optional[float]):
+    config = get_config()
+    policy = policy or config["CONTACT_LLM_POLICY"]
+    if policy not in CONTACT_LLM_POLICIES:
+        raise ValueError(f"Unknown contact LLM policy {policy!r}; expected one of {CONTACT_LLM_POLICIES}")
+    if min_confidence is None:
+        min_confidence = config["CONTACT_MIN_CONFIDENCE"]
+    return policy, min_confidence
+
+
+def detect_contacts_many(texts: List[str], policy: Optional[str] = None, min_confidence: Optional[float] = None) -> List[Optional[Dict[str, object]]]:
+    """
+    Regex pass over every text first; only texts the policy says are ambiguous go to
+    the LLM. Each result has email/phone/linkedin booleans plus per-field
+    "confidence", the matched "matches" and "source" ("local" or "llm").
+    None where the LLM was needed (policy "always") but its reply was unusable.
+    """
+    policy, min_confidence = _policy(policy, min_confidence)
+    results: List[Optional[Dict[str, object]]] = []
+    for text, classified in zip(texts, contact_detector.classify_many(texts)):
+        llm_result = None
+        if contact_detector.needs_llm(classified, policy, min_confidence):
+            llm_result = llm_detect_contacts(text)
+            if llm_result is None and policy == "always":
+                results.append(None)
+                continue
+        results.append(contact_detector.merge(classified, llm_result, 1.01 if policy == "always" else min_confidence))
+    return results
+
+
+def detect_contacts(text, policy: Optional[str] = None, min_confidence: Optional[float] = None) -> Optional[Dict[str, object]]:
+    return detect_contacts_many([text], policy=policy, min_confidence=min_confidence)[0]
 
-    # Insert the raw text into database
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("INSERT INTO mitai (text) VALUES (%s)", (text,))
-    conn.commit()
-    cur.close()
-    conn.close()
-    print("✅ Inserted into DB:", text)
 
-    message = "Hey there! Thanks for sharing your contact info."
+def store_texts(texts: Iterable[str]) -> int:
+    """Insert raw texts into `mitai` in a single round trip. Returns the number of rows."""
+    from psycopg2.extras import execute_values
 
+    rows = [(t,) for t in texts]
+    if not rows:
+        return 0
+    with db_connection() as conn, conn.cursor() as cur:
+        execute_values(cur, "INSERT INTO mitai (text) VALUES %s", rows, page_size=max(len(rows), 1))
+    return len(rows)
+
+
+def _notify(text, result, message):
+    matches = result.get("matches") or {}
     if result.get("email"):
-        email = extract_email(text)
+        email = matches.get("email") if "@" in (matches.get("email") or "") else extract_email(text)
         if email:
             send_email(email, message)
 
     if result.get("phone"):
-        phone = extract_phone(text)
+        phone = matches.get("phone") or extract_phone(text)
         if phone:
             send_sms(phone, message)
 
-# Example usage
-detect_and_store("Reach me at emeka2025@yahoo.com or call +14155552671 or visit linkedin.com/in/emeka-ai")
\ No newline at end of file
+
+def detect_and_store(text, message=DEFAULT_MESSAGE):
+    """Detect contact info in `text`, store the text and reach out. Returns the detection result."""
+    return detect_and_store_many([text], message=message)[0]
+
+
+def detect_and_store_many(texts: List[str], message=DEFAULT_MESSAGE) -> List[Optional[Dict[str, object]]]:
+    """
+    Batch version of detect_and_store: every text with a usable detection result is
+    inserted in one statement, and notifications share one SMTP session.
+
+    Returns:
+        list: the detection result per input text (None where the LLM reply was unusable).
+    """
+    results = detect_contacts_many(texts)
+    detected = [(text, result) for text, result in zip(texts, results) if result is not None]
+
+    if store_texts(text for text, _ in detected):
+        logging.info(f"[contacts] Stored {len(detected)} texts")
+
+    for text, result in detected:
+        _notify(text, result, message)
+    return results
+
+
+if __name__ == "__main__":
+    # Example usage
+    detect_and_store("Reach me at emeka2025@yahoo.com or call +14155552671 or visit linkedin.com/in/emeka-ai")
+    close()
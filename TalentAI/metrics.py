@@ -0,0 +1,384 @@
+"""
+Prometheus metrics without the client library.
+
+Counters and histograms are recorded into per-thread shards: each thread writes to
+its own dicts and takes no lock, so recording costs a thread-local lookup and a dict
+update. A scrape merges the shards; dict copies are atomic under the GIL, so it
+never has to stop the threads that record.
+
+Multi-process (gunicorn): set METRICS_DIR to a directory shared by the workers.
+Every METRICS_FLUSH_SECONDS, and at exit, each process writes its totals to
+<pid>-<start>.json there. /metrics, served by whichever worker takes the request,
+sums every file and adds its own live numbers. Files of workers that exited are
+kept, so counters never go backwards; clear the directory when deploying. Without
+METRICS_DIR the numbers are per process.
+
+Queue-depth gauges are read from the database at scrape time, so they don't depend
+on which worker answers.
+"""
+import atexit
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+REGISTRY: Dict[str, "_Metric"] = {}
+
+
+class _Shard:
+    """One thread's samples: {(metric, labels): value} and {(metric, labels): [bucket counts..., sum, count]}."""
+
+    __slots__ = ("counters", "histograms", "thread")
+
+    def __init__(self, thread: Optional[threading.Thread]):
+        self.counters: Dict[Tuple[str, LabelValues], float] = {}
+        self.histograms: Dict[Tuple[str, LabelValues], List[float]] = {}
+        self.thread = weakref.ref(thread) if thread is not None else None
+
+
+_local = threading.local()
+_shards: List[_Shard] = []
+_retired = _Shard(None)  # samples of threads that have exited
+_shards_lock = threading.Lock()  # taken once per thread, and by scrapes; never per sample
+
+
+def _shard() -> _Shard:
+    try:
+        return _local.shard
+    except AttributeError:
+        shard = _local.shard = _Shard(threading.current_thread())
+        with _shards_lock:
+            _shards.append(shard)
+        _start_flusher()
+        return shard
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY[name] = self
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, LabelValues]:
+        return self.name, tuple([str(labels[label]) for label in self.labelnames])
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        counters = _shard().counters
+        key = self._key(labels)
+        counters[key] = counters.get(key, 0) + amount
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        histograms = _shard().histograms
+        key = self._key(labels)
+        counts = histograms.get(key)
+        if counts is None:
+            # One slot per bucket plus +Inf, then sum and count.
+            counts = histograms[key] = [0] * (len(self.buckets) + 3)
+        counts[bisect.bisect_left(self.buckets, value)] += 1  # per bucket; made cumulative on export
+        counts[-2] += value
+        counts[-1] += 1
+
+
+class Gauge(_Metric):
+    """Computed at scrape time: `collect()` returns a number, or {label values tuple: number}."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, collect: Callable[[], Any], labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+
+# Aggregation ----------------------------------------------------------------------
+
+def _merge(into: _Shard, counters: Dict, histograms: Dict) -> None:
+    for key, value in counters.items():
+        into.counters[key] = into.counters.get(key, 0) + value
+    for key, counts in histograms.items():
+        existing = into.histograms.get(key)
+        if existing is None:
+            into.histograms[key] = list(counts)
+        else:
+            for i, value in enumerate(counts):
+                existing[i] += value
+
+
+def _snapshot() -> _Shard:
+    """This process's totals."""
+    total = _Shard(None)
+    with _shards_lock:
+        for shard in list(_shards):
+            thread = shard.thread() if shard.thread else None
+            if thread is None or not thread.is_alive():
+                # Nothing writes to a dead thread's shard any more; fold it in for good.
+                _merge(_retired, shard.counters, shard.histograms)
+                _shards.remove(shard)
+                continue
+            # dict.copy() runs without releasing the GIL, so it can't see a half-done insert.
+            _merge(total, shard.counters.copy(), {k: list(v) for k, v in shard.histograms.copy().items()})
+        _merge(total, _retired.counters, _retired.histograms)
+    return total
+
+
+_started_at = int(time.time() * 1000)
+_flusher: Optional[threading.Thread] = None
+
+
+def _process_file() -> str:
+    return os.path.join(settings.METRICS_DIR, f"{os.getpid()}-{_started_at}.json")
+
+
+def flush() -> None:
+    """Write this process's totals to METRICS_DIR (atomically)."""
+    if not settings.METRICS_DIR:
+        return
+    snapshot = _snapshot()
+    payload = {
+        "counters": [[name, list(labels), value] for (name, labels), value in snapshot.counters.items()],
+        "histograms": [[name, list(labels), counts] for (name, labels), counts in snapshot.histograms.items()],
+    }
+    path = _process_file()
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(settings.METRICS_FLUSH_SECONDS)
+        try:
+            flush()
+        except Exception:
+            logging.exception("[metrics] Flush failed")
+
+
+def _start_flusher() -> None:
+    global _flusher
+    if _flusher is not None or not settings.METRICS_DIR:
+        return
+    with _shards_lock:
+        if _flusher is not None:
+            return
+        os.makedirs(settings.METRICS_DIR, exist_ok=True)
+        _flusher = threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True)
+        _flusher.start()
+    atexit.register(flush)
+
+
+def _reset_after_fork() -> None:
+    # A worker forked from a preloading master starts from zero, with its own file and flusher.
+    global _local, _shards, _retired, _shards_lock, _started_at, _flusher
+    _local = threading.local()
+    _shards_lock = threading.Lock()
+    _shards = []
+    _retired = _Shard(None)
+    _started_at = int(time.time() * 1000)
+    _flusher = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _collect_all() -> _Shard:
+    """Totals across every process sharing METRICS_DIR (this one live, the others as last flushed)."""
+    total = _snapshot()
+    if not settings.METRICS_DIR or not os.path.isdir(settings.METRICS_DIR):
+        return total
+    own = os.path.basename(_process_file())
+    for filename in os.listdir(settings.METRICS_DIR):
+        if not filename.endswith(".json") or filename == own:
+            continue
+        try:
+            with open(os.path.join(settings.METRICS_DIR, filename)) as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            continue  # being replaced, or from another deploy
+        _merge(
+            total,
+            {(name, tuple(labels)): value for name, labels, value in payload.get("counters", [])},
+            {(name, tuple(labels)): counts for name, labels, counts in payload.get("histograms", [])},
+        )
+    return total
+
+
+# Exposition -----------------------------------------------------------------------
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render() -> str:
+    """All metrics in the Prometheus text format (version 0.0.4)."""
+    totals = _collect_all()
+    by_metric: Dict[str, List[Tuple[LabelValues, Any]]] = {}
+    for (name, labels), value in [*totals.counters.items(), *totals.histograms.items()]:
+        by_metric.setdefault(name, []).append((labels, value))
+
+    lines: List[str] = []
+    for name, metric in sorted(REGISTRY.items()):
+        if isinstance(metric, Gauge):
+            try:
+                value = metric.collect()
+            except Exception:
+                logging.exception(f"[metrics] Gauge {name} failed")
+                continue
+            samples = sorted(value.items()) if isinstance(value, dict) else [((), value)]
+        else:
+            samples = sorted(by_metric.get(name, []))
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        for labels, value in samples:
+            if isinstance(metric, Histogram):
+                cumulative = 0
+                for bound, count in zip((*metric.buckets, float("inf")), value[:-2]):
+                    cumulative += count
+                    le = _labels((*metric.labelnames, "le"), (*labels, _number(bound)))
+                    lines.append(f"{name}_bucket{le} {_number(cumulative)}")
+                lines.append(f"{name}_sum{_labels(metric.labelnames, labels)} {_number(value[-2])}")
+                lines.append(f"{name}_count{_labels(metric.labelnames, labels)} {_number(value[-1])}")
+            else:
+                lines.append(f"{name}{_labels(metric.labelnames, labels)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    return HttpResponse(render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# Request latency ------------------------------------------------------------------
+
+def _view_label(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    return (match.view_name or match.route) if match is not None else "unmatched"
+
+
+class MetricsMiddleware:
+    """Request latency per view. Removed at startup when METRICS_ENABLED is off."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, started)
+        return response
+
+    @staticmethod
+    def _record(request, response, started: float) -> None:
+        http_request_duration.observe(
+            time.perf_counter() - started, view=_view_label(request), method=request.method, status=response.status_code,
+        )
+
+
+# Metrics ---------------------------------------------------------------------------
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Request latency by view.", ("view", "method", "status"),
+)
+llm_request_duration = Histogram(
+    "llm_request_duration_seconds",
+    "LLM call latency per flow (resume, submission, challenge), retries and provider fallbacks included.",
+    ("flow", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+)
+llm_retries = Counter("llm_retries_total", "LLM calls retried after a failed attempt, per flow.", ("flow",))
+llm_errors = Counter("llm_errors_total", "LLM calls that failed after every retry, per flow.", ("flow",))
+llm_provider_failures = Counter("llm_provider_failures_total", "Failed calls per LLM provider (before fallback).", ("provider",))
+recommender_candidates = Counter("recommender_candidates_scored_total", "Developers scored against a project.")
+recommender_seconds = Counter(
+    "recommender_scoring_seconds_total",
+    "Time spent scoring candidates; candidates/s = rate(recommender_candidates_scored_total) / rate(this).",
+)
+pdf_pages = Counter("pdf_pages_extracted_total", "PDF pages whose text was extracted.")
+pdf_seconds = Counter(
+    "pdf_extraction_seconds_total",
+    "Wall time spent extracting PDFs; pages/s = rate(pdf_pages_extracted_total) / rate(this).",
+)
+
+
+def _outbox_depth():
+    from Recruiter.outbox import queue_depth
+
+    return queue_depth()
+
+
+def _expiry_backlog():
+    from datetime import timedelta
+
+    from django.utils.timezone import now
+
+    from Recruiter.expiry import expired_backlog
+
+    return expired_backlog(now() - timedelta(hours=settings.INVITATION_TTL_HOURS))
+
+
+def _ingestion_jobs():
+    from django.db.models import Count
+
+    from HireMe.models import ResumeIngestionJob
+
+    active = ("queued", "extracting", "analyzing", "persisting")
+    counts = dict(ResumeIngestionJob.objects.filter(status__in=active).order_by().values_list("status").annotate(Count("id")))
+    return {(status,): counts.get(status, 0) for status in active}
+
+
+Gauge("outbox_queue_depth", "Notifications waiting to be delivered (pending or being sent).", _outbox_depth)
+Gauge("invitation_expiry_backlog", "Sent invitations past their TTL that the sweep hasn't expired yet.", _expiry_backlog)
+Gauge("resume_ingestion_jobs", "Resume ingestion jobs that haven't finished, by status.", _ingestion_jobs, ("status",))
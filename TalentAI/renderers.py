@@ -0,0 +1,75 @@
+"""
+orjson-backed JSON renderer and parser for DRF.
+
+Drop-in replacements for rest_framework's JSONRenderer / JSONParser, selectable per
+view (`renderer_classes = (ORJSONRenderer,)`). Output matches the stock renderer for
+our payloads: objects orjson doesn't handle the DRF way (datetimes, Decimals, lazy
+translation strings, querysets, ...) go through DRF's own JSONEncoder.default, and
+\\u2028 / \\u2029 are escaped the same way. Known differences, neither of which
+changes the parsed value: floats below 1e-4 are spelled `6.8e-6` / `0.00001` instead
+of `6.8e-06` / `1e-05`, and NaN / Infinity render as null instead of raising.
+
+Anything orjson refuses (ints beyond 64 bits, unsupported dict keys) and indented
+output other than the compact form fall back to the stock implementation, as does
+everything when orjson isn't installed. Benchmark: `manage.py bench_json`.
+"""
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib json module
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS)
+    if orjson is not None else 0
+)
+_default = DRFJSONEncoder().default
+
+
+def dumps(data) -> bytes:
+    """Compact UTF-8 JSON, like JSONRenderer with UNICODE_JSON and COMPACT_JSON on."""
+    ret = orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+    if b"\xe2\x80" in ret:
+        ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    return ret
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            data is None
+            or orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return dumps(data)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        raw = stream.read()
+        try:
+            text = raw if encoding.lower().replace("_", "-") in ("utf-8", "utf8") else raw.decode(encoding)
+            # orjson rejects NaN / Infinity, as STRICT_JSON does.
+            return orjson.loads(text)
+        except (orjson.JSONDecodeError, UnicodeDecodeError):
+            # Rare: ints beyond 64 bits, non-strict constants, or malformed input;
+            # the stock parser accepts the first two and words the error the usual way.
+            return super().parse(io.BytesIO(raw), media_type, parser_context)
@@ -61,6 +61,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'TalentAI.tracing.TracingMiddleware',
+    'TalentAI.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -176,6 +178,128 @@ REST_FRAMEWORK = {
     'DEFAULT_PARSER_CLASSES': ('rest_framework.parsers.JSONParser',),
 }
 
+# LLM providers
+# Comma separated, in fallback order. Available: groq, xai, litellm, stub.
+# Use LLM_PROVIDERS=stub to run the whole pipeline without network access.
+LLM_PROVIDERS = [p.strip() for p in os.getenv('LLM_PROVIDERS', 'groq').split(',') if p.strip()]
+LLM_LATENCY_WINDOW = int(os.getenv('LLM_LATENCY_WINDOW', '50'))
+LLM_LATENCY_PERCENTILE = float(os.getenv('LLM_LATENCY_PERCENTILE', '95'))
+LLM_FAILURE_THRESHOLD = int(os.getenv('LLM_FAILURE_THRESHOLD', '3'))
+LLM_COOLDOWN_SECONDS = float(os.getenv('LLM_COOLDOWN_SECONDS', '30'))
+# Attempts per completion across all providers; a failed provider falls back to the next
+# one at once, and the delay is only slept before going round the providers again.
+LLM_MAX_ATTEMPTS = int(os.getenv('LLM_MAX_ATTEMPTS', '3'))
+LLM_RETRY_DELAY_SECONDS = float(os.getenv('LLM_RETRY_DELAY_SECONDS', '2'))
+# Simulated response time of the stub provider (load tests, bench_async_concurrency)
+LLM_STUB_LATENCY_SECONDS = float(os.getenv('LLM_STUB_LATENCY_SECONDS', '0'))
+
+# Resume analysis: "llm" (local keyword extraction only as fallback) or "local" (never call the LLM)
+RESUME_ANALYSIS_MODE = os.getenv('RESUME_ANALYSIS_MODE', 'llm')
+RESUME_LLM_MAX_PROMPT_TOKENS = int(os.getenv('RESUME_LLM_MAX_PROMPT_TOKENS', '24000'))
+
+# PDF extraction
+PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '200'))
+PDF_EXTRACT_TIMEOUT_SECONDS = float(os.getenv('PDF_EXTRACT_TIMEOUT_SECONDS', '20'))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '40'))
+PDF_PAGES_PER_TASK = int(os.getenv('PDF_PAGES_PER_TASK', '16'))
+PDF_EXTRACT_WORKERS = int(os.getenv('PDF_EXTRACT_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# Resume storage
+RESUME_TEXT_CACHE_SIZE = int(os.getenv('RESUME_TEXT_CACHE_SIZE', '128'))
+
+# Background resume ingestion
+RESUME_INGESTION_WORKERS = int(os.getenv('RESUME_INGESTION_WORKERS', '4'))
+RESUME_INGESTION_STAGE_RETRIES = int(os.getenv('RESUME_INGESTION_STAGE_RETRIES', '3'))
+RESUME_INGESTION_RETRY_DELAY = float(os.getenv('RESUME_INGESTION_RETRY_DELAY', '2'))
+
+# dev_score update rule for challenge submissions: 'legacy' (0.8 * score + 0.2 * raw
+# submission score) or 'normalized' (submission normalized to 0-1000 by challenge max_score)
+DEV_SCORE_RULE = os.getenv('DEV_SCORE_RULE', 'legacy')
+
+# Leaderboard: how often a worker checks for score changes made by other processes,
+# and how many persisted snapshots to keep
+LEADERBOARD_REFRESH_SECONDS = float(os.getenv('LEADERBOARD_REFRESH_SECONDS', '5'))
+LEADERBOARD_SNAPSHOTS_KEPT = int(os.getenv('LEADERBOARD_SNAPSHOTS_KEPT', '3'))
+
+# Invitation expiry: 'sent' invitations older than the TTL become 'expired'.
+# INVITATION_SWEEP_INTERVAL_SECONDS > 0 also runs the sweep inside each web process;
+# otherwise schedule `manage.py expire_invitations`.
+INVITATION_TTL_HOURS = float(os.getenv('INVITATION_TTL_HOURS', '168'))
+INVITATION_SWEEP_CHUNK_SIZE = int(os.getenv('INVITATION_SWEEP_CHUNK_SIZE', '1000'))
+INVITATION_SWEEP_INTERVAL_SECONDS = float(os.getenv('INVITATION_SWEEP_INTERVAL_SECONDS', '0'))
+
+# Project automation (Recruiter.automation). AUTOMATION_TICK_SECONDS > 0 runs ticks
+# inside each web process; otherwise schedule `manage.py run_automation`.
+AUTOMATION_TICK_SECONDS = float(os.getenv('AUTOMATION_TICK_SECONDS', '0'))
+AUTOMATION_BATCH_SIZE = int(os.getenv('AUTOMATION_BATCH_SIZE', '200'))
+AUTOMATION_LLM_CONCURRENCY = int(os.getenv('AUTOMATION_LLM_CONCURRENCY', '4'))
+AUTOMATION_RECOMMENDATIONS_KEPT = int(os.getenv('AUTOMATION_RECOMMENDATIONS_KEPT', '100'))
+AUTOMATION_INVITES_PER_ROUND = int(os.getenv('AUTOMATION_INVITES_PER_ROUND', '10'))
+AUTOMATION_MIN_FIT_SCORE = float(os.getenv('AUTOMATION_MIN_FIT_SCORE', '50'))
+AUTOMATION_CLOSE_AFTER_COMPLETIONS = int(os.getenv('AUTOMATION_CLOSE_AFTER_COMPLETIONS', '3'))
+
+# Serialized-response cache and version stamps for polled read endpoints
+# (HireMe.response_cache). Stamps must be shared by every worker, so the cache is
+# only on by default with a shared RESPONSE_CACHE_BACKEND (e.g.
+# django.core.cache.backends.redis.RedisCache). With the per-process LocMemCache
+# other workers would serve stale bodies and 304s; RESPONSE_CACHE_ENABLED=1 turns it
+# on anyway for single-worker deployments.
+_response_cache_backend = os.getenv('RESPONSE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+_response_cache_shared = not _response_cache_backend.endswith('LocMemCache')
+RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', '1' if _response_cache_shared else '0') == '1'
+RESPONSE_CACHE_ALIAS = 'responses'
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', '30'))
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    RESPONSE_CACHE_ALIAS: {
+        'BACKEND': _response_cache_backend,
+        'LOCATION': os.getenv('RESPONSE_CACHE_LOCATION', 'responses'),
+        **({'OPTIONS': {'MAX_ENTRIES': int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '10000'))}}
+           if _response_cache_backend.endswith('LocMemCache') else {}),
+    },
+}
+
+# Outgoing mail. Notifications are queued in Recruiter.OutboxMessage and delivered by
+# Recruiter.outbox through this backend; OUTBOX_DELIVERY_INTERVAL_SECONDS > 0 runs the
+# delivery worker inside each web process, otherwise schedule `manage.py deliver_outbox`.
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'smtp.gmail.com')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '587'))
+EMAIL_HOST_USER = os.getenv('EMAIL_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', '1') == '1'
+EMAIL_TIMEOUT = float(os.getenv('EMAIL_TIMEOUT', '30'))
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER or 'webmaster@localhost')
+OUTBOX_DELIVERY_INTERVAL_SECONDS = float(os.getenv('OUTBOX_DELIVERY_INTERVAL_SECONDS', '0'))
+OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', '100'))
+OUTBOX_RATE_PER_SECOND = float(os.getenv('OUTBOX_RATE_PER_SECOND', '10'))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', '5'))
+OUTBOX_RETRY_BASE_SECONDS = float(os.getenv('OUTBOX_RETRY_BASE_SECONDS', '30'))
+OUTBOX_LEASE_SECONDS = float(os.getenv('OUTBOX_LEASE_SECONDS', '300'))
+
+# Request tracing (TalentAI.tracing). TRACING_SAMPLE_RATE is the fraction of requests
+# traced (0 = off). Exporters, comma separated: log (one JSON line per span), otlp
+# (OTLP/HTTP JSON to TRACING_OTLP_ENDPOINT, e.g. a local OpenTelemetry collector).
+TRACING_SAMPLE_RATE = float(os.getenv('TRACING_SAMPLE_RATE', '0'))
+TRACING_EXPORTERS = [e.strip() for e in os.getenv('TRACING_EXPORTERS', 'log').split(',') if e.strip()]
+TRACING_OTLP_ENDPOINT = os.getenv('TRACING_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')
+TRACING_OTLP_TIMEOUT_SECONDS = float(os.getenv('TRACING_OTLP_TIMEOUT_SECONDS', '5'))
+TRACING_SERVICE_NAME = os.getenv('TRACING_SERVICE_NAME', 'talentai')
+
+# Prometheus metrics at /metrics (TalentAI.metrics). With several worker processes,
+# point METRICS_DIR at a directory they share (cleared on deploy) so any worker can
+# report the totals of all of them.
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '1') == '1'
+METRICS_DIR = os.getenv('METRICS_DIR', '')
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', '5'))
+
+# Worker boot (TalentAI.startup): importing the application and loading the URL conf
+# must stay under this; heavy dependencies are imported on first use.
+# `manage.py profile_imports` shows where boot time goes.
+STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', '3'))
+
 # Swagger settings
 SWAGGER_SETTINGS = {
     'DEFAULT_AUTO_SCHEMA_CLASS': 'drf_yasg.inspectors.SwaggerAutoSchema',
@@ -0,0 +1,89 @@
+"""
+Worker boot profiling.
+
+A gunicorn/uvicorn worker imports the WSGI/ASGI application (settings, every app's
+models and ready() hooks) and loads the URL conf on its first request. profile_boot()
+does exactly that in a fresh interpreter, so nothing already imported by the caller
+hides the cost, and reports the wall time, Python's -X importtime tree and which
+heavy optional dependencies got imported. Those (PDF parsing, LLM SDKs, Twilio) must
+stay behind function-level imports so they load on first use instead.
+
+Used by `manage.py profile_imports` and the startup-budget test.
+"""
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+# Top-level packages that only specific requests need, and that are slow to import.
+HEAVY_MODULES = ("fitz", "pymupdf", "groq", "openai", "litellm", "langchain", "twilio")
+
+_BOOT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from TalentAI.{target} import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+seconds = time.perf_counter() - started
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"seconds": seconds, "heavy": heavy, "modules": len(sys.modules)}}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """`import time: self [us] | cumulative | imported package` lines, in import order."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return rows
+
+
+def profile_boot(target: str = "wsgi", importtime: bool = True, timeout: Optional[float] = 60) -> Dict[str, Any]:
+    """
+    Boot a worker in a subprocess.
+
+    Args:
+        target: "wsgi" or "asgi".
+        importtime: also collect the -X importtime tree (inflates `seconds` a little).
+
+    Returns:
+        dict:
+            - seconds (float): application import plus URL conf load.
+            - heavy (list): HEAVY_MODULES that were imported.
+            - modules (int): size of sys.modules afterwards.
+            - imports (list): {module, depth, self_ms, cumulative_ms} rows when importtime is set.
+    """
+    if target not in ("wsgi", "asgi"):
+        raise ValueError(f"Unknown target: {target!r}")
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "TalentAI.settings"),
+        "SECRET_KEY": os.environ.get("SECRET_KEY") or "startup-profile",
+        # Boot only; don't start the in-process periodic jobs.
+        "INVITATION_SWEEP_INTERVAL_SECONDS": "0",
+        "AUTOMATION_TICK_SECONDS": "0",
+        "OUTBOX_DELIVERY_INTERVAL_SECONDS": "0",
+    }
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c",
+               _BOOT_SCRIPT.format(target=target, heavy=HEAVY_MODULES)]
+    proc = subprocess.run(
+        command, cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, timeout=timeout,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Worker boot failed:\n{proc.stderr[-4000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports"] = _parse_importtime(proc.stderr) if importtime else []
+    return result
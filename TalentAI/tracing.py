@@ -0,0 +1,331 @@
+"""
+Lightweight request tracing.
+
+A trace is a tree of timed spans. TracingMiddleware opens a root span for each
+sampled request. span() and @traced open child spans under whichever span is
+current. The current span lives in a ContextVar, so it follows async views,
+sync_to_async and asyncio.to_thread. ORM queries on the request thread are counted
+into the innermost open span (db_queries, db_ms).
+
+Sampling: a TRACING_SAMPLE_RATE fraction of requests is traced (0, the default,
+means off). When tracing is off the middleware removes itself, and span() costs one
+ContextVar lookup because it returns a shared no-op span when no trace is open.
+
+Spans are exported when their root ends. Each exporter in TRACING_EXPORTERS does
+its own thing:
+    log   writes one "[trace] {json}" line per span.
+    otlp  posts the trace as OTLP/HTTP JSON to TRACING_OTLP_ENDPOINT (a local
+          OpenTelemetry collector, Jaeger, Tempo, ...) from a background thread.
+"""
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from rest_framework import serializers
+
+
+class _Trace:
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.spans: List["Span"] = []
+
+
+class Span:
+    __slots__ = (
+        "trace", "name", "span_id", "parent_id", "attributes", "error",
+        "start_ns", "duration_ns", "db_queries", "db_ns", "_started", "_token",
+    )
+
+    def __init__(self, trace: _Trace, name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.start_ns = self.duration_ns = self.db_queries = self.db_ns = 0
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def set_error(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration_ns = time.perf_counter_ns() - self._started
+        if exc is not None and self.error is None:
+            self.set_error(exc)
+        _current.reset(self._token)
+        self.trace.spans.append(self)
+        if self.parent_id is None:
+            _export(self.trace)
+        return False
+
+    def as_dict(self) -> Dict[str, Any]:
+        out = {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start_ns / 1e9,
+            "duration_ms": round(self.duration_ns / 1e6, 3),
+            **({"error": self.error} if self.error else {}),
+            "attributes": dict(self.attributes),
+        }
+        if self.db_queries:
+            out["attributes"].update(db_queries=self.db_queries, db_ms=round(self.db_ns / 1e6, 3))
+        return out
+
+
+class _NoopSpan:
+    """Returned when no sampled trace is open; every method is a no-op."""
+
+    __slots__ = ()
+    trace = None
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: ContextVar[Optional[Span]] = ContextVar("tracing_span", default=None)
+
+
+def current_span():
+    return _current.get() or NOOP_SPAN
+
+
+def span(name: str, **attributes):
+    """Child span of the current span (a no-op when no sampled trace is open)."""
+    parent = _current.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.trace, name, parent.span_id, attributes)
+
+
+def start_trace(name: str, sample_rate: Optional[float] = None, **attributes):
+    """
+    Root span for a unit of work (a request, a job run), subject to sampling.
+    Inside an open trace this is just a child span.
+    """
+    if _current.get() is not None:
+        return span(name, **attributes)
+    rate = settings.TRACING_SAMPLE_RATE if sample_rate is None else sample_rate
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return NOOP_SPAN
+    return Span(_Trace(), name, None, attributes)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: run the function (sync or async) inside span(name or its qualified name)."""
+    def decorator(fn: Callable):
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# Serializers ---------------------------------------------------------------------
+
+class TracedSerializerMixin:
+    """Times the top-level `.data` of a serializer (nested serializers aren't separate spans)."""
+
+    @property
+    def data(self):
+        with span("serialize", serializer=type(self).__name__):
+            return super().data
+
+
+class TracedListSerializer(serializers.ListSerializer):
+    """`Meta.list_serializer_class` for TracedSerializerMixin serializers used with many=True."""
+
+    @property
+    def data(self):
+        with span("serialize", serializer=type(self.child).__name__, many=True) as s:
+            data = super().data
+            s.set(items=len(data))
+            return data
+
+
+# Request middleware -------------------------------------------------------------
+
+def _count_query(execute, sql, params, many, context):
+    started = time.perf_counter_ns()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        current = _current.get()
+        if current is not None:
+            current.db_queries += 1
+            current.db_ns += time.perf_counter_ns() - started
+
+
+def _finish_request(root: Span, request, response) -> None:
+    match = getattr(request, "resolver_match", None)
+    route = match.route if match is not None else request.path
+    root.name = f"{request.method} {route}"
+    root.set(**{"http.method": request.method, "http.route": route, "http.status_code": response.status_code})
+    response["X-Trace-Id"] = root.trace.trace_id
+
+
+class TracingMiddleware:
+    """Root span per sampled request. Removed at startup when TRACING_SAMPLE_RATE is 0."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if settings.TRACING_SAMPLE_RATE <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        root = start_trace("request")
+        if root is NOOP_SPAN:
+            return self.get_response(request)
+        with root, connection.execute_wrapper(_count_query):
+            response = self.get_response(request)
+            _finish_request(root, request, response)
+        return response
+
+    async def __acall__(self, request):
+        root = start_trace("request")
+        if root is NOOP_SPAN:
+            return await self.get_response(request)
+        # ORM calls run in sync_to_async threads here, so queries aren't counted; the
+        # spans around those calls still time them.
+        with root:
+            response = await self.get_response(request)
+            _finish_request(root, request, response)
+        return response
+
+
+# Export -------------------------------------------------------------------------
+
+def _export(trace: _Trace) -> None:
+    spans = sorted(trace.spans, key=lambda s: s.start_ns)
+    for exporter in settings.TRACING_EXPORTERS:
+        try:
+            EXPORTERS[exporter](spans)
+        except Exception:
+            logging.exception(f"[trace] Exporter {exporter!r} failed")
+
+
+def _log_exporter(spans: List[Span]) -> None:
+    for s in spans:
+        logging.info("[trace] " + json.dumps(s.as_dict(), default=str))
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    """OTLP/HTTP JSON (ExportTraceServiceRequest) for one trace."""
+    otlp_spans = []
+    for s in spans:
+        attributes = s.as_dict()["attributes"]
+        otlp_spans.append({
+            "traceId": s.trace.trace_id,
+            "spanId": s.span_id,
+            "parentSpanId": s.parent_id or "",
+            "name": s.name,
+            "kind": 2 if s.parent_id is None else 1,  # SERVER for the request, INTERNAL below it
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.start_ns + s.duration_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        })
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": settings.TRACING_SERVICE_NAME}}]},
+        "scopeSpans": [{"scope": {"name": "TalentAI.tracing"}, "spans": otlp_spans}],
+    }]}
+
+
+_otlp_queue: "queue.Queue[bytes]" = queue.Queue(maxsize=1000)
+_otlp_lock = threading.Lock()
+_otlp_thread: Optional[threading.Thread] = None
+
+
+def _otlp_sender() -> None:
+    while True:
+        body = _otlp_queue.get()
+        request = urllib.request.Request(
+            settings.TRACING_OTLP_ENDPOINT, data=body, headers={"Content-Type": "application/json"}, method="POST",
+        )
+        try:
+            urllib.request.urlopen(request, timeout=settings.TRACING_OTLP_TIMEOUT_SECONDS).close()
+        except Exception as e:
+            logging.warning(f"[trace] OTLP export to {settings.TRACING_OTLP_ENDPOINT} failed: {e}")
+
+
+def _otlp_exporter(spans: List[Span]) -> None:
+    global _otlp_thread
+    if _otlp_thread is None:
+        with _otlp_lock:
+            if _otlp_thread is None:
+                _otlp_thread = threading.Thread(target=_otlp_sender, name="otlp-export", daemon=True)
+                _otlp_thread.start()
+    try:
+        _otlp_queue.put_nowait(json.dumps(otlp_payload(spans), default=str).encode())
+    except queue.Full:
+        pass  # collector is down or slow; drop rather than hold requests
+
+
+EXPORTERS: Dict[str, Callable[[List[Span]], None]] = {
+    "log": _log_exporter,
+    "otlp": _otlp_exporter,
+}
@@ -6,6 +6,8 @@ from drf_yasg import openapi
 from django.conf import settings
 from django.conf.urls.static import static
 
+from TalentAI.metrics import metrics_view
+
 # Create a custom namespace for your API URLs to avoid conflicts with Django's authentication URLs.
 api_urlpatterns = [
     path('Recruiter/', include('Recruiter.urls')),
@@ -28,6 +30,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include(api_urlpatterns)),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # Serve static files in DEBUG mode